@@ -1,30 +1,168 @@
-from typing import List, Optional
-from sqlmodel import Session, select, or_
+from datetime import datetime
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+from sqlmodel import select, insert
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.crud.user import bump_data_version
 from app.models import Category, TrackingItem
+from app.schemas import CategoryResponse
+from app.services.batchDelete import delete_in_batches
+from app.services.cache import TTLCache
+from app.services.eventHub import event_hub
+from app.services.settings import settings
 
+# Predefined categories by ID. They only change through migrations, so they
+# are loaded once (at startup) into a read-only map
+_predefined_categories: Optional[Mapping[int, CategoryResponse]] = None
 
-def get_categories_for_user(session: Session, user_id: int) -> List[Category]:
+# User ID -> the user's custom categories by ID; invalidated on every write
+_user_categories: TTLCache[int, Mapping[int, CategoryResponse]] = TTLCache(
+    settings.CATEGORY_CACHE_MAX_USERS, settings.CATEGORY_CACHE_TTL_SECONDS
+)
+
+
+def _to_map(categories: Iterable[Category]) -> Mapping[int, CategoryResponse]:
+    return MappingProxyType({
+        category.id: CategoryResponse.model_validate(category) for category in categories # type: ignore
+    })
+
+
+async def load_predefined_categories(session: AsyncSession) -> int:
+    """Load the predefined categories into the cache.
+
+    Args:
+        session: Database session
+
+    Returns:
+        Number of predefined categories loaded
+    """
+    global _predefined_categories
+    statement = select(Category).where(Category.is_predefined == True).order_by(Category.name)
+    _predefined_categories = _to_map((await session.exec(statement)).all())
+    return len(_predefined_categories)
+
+
+async def _get_predefined_categories(session: AsyncSession) -> Mapping[int, CategoryResponse]:
+    if _predefined_categories is None:
+        await load_predefined_categories(session)
+    return _predefined_categories # type: ignore
+
+
+async def _get_user_categories(session: AsyncSession, user_id: int) -> Mapping[int, CategoryResponse]:
+    categories = _user_categories.get(user_id)
+    if categories is None:
+        statement = select(Category).where(
+            Category.user_id == user_id,
+            Category.is_predefined == False
+        ).order_by(Category.name)
+        categories = _to_map((await session.exec(statement)).all())
+        _user_categories.set(user_id, categories)
+    return categories
+
+
+def invalidate_user_categories(user_id: int) -> None:
+    """Drop a user's custom categories from the cache.
+
+    Args:
+        user_id: User's ID
+    """
+    _user_categories.delete(user_id)
+
+
+async def get_categories_for_user(session: AsyncSession, user_id: int) -> List[CategoryResponse]:
     """Get all categories available to a user (predefined + user's custom).
 
+    Served from the category cache; the database is only queried when the
+    user's custom categories are not cached.
+
+    Args:
+        session: Database session
+        user_id: User's ID
+
+    Returns:
+        List of categories, predefined first, each group ordered by name
+    """
+    predefined = await _get_predefined_categories(session)
+    custom = await _get_user_categories(session, user_id)
+    return [*predefined.values(), *custom.values()]
+
+
+async def resolve_categories(session: AsyncSession, user_id: int, category_ids: Iterable[int]) -> Mapping[int, CategoryResponse]:
+    """Look up categories available to a user by ID, from the cache.
+
+    If an ID is missing (e.g. a category created on another replica), the
+    user's entry is reloaded once before giving up on it.
+
     Args:
         session: Database session
         user_id: User's ID
+        category_ids: Category IDs to look up
 
     Returns:
-        List of Category objects
+        Map of category ID to category for the IDs available to the user
     """
-    statement = select(Category).where(
-        or_(
-            Category.is_predefined == True,
-            Category.user_id == user_id
-        )
-    ).order_by(Category.is_predefined.desc(), Category.name) # type: ignore
+    predefined = await _get_predefined_categories(session)
+    custom = await _get_user_categories(session, user_id)
+    wanted = set(category_ids)
+    if any(category_id not in predefined and category_id not in custom for category_id in wanted):
+        invalidate_user_categories(user_id)
+        custom = await _get_user_categories(session, user_id)
 
-    categories = session.exec(statement).all()
-    return list(categories)
+    return {
+        category_id: predefined.get(category_id) or custom[category_id]
+        for category_id in wanted
+        if category_id in predefined or category_id in custom
+    }
 
 
-def get_category_by_id(session: Session, category_id: int) -> Optional[Category]:
+async def resolve_category_names(session: AsyncSession, user_id: int, names: Iterable[str]) -> Tuple[Dict[str, int], List[str]]:
+    """Map category names to categories available to a user, creating missing ones.
+
+    Names are matched case-insensitively, predefined categories first, from
+    the cache. Names still missing after one reload of the user's entry are
+    created as custom categories with a single bulk INSERT.
+
+    Args:
+        session: Database session
+        user_id: User's ID
+        names: Category names to resolve
+
+    Returns:
+        Tuple of (map of lowercased name to category ID, names of the
+        categories created)
+    """
+    names = set(names)
+
+    async def available() -> Dict[str, int]:
+        by_name: Dict[str, int] = {}
+        for category in await get_categories_for_user(session, user_id):
+            by_name.setdefault(category.name.lower(), category.id)
+        return by_name
+
+    by_name = await available()
+    if any(name.lower() not in by_name for name in names):
+        invalidate_user_categories(user_id)
+        by_name = await available()
+
+    missing = list({name.lower(): name for name in names if name.lower() not in by_name}.values())
+    if not missing:
+        return by_name, []
+
+    now = datetime.now()
+    statement = insert(Category).returning(Category.id, Category.name)
+    created = (await session.exec(statement, params=[ # type: ignore
+        {"name": name, "is_predefined": False, "user_id": user_id, "created_at": now} for name in missing
+    ])).all()
+    versions = await bump_data_version(session, [user_id])
+    await session.commit()
+    invalidate_user_categories(user_id)
+    event_hub.publish(user_id, versions[user_id])
+
+    by_name.update({name.lower(): category_id for category_id, name in created})
+    return by_name, missing
+
+
+async def get_category_by_id(session: AsyncSession, category_id: int) -> Optional[Category]:
     """Get category by ID.
 
     Args:
@@ -35,11 +173,11 @@ def get_category_by_id(session: Session, category_id: int) -> Optional[Category]
         Category object if found, None otherwise
     """
     statement = select(Category).where(Category.id == category_id)
-    category = session.exec(statement).first()
+    category = (await session.exec(statement)).first()
     return category
 
 
-def create_user_category(session: Session, user_id: int, name: str) -> Category:
+async def create_user_category(session: AsyncSession, user_id: int, name: str) -> Category:
     """Create a user-specific category.
 
     Args:
@@ -56,12 +194,15 @@ def create_user_category(session: Session, user_id: int, name: str) -> Category:
         user_id=user_id
     )
     session.add(category)
-    session.commit()
-    session.refresh(category)
+    versions = await bump_data_version(session, [user_id])
+    await session.commit()
+    await session.refresh(category)
+    invalidate_user_categories(user_id)
+    event_hub.publish(user_id, versions[user_id])
     return category
 
 
-def update_user_category(session: Session, category_id: int, user_id: int, name: str) -> Optional[Category]:
+async def update_user_category(session: AsyncSession, category_id: int, user_id: int, name: str) -> Optional[Category]:
     """Update a user's custom category.
 
     Args:
@@ -73,7 +214,7 @@ def update_user_category(session: Session, category_id: int, user_id: int, name:
     Returns:
         Updated Category object if successful, None if category not found or not owned by user
     """
-    category = get_category_by_id(session, category_id)
+    category = await get_category_by_id(session, category_id)
 
     if not category:
         return None
@@ -84,12 +225,15 @@ def update_user_category(session: Session, category_id: int, user_id: int, name:
 
     category.name = name
     session.add(category)
-    session.commit()
-    session.refresh(category)
+    versions = await bump_data_version(session, [user_id])
+    await session.commit()
+    await session.refresh(category)
+    invalidate_user_categories(user_id)
+    event_hub.publish(user_id, versions[user_id])
     return category
 
 
-def is_category_in_use(session: Session, category_id: int) -> bool:
+async def is_category_in_use(session: AsyncSession, category_id: int) -> bool:
     """Check if a category is being used by any tracking items.
 
     Args:
@@ -100,11 +244,11 @@ def is_category_in_use(session: Session, category_id: int) -> bool:
         True if category is in use, False otherwise
     """
     statement = select(TrackingItem).where(TrackingItem.category_id == category_id).limit(1)
-    item = session.exec(statement).first()
+    item = (await session.exec(statement)).first()
     return item is not None
 
 
-def delete_user_category(session: Session, category_id: int, user_id: int) -> tuple[bool, str | None]:
+async def delete_user_category(session: AsyncSession, category_id: int, user_id: int) -> tuple[bool, str | None]:
     """Delete a user's custom category.
 
     Args:
@@ -117,7 +261,7 @@ def delete_user_category(session: Session, category_id: int, user_id: int) -> tu
         - (True, None) if category was deleted
         - (False, error_message) if deletion failed
     """
-    category = get_category_by_id(session, category_id)
+    category = await get_category_by_id(session, category_id)
 
     if not category:
         return False, "Category not found"
@@ -130,15 +274,18 @@ def delete_user_category(session: Session, category_id: int, user_id: int) -> tu
         return False, "You don't have permission to delete this category"
 
     # Check if category is in use
-    if is_category_in_use(session, category_id):
+    if await is_category_in_use(session, category_id):
         return False, "Cannot delete category that is being used by tracking items. Please reassign or delete those items first."
 
-    session.delete(category)
-    session.commit()
+    await session.delete(category)
+    versions = await bump_data_version(session, [user_id])
+    await session.commit()
+    invalidate_user_categories(user_id)
+    event_hub.publish(user_id, versions[user_id])
     return True, None
 
 
-def delete_user_categories(session: Session, user_id: int) -> int:
+async def delete_user_categories(session: AsyncSession, user_id: int) -> int:
     """Delete all of a user's custom categories.
 
     Args:
@@ -148,15 +295,9 @@ def delete_user_categories(session: Session, user_id: int) -> int:
     Returns:
         Number of categories deleted
     """
-    statement = select(Category).where(
-        Category.user_id == user_id,
-        Category.is_predefined == False
+    result = await delete_in_batches(
+        session, Category, Category.user_id == user_id, Category.is_predefined == False,
+        batch_size=settings.CLEANUP_BATCH_SIZE
     )
-    categories = session.exec(statement).all()
-
-    count = len(categories)
-    for category in categories:
-        session.delete(category)
-
-    session.commit()
-    return count
+    invalidate_user_categories(user_id)
+    return result.deleted
@@ -0,0 +1,241 @@
+"""CRUD operations for the notification outbox."""
+
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Set
+from sqlalchemy import case
+from sqlmodel import select, update, insert, or_, and_
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.crud.user import data_version_bump_statement, current_data_version
+from app.crud.user_item_stats import item_done_shift_statements
+from app.internalModels import BatchDeleteResult, DueReminder, Message
+from app.models import NotificationOutbox, TrackingItem
+from app.services.batchDelete import delete_in_batches
+from app.services.database import dialect_name
+from app.services.eventHub import event_hub
+from app.services.settings import settings
+
+# Status transitions: pending -> sending -> sent, or back to pending / failed
+STATUS_PENDING = "pending"
+STATUS_SENDING = "sending"
+STATUS_SENT = "sent"
+STATUS_FAILED = "failed"
+
+# Maximum number of item ids per claiming statement (bounds the bind parameters)
+CLAIM_CHUNK_SIZE = 500
+
+# A message stuck in "sending" this long (worker crashed mid-send) is retried
+SENDING_TIMEOUT = timedelta(minutes=10)
+
+# Upper bound for the exponential retry delay
+MAX_RETRY_DELAY = timedelta(hours=6)
+
+
+async def enqueue_reminders(
+    session: AsyncSession,
+    groups: List[List[DueReminder]],
+    render: Callable[[List[DueReminder]], Message],
+    chunk_size: int = CLAIM_CHUNK_SIZE
+) -> int:
+    """Queue reminder messages and mark their items done in one transaction.
+
+    Either both the outbox rows and the item updates are committed or neither
+    is, so a crash can never leave items marked done without a queued message.
+    Items are claimed with statements of at most `chunk_size` ids each; the
+    caller bounds the transaction by passing a limited number of items.
+
+    Args:
+        session: Database session
+        groups: Due items, one message per group
+        render: Builds the message for the claimed items of a group
+        chunk_size: Maximum number of item ids per claiming statement
+
+    Returns:
+        Number of messages queued
+    """
+    if not groups:
+        return 0
+
+    # Claim the items first; items already done (e.g. by an overlapping run on
+    # another replica) drop out, so their reminders are not sent twice
+    item_ids = [reminder.id for group in groups for reminder in group]
+    versions: Dict[int, int] = {}
+    claimed_ids: Set[int] = set()
+    for start in range(0, len(item_ids), chunk_size):
+        claimable = [TrackingItem.id.in_(item_ids[start:start + chunk_size]), TrackingItem.is_done == False] # type: ignore
+        # Their upcoming lists change; stamp the items with the owners' new version
+        versions.update((await session.exec(data_version_bump_statement(TrackingItem, claimable))).all()) # type: ignore
+        for shift in item_done_shift_statements(session, claimable):
+            await session.exec(shift) # type: ignore
+        result = await session.exec(update(TrackingItem).where(*claimable).values( # type: ignore
+            is_done=True,
+            updated_at=datetime.now(),
+            sync_version=current_data_version(TrackingItem)
+        ).returning(TrackingItem.id))
+        claimed_ids.update(result.scalars().all())
+
+    # Messages are rendered for the claimed items only
+    messages: List[Message] = []
+    for group in groups:
+        claimed = [reminder for reminder in group if reminder.id in claimed_ids]
+        if claimed:
+            messages.append(render(claimed))
+    if not messages:
+        await session.commit()
+        event_hub.publish_many(versions)
+        return 0
+
+    now = datetime.now()
+    await session.exec(insert(NotificationOutbox), params=[ # type: ignore
+        {
+            "title": message.title,
+            "to_email": message.to_email,
+            "subject": message.subject,
+            "content": message.content,
+            "status": STATUS_PENDING,
+            "attempts": 0,
+            "next_attempt_at": now,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for message in messages
+    ])
+
+    await session.commit()
+    event_hub.publish_many(versions)
+    return len(messages)
+
+
+async def claim_due_messages(session: AsyncSession, limit: int, max_attempts: int = settings.OUTBOX_MAX_ATTEMPTS) -> List[NotificationOutbox]:
+    """Claim up to `limit` messages that are due for delivery.
+
+    Claiming moves a message to "sending" with a conditional UPDATE, so a
+    message is only ever handed to one worker at a time, across replicas too.
+    On PostgreSQL candidates are locked with FOR UPDATE SKIP LOCKED so that
+    concurrent workers pick disjoint batches; on SQLite the conditional UPDATE
+    alone decides the winner.
+
+    A message reclaimed after SENDING_TIMEOUT counts the interrupted send
+    as an attempt, and is moved to "failed" instead once that reaches
+    max_attempts, so a message that keeps crashing the worker is given up on.
+
+    Args:
+        session: Database session
+        limit: Maximum number of messages to claim
+        max_attempts: Attempts after which a stale message is given up on
+
+    Returns:
+        List of claimed NotificationOutbox objects
+    """
+    now = datetime.now()
+    stale = and_(NotificationOutbox.status == STATUS_SENDING, NotificationOutbox.updated_at < now - SENDING_TIMEOUT) # type: ignore
+    claimable = or_(
+        and_(NotificationOutbox.status == STATUS_PENDING, NotificationOutbox.next_attempt_at <= now), # type: ignore
+        stale
+    )
+
+    candidates = select(NotificationOutbox.id).where(claimable).order_by(
+        NotificationOutbox.next_attempt_at # type: ignore
+    ).limit(limit)
+    if dialect_name(session) == "postgresql":
+        # Replicas skip rows another replica is claiming instead of waiting on them
+        candidates = candidates.with_for_update(skip_locked=True)
+    candidate_ids = list((await session.exec(candidates)).all())
+    if not candidate_ids:
+        return []
+
+    # SET expressions all see the row as it was before the UPDATE
+    statement = update(NotificationOutbox).where(
+        NotificationOutbox.id.in_(candidate_ids), # type: ignore
+        claimable
+    ).values(
+        status=case(
+            (and_(stale, NotificationOutbox.attempts + 1 >= max_attempts), STATUS_FAILED),
+            else_=STATUS_SENDING
+        ),
+        attempts=case((stale, NotificationOutbox.attempts + 1), else_=NotificationOutbox.attempts),
+        last_error=case((stale, "Delivery interrupted (sending timed out)"), else_=NotificationOutbox.last_error),
+        updated_at=now
+    ).returning(NotificationOutbox)
+    messages = list((await session.exec(statement)).scalars().all()) # type: ignore
+    await session.commit()
+    return [message for message in messages if message.status == STATUS_SENDING]
+
+
+async def mark_sent(session: AsyncSession, message_ids: List[int]) -> int:
+    """Mark claimed messages as sent.
+
+    Args:
+        session: Database session
+        message_ids: Outbox message IDs
+
+    Returns:
+        Number of messages updated
+    """
+    if not message_ids:
+        return 0
+
+    statement = update(NotificationOutbox).where(
+        NotificationOutbox.id.in_(message_ids), # type: ignore
+        NotificationOutbox.status == STATUS_SENDING
+    ).values(status=STATUS_SENT, updated_at=datetime.now())
+    result = await session.exec(statement) # type: ignore
+    await session.commit()
+    return result.rowcount
+
+
+async def record_failure(session: AsyncSession, message: NotificationOutbox, error: str | None, max_attempts: int, retry_base_seconds: int) -> str:
+    """Record a failed delivery attempt and schedule a retry with exponential backoff.
+
+    Args:
+        session: Database session
+        message: Claimed outbox message
+        error: Error description
+        max_attempts: Attempts after which the message is given up on
+        retry_base_seconds: Delay before the first retry, doubled on each attempt
+
+    Returns:
+        New status of the message (pending or failed)
+    """
+    attempts = message.attempts + 1
+    delay = min(timedelta(seconds=retry_base_seconds * 2 ** (attempts - 1)), MAX_RETRY_DELAY)
+    new_status = STATUS_FAILED if attempts >= max_attempts else STATUS_PENDING
+    now = datetime.now()
+
+    statement = update(NotificationOutbox).where(
+        NotificationOutbox.id == message.id,
+        NotificationOutbox.status == STATUS_SENDING
+    ).values(
+        status=new_status,
+        attempts=attempts,
+        last_error=(error or "Unknown error")[:1000],
+        next_attempt_at=now + delay,
+        updated_at=now
+    )
+    await session.exec(statement) # type: ignore
+    await session.commit()
+    return new_status
+
+
+async def purge_sent_messages(
+    session: AsyncSession,
+    before: datetime,
+    batch_size: int = settings.CLEANUP_BATCH_SIZE,
+    time_budget_seconds: Optional[float] = settings.CLEANUP_TIME_BUDGET_SECONDS
+) -> BatchDeleteResult:
+    """Delete delivered messages last updated before a cutoff, in committed batches.
+
+    Args:
+        session: Database session
+        before: Messages sent before this time are deleted
+        batch_size: Maximum number of messages deleted per statement
+        time_budget_seconds: Stop after this long, leaving the rest for the next run
+
+    Returns:
+        BatchDeleteResult of the purge
+    """
+    return await delete_in_batches(
+        session, NotificationOutbox,
+        NotificationOutbox.status == STATUS_SENT,
+        NotificationOutbox.updated_at < before, # type: ignore
+        batch_size=batch_size, time_budget_seconds=time_budget_seconds
+    )
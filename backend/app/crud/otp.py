@@ -1,11 +1,15 @@
 from datetime import datetime, timedelta
-from sqlmodel import Session, select
+from typing import Optional
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.internalModels import BatchDeleteResult
 from app.models import OTP
+from app.services.batchDelete import delete_in_batches
 from app.services.otpUtil import generate_otp
 from app.services.settings import settings
 
 
-def create_otp(session: Session, email: str) -> OTP:
+async def create_otp(session: AsyncSession, email: str) -> OTP:
     """Create a new OTP for the given email.
 
     Deletes any existing OTPs for this email before creating a new one.
@@ -19,9 +23,9 @@ def create_otp(session: Session, email: str) -> OTP:
     """
     # Delete any existing OTPs for this email
     statement = select(OTP).where(OTP.email == email)
-    existing_otps = session.exec(statement).all()
+    existing_otps = (await session.exec(statement)).all()
     for otp in existing_otps:
-        session.delete(otp)
+        await session.delete(otp)
 
     # Generate new OTP
     otp_code = generate_otp()
@@ -34,13 +38,13 @@ def create_otp(session: Session, email: str) -> OTP:
         is_used=False
     )
     session.add(otp)
-    session.commit()
-    session.refresh(otp)
+    await session.commit()
+    await session.refresh(otp)
 
     return otp
 
 
-def verify_otp(session: Session, email: str, otp_code: str) -> bool:
+async def verify_otp(session: AsyncSession, email: str, otp_code: str) -> bool:
     """Verify OTP for the given email.
 
     Security: Deletes OTP immediately after successful verification for better
@@ -60,40 +64,41 @@ def verify_otp(session: Session, email: str, otp_code: str) -> bool:
         OTP.is_used == False,
         OTP.expires_at > datetime.now()
     )
-    otp = session.exec(statement).first()
+    otp = (await session.exec(statement)).first()
 
     if not otp:
         return False
 
     # Delete immediately after successful verification
     # Benefits: Better security, privacy compliance, data minimization
-    session.delete(otp)
-    session.commit()
+    await session.delete(otp)
+    await session.commit()
 
     return True
 
 
-def cleanup_expired_otps(session: Session) -> int:
-    """Delete expired OTPs.
+async def cleanup_expired_otps(
+    session: AsyncSession,
+    batch_size: int = settings.CLEANUP_BATCH_SIZE,
+    time_budget_seconds: Optional[float] = settings.CLEANUP_TIME_BUDGET_SECONDS
+) -> BatchDeleteResult:
+    """Delete expired OTPs in committed batches.
 
     Args:
         session: Database session
+        batch_size: Maximum number of OTPs deleted per statement
+        time_budget_seconds: Stop after this long, leaving the rest for the next run
 
     Returns:
-        Number of OTPs deleted
+        BatchDeleteResult of the cleanup
     """
-    statement = select(OTP).where(OTP.expires_at < datetime.now())
-    expired_otps = session.exec(statement).all()
-
-    count = len(expired_otps)
-    for otp in expired_otps:
-        session.delete(otp)
-
-    session.commit()
-    return count
+    return await delete_in_batches(
+        session, OTP, OTP.expires_at < datetime.now(), # type: ignore
+        batch_size=batch_size, time_budget_seconds=time_budget_seconds
+    )
 
 
-def delete_user_otps(session: Session, email: str) -> int:
+async def delete_user_otps(session: AsyncSession, email: str) -> int:
     """Delete all OTPs for a user.
 
     Args:
@@ -103,12 +108,5 @@ def delete_user_otps(session: Session, email: str) -> int:
     Returns:
         Number of OTPs deleted
     """
-    statement = select(OTP).where(OTP.email == email)
-    otps = session.exec(statement).all()
-
-    count = len(otps)
-    for otp in otps:
-        session.delete(otp)
-
-    session.commit()
-    return count
+    result = await delete_in_batches(session, OTP, OTP.email == email, batch_size=settings.CLEANUP_BATCH_SIZE)
+    return result.deleted
@@ -1,13 +1,49 @@
-from datetime import date
-from typing import List, Optional, Dict, Any
-from sqlmodel import Session, select
-from app.models import TrackingItem, Category
-from app.schemas import TrackingItemCreate, TrackingItemUpdate
+import re
+from datetime import date, datetime
+from typing import AsyncIterator, List, Optional, Dict, Any, Sequence
+from sqlalchemy import Boolean, Date, DateTime, Integer, column, literal, literal_column, table
+from sqlmodel import select, insert, update, delete, or_, and_, func
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.crud.tracking_item_tombstone import tombstone_statement, get_deleted_item_ids
+from app.crud.user import bump_data_version, data_version_bump_statement, get_sync_state
+from app.crud.user_item_stats import add_item_counts, get_done_count, item_count_deltas, item_count_shift_statement
+from app.internalModels import BatchDeleteResult, DueReminder, ItemBatchOutcome
+from app.models import TrackingItem, Category, User
+from app.schemas import TrackingItemCreate, TrackingItemUpdate, ItemBatchOperation
+from app.services.batchDelete import delete_in_batches
+from app.services.cursorUtil import encode_cursor, decode_cursor, encode_snapshot_cursor, decode_snapshot_cursor
+from app.services.database import dialect_name
+from app.services.eventHub import event_hub
+from app.services.settings import settings
 
 # Page size validation constants
 ALLOWED_PAGE_SIZES = [10, 20, 50]
 DEFAULT_PAGE_SIZE = 10
 
+# Items per page of a full sync snapshot (GET /items/changes reset)
+SYNC_SNAPSHOT_PAGE_SIZE = 500
+
+# Rows fetched per query when streaming the items due today
+DUE_REMINDER_CHUNK_SIZE = 1000
+
+# Rows buffered per fetch from the server-side cursor of an export
+EXPORT_CHUNK_SIZE = 500
+
+# Words of a search query used for matching; the rest is ignored
+MAX_SEARCH_TERMS = 8
+
+# Full-text index of title and description, maintained by the database (migration 18102026h):
+# an FTS5 table on SQLite, the generated tracking_item.search_vector column on PostgreSQL
+_tracking_item_fts = table("tracking_item_fts", column("rowid", Integer), column("tracking_item_fts"))
+
+# Reasons apply_item_batch refuses an update or delete
+BATCH_NOT_FOUND = "not_found"
+BATCH_FORBIDDEN = "forbidden"
+BATCH_DONE = "done"
+
+# Columns written by a batch update (id selects the row)
+BATCH_UPDATED_COLUMNS = ("id", "title", "category_id", "reminder_date", "description", "updated_at", "sync_version")
+
 
 def validate_page_size(limit: int) -> int:
     """Validate and sanitize page size to prevent malicious queries.
@@ -23,112 +59,335 @@ def validate_page_size(limit: int) -> int:
     return limit
 
 
-def get_upcoming_items(session: Session, user_id: int, page: int = 1, limit: int = 10) -> Dict[str, Any]:
-    """Get upcoming tracking items (is_done=False, reminder_date >= today).
+def _upcoming_conditions(user_id: int) -> List[Any]:
+    """Filter for a user's upcoming items (is_done=False, reminder_date >= today)."""
+    return [
+        TrackingItem.user_id == user_id,
+        TrackingItem.is_done == False,
+        TrackingItem.reminder_date >= date.today()
+    ]
+
+
+def _past_conditions(user_id: int) -> List[Any]:
+    """Filter for a user's past items (is_done=True)."""
+    return [
+        TrackingItem.user_id == user_id,
+        TrackingItem.is_done == True
+    ]
 
-    Items are ordered by reminder_date ascending (earliest first).
-    Page size is validated against ALLOWED_PAGE_SIZES.
+
+async def _count_items(session: AsyncSession, conditions: List[Any]) -> int:
+    """Count tracking items matching conditions with a SQL COUNT(*).
 
     Args:
         session: Database session
-        user_id: User's ID
-        page: Page number (1-indexed)
-        limit: Items per page
+        conditions: WHERE clauses to apply
 
     Returns:
-        Dictionary with items, total, page, pages, and page_size
+        Number of matching items
     """
+    statement = select(func.count()).select_from(TrackingItem).where(*conditions)
+    return (await session.exec(statement)).one()
+
+
+async def _paginate_by_reminder_date(
+    session: AsyncSession,
+    conditions: List[Any],
+    page: int,
+    limit: int,
+    cursor: Optional[str]
+) -> Dict[str, Any]:
+    """Page through the items matching conditions, ordered by (reminder_date, id)."""
     # Validate limit to prevent malicious large queries
     limit = validate_page_size(limit)
 
-    skip = (page - 1) * limit
-
-    # Query for upcoming items
-    statement = select(TrackingItem).where(
-        TrackingItem.user_id == user_id,
-        TrackingItem.is_done == False,
-        TrackingItem.reminder_date >= date.today()
-    ).order_by(TrackingItem.reminder_date.asc()) # type: ignore
-
-    # Get total count
-    #! instead of running the complete query, have to find a way to execute count by SQL
-    total_statement = select(TrackingItem).where(
-        TrackingItem.user_id == user_id,
-        TrackingItem.is_done == False,
-        TrackingItem.reminder_date >= date.today()
+    # Categories are resolved from the category cache
+    statement = select(TrackingItem).where(*conditions).order_by(
+        TrackingItem.reminder_date.asc(), TrackingItem.id.asc() # type: ignore
     )
-    total = len(session.exec(total_statement).all())
 
-    # Get paginated items
-    items = session.exec(statement.offset(skip).limit(limit)).all()
+    if cursor:
+        last_date, last_id = decode_cursor(cursor, date)
+        statement = statement.where(
+            or_(
+                TrackingItem.reminder_date > last_date,
+                and_(TrackingItem.reminder_date == last_date, TrackingItem.id > last_id) # type: ignore
+            )
+        )
+    else:
+        statement = statement.offset((page - 1) * limit)
 
-    # Load category relationship for each item
-    for item in items:
-        if item.category_id:
-            category_statement = select(Category).where(Category.id == item.category_id)
-            item.category = session.exec(category_statement).first()
+    total = await _count_items(session, conditions)
+
+    # Fetch one extra row to find out whether another page follows
+    items = list((await session.exec(statement.limit(limit + 1))).all())
+    has_more = len(items) > limit
+    items = items[:limit]
 
     return {
-        "items": list(items),
+        "items": items,
         "total": total,
         "page": page,
         "pages": (total + limit - 1) // limit if total > 0 else 1,
-        "page_size": limit
+        "page_size": limit,
+        "next_cursor": encode_cursor(items[-1].reminder_date, items[-1].id) if has_more else None # type: ignore
     }
 
 
-def get_past_items(session: Session, user_id: int, page: int = 1, limit: int = 10) -> Dict[str, Any]:
+async def get_upcoming_items(session: AsyncSession, user_id: int, page: int = 1, limit: int = 10, cursor: Optional[str] = None) -> Dict[str, Any]:
+    """Get upcoming tracking items (is_done=False, reminder_date >= today).
+
+    Items are ordered by reminder_date ascending (earliest first), ties broken by id.
+    Page size is validated against ALLOWED_PAGE_SIZES.
+
+    When a cursor is given, the page starts right after the item the cursor points
+    to (keyset pagination) and page is ignored for positioning.
+
+    Args:
+        session: Database session
+        user_id: User's ID
+        page: Page number (1-indexed)
+        limit: Items per page
+        cursor: Opaque cursor returned as next_cursor by a previous call
+
+    Returns:
+        Dictionary with items, total, page, pages, page_size and next_cursor
+    """
+    return await _paginate_by_reminder_date(session, _upcoming_conditions(user_id), page, limit, cursor)
+
+
+async def get_past_items(session: AsyncSession, user_id: int, page: int = 1, limit: int = 10, cursor: Optional[str] = None) -> Dict[str, Any]:
     """Get past tracking items (is_done=True).
 
-    Items are ordered by created_at descending (latest first).
+    Items are ordered by created_at descending (latest first), ties broken by id.
     Page size is validated against ALLOWED_PAGE_SIZES.
 
+    When a cursor is given, the page starts right after the item the cursor points
+    to (keyset pagination) and page is ignored for positioning.
+
     Args:
         session: Database session
         user_id: User's ID
         page: Page number (1-indexed)
         limit: Items per page
+        cursor: Opaque cursor returned as next_cursor by a previous call
 
     Returns:
-        Dictionary with items, total, page, pages, and page_size
+        Dictionary with items, total, page, pages, page_size and next_cursor
     """
     # Validate limit to prevent malicious large queries
     limit = validate_page_size(limit)
 
-    skip = (page - 1) * limit
-
-    # Query for past items
-    statement = select(TrackingItem).where(
-        TrackingItem.user_id == user_id,
-        TrackingItem.is_done == True
-    ).order_by(TrackingItem.created_at.desc()) # type: ignore
+    conditions = _past_conditions(user_id)
 
-    # Get total count
-    total_statement = select(TrackingItem).where(
-        TrackingItem.user_id == user_id,
-        TrackingItem.is_done == True
+    # Query for past items; categories are resolved from the category cache
+    statement = select(TrackingItem).where(*conditions).order_by(
+        TrackingItem.created_at.desc(), TrackingItem.id.desc() # type: ignore
     )
-    total = len(session.exec(total_statement).all())
 
-    # Get paginated items
-    items = session.exec(statement.offset(skip).limit(limit)).all()
-
-    # Load category relationship for each item
-    for item in items:
-        if item.category_id:
-            category_statement = select(Category).where(Category.id == item.category_id)
-            item.category = session.exec(category_statement).first()
+    if cursor:
+        last_created_at, last_id = decode_cursor(cursor, datetime)
+        statement = statement.where(
+            or_(
+                TrackingItem.created_at < last_created_at,
+                and_(TrackingItem.created_at == last_created_at, TrackingItem.id < last_id) # type: ignore
+            )
+        )
+    else:
+        statement = statement.offset((page - 1) * limit)
+
+    # Precomputed, unlike the upcoming total which depends on today's date
+    total = await get_done_count(session, user_id)
+
+    # Fetch one extra row to find out whether another page follows
+    items = list((await session.exec(statement.limit(limit + 1))).all())
+    has_more = len(items) > limit
+    items = items[:limit]
 
     return {
-        "items": list(items),
+        "items": items,
         "total": total,
         "page": page,
         "pages": (total + limit - 1) // limit if total > 0 else 1,
-        "page_size": limit
+        "page_size": limit,
+        "next_cursor": encode_cursor(items[-1].created_at, items[-1].id) if has_more else None # type: ignore
+    }
+
+
+def _text_match(session: AsyncSession, query: str) -> Optional[Any]:
+    """Condition matching items whose title or description contain every word of query as a prefix.
+
+    Only word characters are kept, so no user input reaches the full-text
+    query syntax. Returns None if the query has no words.
+    """
+    terms = re.findall(r"\w+", query.lower())[:MAX_SEARCH_TERMS]
+    if not terms:
+        return None
+    if dialect_name(session) == "postgresql":
+        tsquery = " & ".join(f"{term}:*" for term in terms)
+        return literal_column("tracking_item.search_vector").op("@@")(func.to_tsquery("simple", tsquery))
+    matching = select(_tracking_item_fts.c.rowid).where(
+        _tracking_item_fts.c.tracking_item_fts.op("MATCH")(" ".join(f'"{term}"*' for term in terms))
+    )
+    return TrackingItem.id.in_(matching) # type: ignore
+
+
+async def search_items(
+    session: AsyncSession,
+    user_id: int,
+    query: Optional[str] = None,
+    category_id: Optional[int] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    is_done: Optional[bool] = None,
+    page: int = 1,
+    limit: int = 10,
+    cursor: Optional[str] = None
+) -> Dict[str, Any]:
+    """Search a user's items, with the same ordering and pagination as the upcoming list.
+
+    Every filter is optional. Text matching goes through the full-text index
+    (FTS5 on SQLite, tsvector on PostgreSQL), never a LIKE scan.
+
+    Args:
+        session: Database session
+        user_id: User's ID
+        query: Words that must all appear (as word prefixes) in title or description
+        category_id: Only items of this category
+        date_from: Only items with reminder_date on or after this date
+        date_to: Only items with reminder_date on or before this date
+        is_done: Only done (True) or pending (False) items
+        page: Page number (1-indexed)
+        limit: Items per page
+        cursor: Opaque cursor returned as next_cursor by a previous call
+
+    Returns:
+        Dictionary with items, total, page, pages, page_size and next_cursor
+    """
+    conditions: List[Any] = [TrackingItem.user_id == user_id]
+    if is_done is not None:
+        conditions.append(TrackingItem.is_done == is_done)
+    if category_id is not None:
+        conditions.append(TrackingItem.category_id == category_id)
+    if date_from is not None:
+        conditions.append(TrackingItem.reminder_date >= date_from)
+    if date_to is not None:
+        conditions.append(TrackingItem.reminder_date <= date_to)
+    if query:
+        text_match = _text_match(session, query)
+        if text_match is not None:
+            conditions.append(text_match)
+
+    return await _paginate_by_reminder_date(session, conditions, page, limit, cursor)
+
+
+async def get_calendar_items(session: AsyncSession, user_id: int) -> List[Any]:
+    """Get all of a user's upcoming items with their category names, for the calendar feed.
+
+    Args:
+        session: Database session
+        user_id: User's ID
+
+    Returns:
+        Rows (id, title, category_name, reminder_date, description, updated_at)
+        ordered by reminder_date
+    """
+    statement = select(
+        TrackingItem.id,
+        TrackingItem.title,
+        Category.name.label("category_name"), # type: ignore
+        TrackingItem.reminder_date,
+        TrackingItem.description,
+        TrackingItem.updated_at
+    ).join(
+        Category, Category.id == TrackingItem.category_id # type: ignore
+    ).where(
+        *_upcoming_conditions(user_id)
+    ).order_by(TrackingItem.reminder_date, TrackingItem.id)
+    return list((await session.exec(statement)).all())
+
+
+async def get_changes(
+    session: AsyncSession,
+    user_id: int,
+    since: Optional[int],
+    cursor: Optional[str] = None,
+    page_size: int = SYNC_SNAPSHOT_PAGE_SIZE
+) -> Optional[Dict[str, Any]]:
+    """Get a user's items changed and removed after a sync token.
+
+    The sync token is the user's data version. Every item write stamps the
+    item with the new version (sync_version) and every removal records a
+    tombstone with it, so both lookups are index range scans on
+    (user_id, sync_version) whose cost depends on the number of changes only.
+
+    A full snapshot of the user's items is returned instead (reset) when no
+    token is given, or when the token cannot be served incrementally because
+    tombstones after it have been purged. The snapshot is paged with a
+    keyset cursor on (sync_version, id) and covers the items as of the token
+    current on its first page; the token is only returned with the last page.
+    Items changed while paging are left to the next incremental call.
+
+    Args:
+        session: Database session
+        user_id: User's ID
+        since: Token returned by a previous call, None for a full snapshot
+        cursor: Cursor of the next snapshot page (since is then ignored)
+        page_size: Maximum number of items per snapshot page
+
+    Returns:
+        Dictionary with token (None before the last snapshot page), reset,
+        items, deleted (item IDs) and next_cursor, None if the user does not exist
+
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    state = await get_sync_state(session, user_id)
+    if state is None:
+        return None
+    token, sync_floor = state
+
+    if cursor is None and since is not None and sync_floor <= since <= token:
+        statement = select(TrackingItem).where(
+            TrackingItem.user_id == user_id,
+            TrackingItem.sync_version > since
+        ).order_by(TrackingItem.sync_version, TrackingItem.id) # type: ignore
+        return {
+            "token": token,
+            "reset": False,
+            "items": list((await session.exec(statement)).all()),
+            "deleted": await get_deleted_item_ids(session, user_id, since),
+            "next_cursor": None
+        }
+
+    statement = select(TrackingItem).where(TrackingItem.user_id == user_id)
+    if cursor:
+        token, last_version, last_id = decode_snapshot_cursor(cursor)
+        statement = statement.where(
+            or_(
+                TrackingItem.sync_version > last_version,
+                and_(TrackingItem.sync_version == last_version, TrackingItem.id > last_id) # type: ignore
+            )
+        )
+    statement = statement.where(TrackingItem.sync_version <= token).order_by(
+        TrackingItem.sync_version, TrackingItem.id # type: ignore
+    ).limit(page_size + 1)
+
+    # Fetch one extra row to find out whether another page follows
+    items = list((await session.exec(statement)).all())
+    has_more = len(items) > page_size
+    items = items[:page_size]
+
+    return {
+        "token": None if has_more else token,
+        "reset": True,
+        "items": items,
+        "deleted": [],
+        "next_cursor": encode_snapshot_cursor(token, items[-1].sync_version, items[-1].id) if has_more else None # type: ignore
     }
 
 
-def get_item_by_id(session: Session, item_id: int) -> Optional[TrackingItem]:
+async def get_item_by_id(session: AsyncSession, item_id: int) -> Optional[TrackingItem]:
     """Get tracking item by ID.
 
     Args:
@@ -139,19 +398,30 @@ def get_item_by_id(session: Session, item_id: int) -> Optional[TrackingItem]:
         TrackingItem object if found, None otherwise
     """
     statement = select(TrackingItem).where(TrackingItem.id == item_id)
-    item = session.exec(statement).first()
+    item = (await session.exec(statement)).first()
+    return item
 
-    # Load category relationship
-    if item and item.category_id:
-        category_statement = select(Category).where(Category.id == item.category_id)
-        item.category = session.exec(category_statement).first()
 
-    return item
+def _new_item_row(user_id: int, item_data: TrackingItemCreate, version: int, now: datetime, is_done: bool = False) -> Dict[str, Any]:
+    """Column values of a new item, for bulk INSERT statements."""
+    return {
+        "user_id": user_id,
+        "title": item_data.title,
+        "category_id": item_data.category_id,
+        "reminder_date": item_data.reminder_date,
+        "description": item_data.description,
+        "is_done": is_done,
+        "created_at": now,
+        "updated_at": now,
+        "sync_version": version,
+    }
 
 
-def create_item(session: Session, user_id: int, item_data: TrackingItemCreate) -> TrackingItem:
+async def create_item(session: AsyncSession, user_id: int, item_data: TrackingItemCreate) -> TrackingItem:
     """Create a new tracking item.
 
+    The item comes back from INSERT ... RETURNING, so no refresh is needed.
+
     Args:
         session: Database session
         user_id: User's ID
@@ -160,29 +430,24 @@ def create_item(session: Session, user_id: int, item_data: TrackingItemCreate) -
     Returns:
         Created TrackingItem object
     """
-    item = TrackingItem(
-        user_id=user_id,
-        title=item_data.title,
-        category_id=item_data.category_id,
-        reminder_date=item_data.reminder_date,
-        description=item_data.description,
-        is_done=False
-    )
-    session.add(item)
-    session.commit()
-    session.refresh(item)
-
-    # Load category relationship
-    if item.category_id:
-        category_statement = select(Category).where(Category.id == item.category_id)
-        item.category = session.exec(category_statement).first()
+    versions = await bump_data_version(session, [user_id])
+    now = datetime.now()
+    statement = insert(TrackingItem).values(**_new_item_row(user_id, item_data, versions[user_id], now)).returning(TrackingItem)
+    item = (await session.exec(statement)).scalars().one() # type: ignore
+    await add_item_counts(session, item_count_deltas([item]))
+    await session.commit()
+    event_hub.publish(user_id, versions[user_id])
 
     return item
 
 
-def update_item(session: Session, item_id: int, user_id: int, item_data: TrackingItemUpdate) -> Optional[TrackingItem]:
+async def update_item(session: AsyncSession, item_id: int, user_id: int, item_data: TrackingItemUpdate) -> Optional[TrackingItem]:
     """Update a tracking item (only if is_done=False).
 
+    Ownership and state are checked by the WHERE clause of the writes
+    themselves; nothing is read up front. The caller can tell why an update
+    was refused with get_item_by_id.
+
     Args:
         session: Database session
         item_id: Tracking item ID
@@ -192,38 +457,37 @@ def update_item(session: Session, item_id: int, user_id: int, item_data: Trackin
     Returns:
         Updated TrackingItem object if successful, None otherwise
     """
-    item = get_item_by_id(session, item_id)
-
-    if not item:
+    editable = [TrackingItem.id == item_id, TrackingItem.user_id == user_id, TrackingItem.is_done == False]
+    # Only bumps the version if the item is editable
+    versions = dict((await session.exec(data_version_bump_statement(TrackingItem, editable))).all()) # type: ignore
+    if user_id not in versions:
         return None
 
-    # Check ownership and ensure item is not done
-    if item.user_id != user_id or item.is_done:
+    changes = item_data.model_dump(exclude_none=True)
+    # The item moves to another counter if its category or month changes
+    recount = "category_id" in changes or "reminder_date" in changes
+    if recount:
+        await session.exec(item_count_shift_statement(session, editable, -1)) # type: ignore
+    statement = update(TrackingItem).where(*editable).values( # type: ignore
+        **changes,
+        updated_at=datetime.now(),
+        sync_version=versions[user_id]
+    ).returning(TrackingItem)
+    item = (await session.exec(statement)).scalars().first() # type: ignore
+    if item is None:
+        # Completed by a concurrent writer in between
+        await session.rollback()
         return None
 
-    # Update fields
-    if item_data.title is not None:
-        item.title = item_data.title
-    if item_data.category_id is not None:
-        item.category_id = item_data.category_id
-    if item_data.reminder_date is not None:
-        item.reminder_date = item_data.reminder_date
-    if item_data.description is not None:
-        item.description = item_data.description
-
-    session.add(item)
-    session.commit()
-    session.refresh(item)
-
-    # Load category relationship
-    if item.category_id:
-        category_statement = select(Category).where(Category.id == item.category_id)
-        item.category = session.exec(category_statement).first()
+    if recount:
+        await add_item_counts(session, item_count_deltas([item]))
+    await session.commit()
+    event_hub.publish(user_id, versions[user_id])
 
     return item
 
 
-def delete_item(session: Session, item_id: int, user_id: int) -> bool:
+async def delete_item(session: AsyncSession, item_id: int, user_id: int) -> bool:
     """Delete a tracking item (only if is_done=False).
 
     Args:
@@ -234,24 +498,28 @@ def delete_item(session: Session, item_id: int, user_id: int) -> bool:
     Returns:
         True if item was deleted, False otherwise
     """
-    item = get_item_by_id(session, item_id)
-
-    if not item:
+    deletable = [TrackingItem.id == item_id, TrackingItem.user_id == user_id, TrackingItem.is_done == False]
+    versions = dict((await session.exec(data_version_bump_statement(TrackingItem, deletable))).all()) # type: ignore
+    if user_id not in versions:
         return False
 
-    # Check ownership and ensure item is not done
-    if item.user_id != user_id or item.is_done:
+    await session.exec(tombstone_statement(deletable, datetime.now())) # type: ignore
+    await session.exec(item_count_shift_statement(session, deletable, -1)) # type: ignore
+    result = await session.exec(delete(TrackingItem).where(*deletable)) # type: ignore
+    if not result.rowcount:
+        await session.rollback()
         return False
 
-    session.delete(item)
-    session.commit()
+    await session.commit()
+    event_hub.publish(user_id, versions[user_id])
     return True
 
 
-def recreate_item(session: Session, item_id: int, user_id: int, new_date: date) -> Optional[TrackingItem]:
+async def recreate_item(session: AsyncSession, item_id: int, user_id: int, new_date: date) -> Optional[TrackingItem]:
     """Recreate a tracking item with a new date.
 
-    Copies all fields except reminder_date and resets is_done to False.
+    Copies all fields except reminder_date and resets is_done to False, with
+    a single INSERT ... SELECT from the original item.
 
     Args:
         session: Database session
@@ -262,101 +530,286 @@ def recreate_item(session: Session, item_id: int, user_id: int, new_date: date)
     Returns:
         New TrackingItem object if successful, None otherwise
     """
-    original_item = get_item_by_id(session, item_id)
-
-    if not original_item or original_item.user_id != user_id:
+    original = [TrackingItem.id == item_id, TrackingItem.user_id == user_id]
+    versions = dict((await session.exec(data_version_bump_statement(TrackingItem, original))).all()) # type: ignore
+    if user_id not in versions:
         return None
 
-    # Create new item with copied fields
-    new_item = TrackingItem(
-        user_id=user_id,
-        title=original_item.title,
-        category_id=original_item.category_id,
-        reminder_date=new_date,
-        description=original_item.description,
-        is_done=False
-    )
-    session.add(new_item)
-    session.commit()
-    session.refresh(new_item)
+    now = datetime.now()
+    copy = select(
+        TrackingItem.user_id,
+        TrackingItem.title,
+        TrackingItem.category_id,
+        literal(new_date, Date),
+        TrackingItem.description,
+        literal(False, Boolean),
+        literal(now, DateTime),
+        literal(now, DateTime),
+        literal(versions[user_id], Integer)
+    ).where(*original)
+    statement = insert(TrackingItem).from_select(
+        ["user_id", "title", "category_id", "reminder_date", "description", "is_done", "created_at", "updated_at", "sync_version"],
+        copy
+    ).returning(TrackingItem)
+    new_item = (await session.exec(statement)).scalars().first() # type: ignore
+    if new_item is None:
+        await session.rollback()
+        return None
 
-    # Load category relationship
-    if new_item.category_id:
-        category_statement = select(Category).where(Category.id == new_item.category_id)
-        new_item.category = session.exec(category_statement).first()
+    await add_item_counts(session, item_count_deltas([new_item]))
+    await session.commit()
+    event_hub.publish(user_id, versions[user_id])
 
     return new_item
 
 
-def get_items_due_today(session: Session) -> List[TrackingItem]:
-    """Get all tracking items due today (for scheduler).
+async def apply_item_batch(session: AsyncSession, user_id: int, operations: Sequence[ItemBatchOperation]) -> List[ItemBatchOutcome]:
+    """Apply create, update and delete operations on a user's items in one transaction.
+
+    Operations are checked in order against a single read of the targeted
+    items, as if applied one after the other (an item deleted by an earlier
+    operation is not found by a later one). The valid ones are then written
+    with one bulk statement per kind: an executemany INSERT ... RETURNING
+    for creates, an executemany UPDATE by primary key for updates and one
+    DELETE for deletes. Invalid operations are reported, not raised, and do
+    not prevent the others from being applied. Categories are not checked.
 
     Args:
         session: Database session
+        user_id: User's ID
+        operations: Operations to apply
 
     Returns:
-        List of TrackingItem objects due today
+        One ItemBatchOutcome per operation, in input order; error is one of
+        BATCH_NOT_FOUND, BATCH_FORBIDDEN, BATCH_DONE for refused operations
     """
-    statement = select(TrackingItem).where(
-        TrackingItem.reminder_date == date.today(),
-        TrackingItem.is_done == False
-    )
-    items = session.exec(statement).all()
+    if not operations:
+        return []
+
+    # Bump first: the user's row lock serializes this batch with their other writes
+    version = (await bump_data_version(session, [user_id]))[user_id]
+    now = datetime.now()
+
+    target_ids = {operation.id for operation in operations if operation.op != "create"}
+    rows: Dict[int, Dict[str, Any]] = {}
+    if target_ids:
+        statement = select(*TrackingItem.__table__.columns).where(TrackingItem.id.in_(target_ids)) # type: ignore
+        rows = {row.id: row._asdict() for row in await session.exec(statement)} # type: ignore
+
+    outcomes: List[Optional[ItemBatchOutcome]] = [None] * len(operations)
+    # Every owned pending target ends up updated or deleted: it leaves its counter, updated items rejoin below
+    count_deltas = item_count_deltas([TrackingItem(**row) for row in rows.values() if row["user_id"] == user_id and not row["is_done"]], -1)
+    create_indexes: List[int] = []
+    updates: Dict[int, Dict[str, Any]] = {}
+    deleted_ids: List[int] = []
+    for index, operation in enumerate(operations):
+        if operation.op == "create":
+            create_indexes.append(index)
+            continue
+
+        row = rows.get(operation.id) # type: ignore
+        if row is None:
+            outcomes[index] = ItemBatchOutcome(operation.id, error=BATCH_NOT_FOUND)
+        elif row["user_id"] != user_id:
+            outcomes[index] = ItemBatchOutcome(operation.id, error=BATCH_FORBIDDEN)
+        elif row["is_done"]:
+            outcomes[index] = ItemBatchOutcome(operation.id, error=BATCH_DONE)
+        elif operation.op == "update":
+            row.update(operation.changes.model_dump(exclude_none=True), updated_at=now, sync_version=version) # type: ignore
+            updates[row["id"]] = row
+            outcomes[index] = ItemBatchOutcome(operation.id, item=TrackingItem(**row))
+        else:
+            del rows[row["id"]]
+            updates.pop(row["id"], None)
+            deleted_ids.append(row["id"])
+            outcomes[index] = ItemBatchOutcome(operation.id)
+
+    if not (create_indexes or updates or deleted_ids):
+        await session.rollback()
+        return outcomes # type: ignore
+
+    if create_indexes:
+        params = [_new_item_row(user_id, operations[index].item, version, now) for index in create_indexes] # type: ignore
+        # Rows come back in parameter order; batched on PostgreSQL, row by row (in-process) on SQLite
+        statement = insert(TrackingItem).returning(TrackingItem, sort_by_parameter_order=True)
+        created = (await session.exec(statement, params=params)).scalars().all() # type: ignore
+        for index, item in zip(create_indexes, created):
+            outcomes[index] = ItemBatchOutcome(item.id, item=item)
+        count_deltas.update(item_count_deltas(created))
+
+    if updates:
+        await session.exec(update(TrackingItem), params=[ # type: ignore
+            {column: row[column] for column in BATCH_UPDATED_COLUMNS}
+            for row in updates.values()
+        ])
+        count_deltas.update(item_count_deltas(TrackingItem(**row) for row in updates.values()))
+
+    if deleted_ids:
+        deletable = [TrackingItem.id.in_(deleted_ids)] # type: ignore
+        await session.exec(tombstone_statement(deletable, now)) # type: ignore
+        await session.exec(delete(TrackingItem).where(*deletable)) # type: ignore
+
+    await add_item_counts(session, count_deltas)
+    await session.commit()
+    event_hub.publish(user_id, version)
+
+    return outcomes # type: ignore
+
+
+async def insert_items(
+    session: AsyncSession,
+    user_id: int,
+    items: Sequence[TrackingItemCreate],
+    done: Optional[Sequence[bool]] = None
+) -> int:
+    """Insert new items for a user with one executemany INSERT, in one transaction.
+
+    Categories are not checked; the caller must only pass categories
+    available to the user.
+
+    Args:
+        session: Database session
+        user_id: User's ID
+        items: Items to create
+        done: Whether each item is already done, in the order of items; all pending if None
+
+    Returns:
+        Number of items inserted
+    """
+    if not items:
+        return 0
 
-    # Load user and category relationships
-    for item in items:
-        if item.category_id:
-            category_statement = select(Category).where(Category.id == item.category_id)
-            item.category = session.exec(category_statement).first()
+    version = (await bump_data_version(session, [user_id]))[user_id]
+    now = datetime.now()
+    done = done or [False] * len(items)
+    params = [_new_item_row(user_id, item, version, now, is_done) for item, is_done in zip(items, done)]
+    await session.exec(insert(TrackingItem), params=params) # type: ignore
+    await add_item_counts(session, item_count_deltas(TrackingItem(**row) for row in params))
+    await session.commit()
+    event_hub.publish(user_id, version)
+    return len(items)
 
-    return list(items)
 
+async def iter_export_rows(session: AsyncSession, user_id: int, chunk_size: int = EXPORT_CHUNK_SIZE) -> AsyncIterator[Sequence[Any]]:
+    """Stream all of a user's items with their category names, oldest first.
 
-def mark_item_done(session: Session, item_id: int) -> bool:
-    """Mark a tracking item as done.
+    Rows are read from a single query through a server-side cursor, chunk by
+    chunk, so memory use does not depend on the number of items and the
+    first chunk is available as soon as the database returns it.
 
     Args:
-        session: Database session
-        item_id: Tracking item ID
+        session: Database session, dedicated to the stream
+        user_id: User's ID
+        chunk_size: Number of rows fetched from the cursor at a time
 
     Returns:
-        True if item was marked as done, False if not found
+        Async iterator of non-empty chunks of rows (id, title, category_name,
+        reminder_date, description, is_done, created_at, updated_at)
     """
-    item = get_item_by_id(session, item_id)
-
-    if not item:
-        return False
-
-    item.is_done = True
-    session.add(item)
-    session.commit()
-    return True
+    statement = select(
+        TrackingItem.id,
+        TrackingItem.title,
+        Category.name.label("category_name"), # type: ignore
+        TrackingItem.reminder_date,
+        TrackingItem.description,
+        TrackingItem.is_done,
+        TrackingItem.created_at,
+        TrackingItem.updated_at
+    ).join(
+        Category, Category.id == TrackingItem.category_id # type: ignore
+    ).where(
+        TrackingItem.user_id == user_id
+    ).order_by(TrackingItem.id).execution_options(yield_per=chunk_size) # type: ignore
+
+    result = await session.stream(statement)
+    async for rows in result.partitions():
+        yield rows
+
+
+async def iter_due_reminders_by_user(session: AsyncSession, chunk_size: int = DUE_REMINDER_CHUNK_SIZE) -> AsyncIterator[List[DueReminder]]:
+    """Stream the items due today, grouped by user (for scheduler).
+
+    Rows are read in keyset-paginated chunks of at most `chunk_size`, each a
+    single query joining the user's email and the category name, so memory
+    stays bounded however many items are due. Every yielded group holds items
+    of one user; a user whose items span a chunk boundary is carried over to
+    the next chunk, and a user with more than `chunk_size` due items is split
+    into several groups.
+
+    Items may be marked done between iterations (the caller usually does);
+    the keyset on (user_id, id) keeps the walk stable regardless.
 
+    Args:
+        session: Database session
+        chunk_size: Maximum number of rows fetched per query
 
-def delete_old_records(session: Session, cutoff_date: date) -> int:
-    """Delete tracking items older than cutoff_date.
+    Returns:
+        Async iterator of non-empty lists of DueReminder, one user per list
+    """
+    today = date.today()
+    last_user_id, last_id = 0, 0
+    group: List[DueReminder] = []
+
+    while True:
+        statement = select(
+            TrackingItem.id, TrackingItem.user_id, User.email,
+            TrackingItem.title, TrackingItem.description, Category.name
+        ).join(User, User.id == TrackingItem.user_id).join( # type: ignore
+            Category, Category.id == TrackingItem.category_id # type: ignore
+        ).where(
+            TrackingItem.reminder_date == today,
+            TrackingItem.is_done == False,
+            or_(
+                TrackingItem.user_id > last_user_id,
+                and_(TrackingItem.user_id == last_user_id, TrackingItem.id > last_id) # type: ignore
+            )
+        ).order_by(TrackingItem.user_id, TrackingItem.id).limit(chunk_size) # type: ignore
+        rows = [DueReminder(*row) for row in (await session.exec(statement)).all()]
+
+        for reminder in rows:
+            if group and (group[0].user_id != reminder.user_id or len(group) >= chunk_size):
+                yield group
+                group = []
+            group.append(reminder)
+
+        if len(rows) < chunk_size:
+            break
+        last_user_id, last_id = rows[-1].user_id, rows[-1].id
+
+    if group:
+        yield group
+
+
+async def delete_old_records(
+    session: AsyncSession,
+    cutoff_date: date,
+    batch_size: int = settings.CLEANUP_BATCH_SIZE,
+    time_budget_seconds: Optional[float] = settings.CLEANUP_TIME_BUDGET_SECONDS
+) -> BatchDeleteResult:
+    """Delete tracking items older than cutoff_date in committed batches.
 
     Args:
         session: Database session
         cutoff_date: Items with created_at before this date will be deleted
+        batch_size: Maximum number of items deleted per statement
+        time_budget_seconds: Stop after this long, leaving the rest for the next run
 
     Returns:
-        Number of items deleted
+        BatchDeleteResult of the cleanup
     """
-    statement = select(TrackingItem).where(
-        TrackingItem.created_at < cutoff_date
+    deleted_at = datetime.now()
+    return await delete_in_batches(
+        session, TrackingItem, TrackingItem.created_at < cutoff_date, # type: ignore
+        batch_size=batch_size, time_budget_seconds=time_budget_seconds,
+        before_delete=lambda conditions: [
+            data_version_bump_statement(TrackingItem, conditions),
+            tombstone_statement(conditions, deleted_at),
+            item_count_shift_statement(session, conditions, -1)
+        ]
     )
-    old_items = session.exec(statement).all()
-
-    count = len(old_items)
-    for item in old_items:
-        session.delete(item)
-
-    session.commit()
-    return count
 
 
-def delete_user_tracking_items(session: Session, user_id: int) -> int:
+async def delete_user_tracking_items(session: AsyncSession, user_id: int) -> int:
     """Delete all tracking items for a user.
 
     Args:
@@ -366,12 +819,8 @@ def delete_user_tracking_items(session: Session, user_id: int) -> int:
     Returns:
         Number of items deleted
     """
-    statement = select(TrackingItem).where(TrackingItem.user_id == user_id)
-    items = session.exec(statement).all()
-
-    count = len(items)
-    for item in items:
-        session.delete(item)
-
-    session.commit()
-    return count
+    result = await delete_in_batches(
+        session, TrackingItem, TrackingItem.user_id == user_id,
+        batch_size=settings.CLEANUP_BATCH_SIZE
+    )
+    return result.deleted
@@ -0,0 +1,113 @@
+"""CRUD operations for the tracking item archive."""
+
+from datetime import date, datetime
+from typing import AsyncIterator, List, Optional
+from sqlalchemy import DateTime, literal
+from sqlmodel import select, insert
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.crud.tracking_item_tombstone import tombstone_statement
+from app.crud.user import data_version_bump_statement
+from app.crud.user_item_stats import item_count_shift_statement
+from app.internalModels import BatchDeleteResult
+from app.models import TrackingItem, TrackingItemArchive, Category
+from app.services.batchDelete import delete_in_batches
+from app.services.settings import settings
+
+# Archived items fetched per query when streaming a user's history
+ARCHIVE_STREAM_CHUNK_SIZE = 500
+
+
+async def archive_done_items(
+    session: AsyncSession,
+    cutoff_date: date,
+    batch_size: int = settings.CLEANUP_BATCH_SIZE,
+    time_budget_seconds: Optional[float] = settings.CLEANUP_TIME_BUDGET_SECONDS
+) -> BatchDeleteResult:
+    """Move finished tracking items created before cutoff_date to the archive.
+
+    Each batch copies the items with INSERT ... SELECT and deletes them from
+    tracking_item in the same transaction, so an item is always in exactly
+    one of the two tables.
+
+    Args:
+        session: Database session
+        cutoff_date: Done items with created_at before this date are archived
+        batch_size: Maximum number of items moved per transaction
+        time_budget_seconds: Stop after this long, leaving the rest for the next run
+
+    Returns:
+        BatchDeleteResult of the move (deleted = items archived)
+    """
+    archived_at = datetime.now()
+
+    def copy_to_archive(conditions: List) -> List:
+        rows = select(
+            TrackingItem.id, TrackingItem.user_id, TrackingItem.title, Category.name,
+            TrackingItem.reminder_date, TrackingItem.description, TrackingItem.created_at,
+            literal(archived_at, DateTime)
+        ).join(Category, Category.id == TrackingItem.category_id).where(*conditions).order_by(TrackingItem.id) # type: ignore
+        return [
+            data_version_bump_statement(TrackingItem, conditions),
+            tombstone_statement(conditions, archived_at),
+            item_count_shift_statement(session, conditions, -1),
+            insert(TrackingItemArchive).from_select(
+                ["item_id", "user_id", "title", "category_name", "reminder_date", "description", "created_at", "archived_at"],
+                rows
+            ),
+        ]
+
+    return await delete_in_batches(
+        session, TrackingItem,
+        TrackingItem.created_at < cutoff_date, # type: ignore
+        TrackingItem.is_done == True,
+        batch_size=batch_size,
+        time_budget_seconds=time_budget_seconds,
+        before_delete=copy_to_archive # type: ignore
+    )
+
+
+async def iter_archived_items(
+    session: AsyncSession,
+    user_id: int,
+    chunk_size: int = ARCHIVE_STREAM_CHUNK_SIZE
+) -> AsyncIterator[List[TrackingItemArchive]]:
+    """Stream a user's archived items, most recently archived first.
+
+    Args:
+        session: Database session
+        user_id: User's ID
+        chunk_size: Maximum number of items fetched per query
+
+    Returns:
+        Async iterator of non-empty chunks of TrackingItemArchive objects
+    """
+    last_id = None
+    while True:
+        statement = select(TrackingItemArchive).where(TrackingItemArchive.user_id == user_id)
+        if last_id is not None:
+            statement = statement.where(TrackingItemArchive.id < last_id)
+        statement = statement.order_by(TrackingItemArchive.id.desc()).limit(chunk_size) # type: ignore
+        items = list((await session.exec(statement)).all())
+        if not items:
+            return
+        yield items
+        if len(items) < chunk_size:
+            return
+        last_id = items[-1].id
+
+
+async def delete_user_archived_items(session: AsyncSession, user_id: int) -> int:
+    """Delete a user's archived items.
+
+    Args:
+        session: Database session
+        user_id: User's ID
+
+    Returns:
+        Number of archived items deleted
+    """
+    result = await delete_in_batches(
+        session, TrackingItemArchive, TrackingItemArchive.user_id == user_id,
+        batch_size=settings.CLEANUP_BATCH_SIZE
+    )
+    return result.deleted
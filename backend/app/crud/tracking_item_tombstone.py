@@ -0,0 +1,94 @@
+"""CRUD operations for tracking item tombstones (delta sync)."""
+
+from datetime import datetime
+from typing import Any, List
+from sqlalchemy import DateTime, literal
+from sqlalchemy.sql import Executable
+from sqlmodel import select, update, insert, func
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.crud.user import current_data_version
+from app.internalModels import BatchDeleteResult
+from app.models import TrackingItem, TrackingItemTombstone, User
+from app.services.batchDelete import delete_in_batches
+from app.services.settings import settings
+
+
+def tombstone_statement(conditions: List[Any], deleted_at: datetime) -> Executable:
+    """Build an INSERT ... SELECT recording tombstones for the matching items.
+
+    Run it after bumping the owners' data version and before deleting the
+    items, in the same transaction.
+
+    Args:
+        conditions: WHERE conditions selecting the tracking items being removed
+        deleted_at: Time of removal
+
+    Returns:
+        INSERT statement
+    """
+    rows = select(
+        TrackingItem.id, TrackingItem.user_id, current_data_version(TrackingItem), literal(deleted_at, DateTime)
+    ).where(*conditions)
+    return insert(TrackingItemTombstone).from_select(["item_id", "user_id", "sync_version", "deleted_at"], rows)
+
+
+async def get_deleted_item_ids(session: AsyncSession, user_id: int, since: int) -> List[int]:
+    """Get the IDs of a user's items removed after a sync token.
+
+    Args:
+        session: Database session
+        user_id: User's ID
+        since: Sync token
+
+    Returns:
+        List of removed item IDs, oldest removal first
+    """
+    statement = select(TrackingItemTombstone.item_id).where(
+        TrackingItemTombstone.user_id == user_id,
+        TrackingItemTombstone.sync_version > since
+    ).order_by(TrackingItemTombstone.sync_version, TrackingItemTombstone.id)
+    return list((await session.exec(statement)).all())
+
+
+async def purge_tombstones(session: AsyncSession, before: datetime) -> BatchDeleteResult:
+    """Delete tombstones recorded before a cutoff.
+
+    The affected users' sync floor is raised first, so that clients holding
+    an older token get a full resync instead of silently missing deletions.
+
+    Args:
+        session: Database session
+        before: Tombstones recorded before this time are deleted
+
+    Returns:
+        BatchDeleteResult of the purge
+    """
+    purged_version = select(func.max(TrackingItemTombstone.sync_version)).where(
+        TrackingItemTombstone.user_id == User.id,
+        TrackingItemTombstone.deleted_at < before # type: ignore
+    ).scalar_subquery()
+    owners = select(TrackingItemTombstone.user_id).where(TrackingItemTombstone.deleted_at < before) # type: ignore
+    await session.exec(update(User).where(User.id.in_(owners)).values(sync_floor=purged_version)) # type: ignore
+    await session.commit()
+
+    return await delete_in_batches(
+        session, TrackingItemTombstone, TrackingItemTombstone.deleted_at < before, # type: ignore
+        batch_size=settings.CLEANUP_BATCH_SIZE, time_budget_seconds=settings.CLEANUP_TIME_BUDGET_SECONDS
+    )
+
+
+async def delete_user_tombstones(session: AsyncSession, user_id: int) -> int:
+    """Delete all tombstones of a user.
+
+    Args:
+        session: Database session
+        user_id: User's ID
+
+    Returns:
+        Number of tombstones deleted
+    """
+    result = await delete_in_batches(
+        session, TrackingItemTombstone, TrackingItemTombstone.user_id == user_id,
+        batch_size=settings.CLEANUP_BATCH_SIZE
+    )
+    return result.deleted
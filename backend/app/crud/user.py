@@ -1,11 +1,13 @@
 """CRUD operations for User model."""
 
-from typing import Optional
-from sqlmodel import Session, select
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+from sqlalchemy.sql import Executable
+from sqlmodel import SQLModel, select, update
+from sqlmodel.ext.asyncio.session import AsyncSession
 from app.models import User
 
 
-def get_user_by_email(session: Session, email: str) -> Optional[User]:
+async def get_user_by_email(session: AsyncSession, email: str) -> Optional[User]:
     """Get user by email address.
 
     Args:
@@ -16,11 +18,11 @@ def get_user_by_email(session: Session, email: str) -> Optional[User]:
         User object if found, None otherwise
     """
     statement = select(User).where(User.email == email)
-    user = session.exec(statement).first()
+    user = (await session.exec(statement)).first()
     return user
 
 
-def get_user_by_id(session: Session, user_id: int) -> Optional[User]:
+async def get_user_by_id(session: AsyncSession, user_id: int) -> Optional[User]:
     """Get user by ID.
 
     Args:
@@ -31,11 +33,123 @@ def get_user_by_id(session: Session, user_id: int) -> Optional[User]:
         User object if found, None otherwise
     """
     statement = select(User).where(User.id == user_id)
-    user = session.exec(statement).first()
+    user = (await session.exec(statement)).first()
     return user
 
 
-def create_user(session: Session, email: str) -> User:
+async def get_data_version(session: AsyncSession, user_id: int) -> Optional[int]:
+    """Get the version stamp of a user's items and categories.
+
+    Args:
+        session: Database session
+        user_id: User's ID
+
+    Returns:
+        Current data version, None if the user does not exist
+    """
+    statement = select(User.data_version).where(User.id == user_id)
+    return (await session.exec(statement)).first()
+
+
+async def get_sync_state(session: AsyncSession, user_id: int) -> Optional[Tuple[int, int]]:
+    """Get a user's current sync token and the oldest token still served incrementally.
+
+    Args:
+        session: Database session
+        user_id: User's ID
+
+    Returns:
+        Tuple of (data_version, sync_floor), None if the user does not exist
+    """
+    statement = select(User.data_version, User.sync_floor).where(User.id == user_id)
+    row = (await session.exec(statement)).first()
+    return tuple(row) if row else None # type: ignore
+
+
+async def get_user_id_by_calendar_token_hash(session: AsyncSession, token_hash: str) -> Optional[int]:
+    """Get the owner of a calendar feed token.
+
+    Args:
+        session: Database session
+        token_hash: SHA-256 hex digest of the token
+
+    Returns:
+        User ID if the token is current, None otherwise
+    """
+    statement = select(User.id).where(User.calendar_token_hash == token_hash)
+    return (await session.exec(statement)).first()
+
+
+async def set_calendar_token_hash(session: AsyncSession, user_id: int, token_hash: Optional[str]) -> None:
+    """Replace (or with None, revoke) a user's calendar feed token.
+
+    Args:
+        session: Database session
+        user_id: User's ID
+        token_hash: SHA-256 hex digest of the new token, None to revoke
+    """
+    statement = update(User).where(User.id == user_id).values(calendar_token_hash=token_hash)
+    await session.exec(statement) # type: ignore
+    await session.commit()
+
+
+async def bump_data_version(session: AsyncSession, user_ids: Iterable[int]) -> Dict[int, int]:
+    """Increment the data version of users whose items or categories changed.
+
+    Does not commit: call it inside the transaction of the write, so the new
+    version becomes visible together with the change. Rows changed by the
+    write are stamped with the returned version (sync_version).
+
+    Args:
+        session: Database session
+        user_ids: IDs of the affected users
+
+    Returns:
+        Map of user ID to the user's new data version
+    """
+    user_ids = set(user_ids)
+    if not user_ids:
+        return {}
+    statement = update(User).where(User.id.in_(user_ids)).values( # type: ignore
+        data_version=User.data_version + 1
+    ).returning(User.id, User.data_version)
+    return {user_id: version for user_id, version in (await session.exec(statement)).all()} # type: ignore
+
+
+def data_version_bump_statement(model: Type[SQLModel], conditions: List[Any]) -> Executable:
+    """Build an UPDATE bumping the data version of the owners of matching rows.
+
+    Meant for set-based writes that do not know the affected users up front,
+    e.g. as a delete_in_batches hook. Run it before the write itself and
+    stamp the changed rows with current_data_version.
+
+    Args:
+        model: Table model with a user_id column
+        conditions: WHERE conditions selecting the rows being changed
+
+    Returns:
+        UPDATE statement returning (user ID, new data version) rows, to
+        execute in the transaction of the write
+    """
+    owners = select(model.user_id).where(*conditions) # type: ignore
+    return update(User).where(User.id.in_(owners)).values( # type: ignore
+        data_version=User.data_version + 1
+    ).returning(User.id, User.data_version)
+
+
+def current_data_version(model: Type[SQLModel]) -> Any:
+    """Correlated subquery giving the data version of the owner of a `model` row.
+
+    Args:
+        model: Table model with a user_id column
+
+    Returns:
+        Scalar subquery usable as a value in INSERT ... SELECT or UPDATE
+    """
+    return select(User.data_version).where(User.id == model.user_id).scalar_subquery() # type: ignore
+
+
+async def create_user(session: AsyncSession, email: str) -> User:
     """Create a new user.
 
     Args:
@@ -47,12 +161,12 @@ def create_user(session: Session, email: str) -> User:
     """
     user = User(email=email)
     session.add(user)
-    session.commit()
-    session.refresh(user)
+    await session.commit()
+    await session.refresh(user)
     return user
 
 
-def delete_user(session: Session, user_id: int) -> bool:
+async def delete_user(session: AsyncSession, user_id: int) -> bool:
     """Delete a user.
 
     Args:
@@ -62,10 +176,10 @@ def delete_user(session: Session, user_id: int) -> bool:
     Returns:
         True if user was deleted, False if not found
     """
-    user = get_user_by_id(session, user_id)
+    user = await get_user_by_id(session, user_id)
     if not user:
         return False
 
-    session.delete(user)
-    session.commit()
+    await session.delete(user)
+    await session.commit()
     return True
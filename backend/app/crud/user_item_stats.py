@@ -0,0 +1,218 @@
+"""CRUD operations for the per-user item counters (user_item_stats)."""
+
+import collections
+from datetime import date
+from typing import Any, Counter, Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import Boolean, Integer, literal, literal_column
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.sql import Executable
+from sqlmodel import select, insert, delete, func
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.models import TrackingItem, User, UserItemStats
+from app.services.database import dialect_name
+
+# Users whose counters are rebuilt per transaction by reconcile_item_stats
+RECONCILE_CHUNK_SIZE = 200
+
+# Key of a counter: (user_id, category_id, reminder_date, is_done)
+ItemStatsKey = Tuple[int, int, date, bool]
+
+STATS_COLUMNS = ["user_id", "category_id", "month", "is_done", "item_count"]
+
+
+def _month(session: AsyncSession) -> Any:
+    """Reminder month (YYYY-MM) of a tracking item, as a SQL expression."""
+    if dialect_name(session) == "postgresql":
+        # Inlined, so that the expression is identical in SELECT and GROUP BY
+        return func.to_char(TrackingItem.reminder_date, literal_column("'YYYY-MM'"))
+    # SQLite stores dates as ISO text
+    return func.substr(TrackingItem.reminder_date, 1, 7)
+
+
+def _upsert(session: AsyncSession, rows: Optional[Any] = None) -> Executable:
+    """INSERT into user_item_stats that adds to the count of an existing counter instead.
+
+    Takes its values from `rows` (a SELECT of STATS_COLUMNS) if given,
+    otherwise from the execute parameters.
+    """
+    dialect = postgresql if dialect_name(session) == "postgresql" else sqlite
+    statement = dialect.insert(UserItemStats)
+    if rows is not None:
+        statement = statement.from_select(STATS_COLUMNS, rows)
+    return statement.on_conflict_do_update(
+        index_elements=["user_id", "category_id", "month", "is_done"],
+        set_={"item_count": UserItemStats.item_count + statement.excluded.item_count}
+    )
+
+
+def item_count_shift_statement(session: AsyncSession, conditions: List[Any], delta: int, is_done: Optional[bool] = None) -> Executable:
+    """Build an INSERT ... SELECT adding `delta` per matching item to its counter.
+
+    Run it in the transaction of the write, after bumping the owners' data
+    version (which serializes the owners' writes): before the write with
+    delta=-1 for items being removed or changed, after it with delta=1 for
+    changed items.
+
+    Args:
+        session: Database session
+        conditions: WHERE conditions selecting the tracking items
+        delta: Added to the counters once per matching item
+        is_done: Count the items under this state instead of their current one
+
+    Returns:
+        INSERT statement
+    """
+    keys = [TrackingItem.user_id, TrackingItem.category_id, _month(session)]
+    if is_done is None:
+        state = TrackingItem.is_done
+        group = [*keys, state]
+    else:
+        # A constant: one row per counter, which ON CONFLICT requires
+        state = literal(is_done, Boolean)
+        group = keys
+    rows = select(*keys, state, func.count() * literal(delta, Integer)).where(*conditions).group_by(*group)
+    return _upsert(session, rows)
+
+
+def item_done_shift_statements(session: AsyncSession, conditions: List[Any]) -> List[Executable]:
+    """Build the statements moving matching pending items to the done counters.
+
+    Run them just before the UPDATE marking the items done, with the same conditions.
+
+    Args:
+        session: Database session
+        conditions: WHERE conditions of the UPDATE, including is_done == False
+
+    Returns:
+        INSERT statements
+    """
+    return [
+        item_count_shift_statement(session, conditions, -1),
+        item_count_shift_statement(session, conditions, 1, is_done=True),
+    ]
+
+
+async def add_item_counts(session: AsyncSession, deltas: Dict[ItemStatsKey, int]) -> None:
+    """Add known per-item deltas to the counters with one executemany upsert.
+
+    Does not commit: call it inside the transaction of the write.
+
+    Args:
+        session: Database session
+        deltas: Map of (user_id, category_id, reminder_date, is_done) to the change in item count
+    """
+    counts: Counter[Tuple[int, int, str, bool]] = collections.Counter()
+    for (user_id, category_id, reminder_date, is_done), delta in deltas.items():
+        counts[(user_id, category_id, reminder_date.strftime("%Y-%m"), is_done)] += delta
+    params = [dict(zip(STATS_COLUMNS, (*key, delta))) for key, delta in counts.items() if delta]
+    if not params:
+        return
+    await session.exec(_upsert(session), params=params) # type: ignore
+
+
+def item_count_deltas(items: Iterable[Any], delta: int = 1) -> Counter[ItemStatsKey]:
+    """Count items (objects with user_id, category_id, reminder_date, is_done) per counter.
+
+    Args:
+        items: Tracking items or rows
+        delta: Added once per item
+
+    Returns:
+        Deltas for add_item_counts
+    """
+    deltas: Counter[ItemStatsKey] = collections.Counter()
+    for item in items:
+        deltas[(item.user_id, item.category_id, item.reminder_date, item.is_done)] += delta
+    return deltas
+
+
+async def get_item_stats(session: AsyncSession, user_id: int) -> List[UserItemStats]:
+    """Get a user's non-zero counters.
+
+    Reads at most one row per category, reminder month and state, however
+    many items the user has.
+
+    Args:
+        session: Database session
+        user_id: User's ID
+
+    Returns:
+        List of UserItemStats ordered by month and category
+    """
+    statement = select(UserItemStats).where(
+        UserItemStats.user_id == user_id,
+        UserItemStats.item_count > 0
+    ).order_by(UserItemStats.month, UserItemStats.category_id)
+    return list((await session.exec(statement)).all())
+
+
+async def get_done_count(session: AsyncSession, user_id: int) -> int:
+    """Get the number of a user's done items from the counters.
+
+    Args:
+        session: Database session
+        user_id: User's ID
+
+    Returns:
+        Number of done items
+    """
+    statement = select(func.coalesce(func.sum(UserItemStats.item_count), 0)).where(
+        UserItemStats.user_id == user_id,
+        UserItemStats.is_done == True
+    )
+    return (await session.exec(statement)).one()
+
+
+async def reconcile_item_stats(session: AsyncSession, chunk_size: int = RECONCILE_CHUNK_SIZE) -> int:
+    """Rebuild every user's counters from tracking_item, and drop those of deleted users.
+
+    Users are processed in chunks, one transaction each. The chunk's user
+    rows are locked first (PostgreSQL), which waits for their in-flight item
+    writes, since those bump the same rows, and holds off new ones until
+    the rebuilt counters are committed.
+
+    Args:
+        session: Database session
+        chunk_size: Number of users rebuilt per transaction
+
+    Returns:
+        Number of users processed
+    """
+    month = _month(session)
+    last_id = 0
+    processed = 0
+    while True:
+        statement = select(User.id).where(User.id > last_id).order_by(User.id).limit(chunk_size).with_for_update() # type: ignore
+        user_ids = list((await session.exec(statement)).all())
+        if not user_ids:
+            # Counters of users that no longer exist
+            await session.exec(delete(UserItemStats).where(UserItemStats.user_id.not_in(select(User.id)))) # type: ignore
+            await session.commit()
+            return processed
+
+        await session.exec(delete(UserItemStats).where(UserItemStats.user_id.in_(user_ids))) # type: ignore
+        rows = select(
+            TrackingItem.user_id, TrackingItem.category_id, month, TrackingItem.is_done, func.count()
+        ).where(
+            TrackingItem.user_id.in_(user_ids) # type: ignore
+        ).group_by(TrackingItem.user_id, TrackingItem.category_id, month, TrackingItem.is_done)
+        await session.exec(insert(UserItemStats).from_select(STATS_COLUMNS, rows)) # type: ignore
+        await session.commit()
+
+        processed += len(user_ids)
+        last_id = user_ids[-1]
+
+
+async def delete_user_item_stats(session: AsyncSession, user_id: int) -> int:
+    """Delete all counters of a user.
+
+    Args:
+        session: Database session
+        user_id: User's ID
+
+    Returns:
+        Number of counters deleted
+    """
+    result = await session.exec(delete(UserItemStats).where(UserItemStats.user_id == user_id)) # type: ignore
+    await session.commit()
+    return result.rowcount
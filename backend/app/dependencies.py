@@ -1,20 +1,83 @@
 """FastAPI dependencies for authentication and database."""
 
-from fastapi import Depends, HTTPException, status
+import hashlib
+import time
+from datetime import date
+from fastapi import Depends, HTTPException, Query, Request, Response, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlmodel import Session
-from app.services.database import get_session
+from jose import jwt
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.services.cache import TTLCache
+from app.services.database import get_session, session_factory
+from app.services.etagUtil import make_etag, etag_matches
 from app.services.jwtUtil import verify_token
+from app.services.settings import settings
 from app.crud import user as user_crud
 from app.models import User
 
 # HTTP Bearer security scheme for JWT
 security = HTTPBearer()
 
+# Verified tokens (keyed by SHA-256, never stored raw) -> user ID
+_token_cache: TTLCache[str, int] = TTLCache(settings.AUTH_CACHE_MAX_SIZE, settings.AUTH_CACHE_TTL_SECONDS)
+# User ID -> User, detached from any session
+_user_cache: TTLCache[int, User] = TTLCache(settings.AUTH_CACHE_MAX_SIZE, settings.AUTH_CACHE_TTL_SECONDS)
+
+
+def _token_key(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def _verify_token_cached(token: str) -> int:
+    key = _token_key(token)
+    user_id = _token_cache.get(key)
+    if user_id is not None:
+        return user_id
+
+    user_id = verify_token(token)
+    # A cached token must not outlive its expiry
+    expires_at = jwt.get_unverified_claims(token).get("exp")
+    ttl = expires_at - time.time() if expires_at is not None else None
+    _token_cache.set(key, user_id, ttl)
+    return user_id
+
+
+def invalidate_cached_user(user_id: int) -> None:
+    """Drop a user and the user's verified tokens from the authentication caches.
+
+    Must be called whenever a user is deleted, otherwise the user could keep
+    authenticating until the cached entries expire.
+
+    Args:
+        user_id: User's ID
+    """
+    _user_cache.delete(user_id)
+    _token_cache.delete_where(lambda _, cached_user_id: cached_user_id == user_id)
+
+
+async def _authenticate(token: str, session: AsyncSession) -> User:
+    # Verify token and extract user_id
+    user_id = _verify_token_cached(token)
+
+    # Get user from cache, or database on a miss
+    user = _user_cache.get(user_id)
+    if user is not None:
+        return user
+
+    user = await user_crud.get_user_by_id(session, user_id)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid Token"
+        )
+
+    _user_cache.set(user_id, user)
+    return user
+
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ) -> User:
     """Get current authenticated user from JWT token.
 
@@ -28,17 +91,56 @@ async def get_current_user(
     Raises:
         HTTPException: If token is invalid or user not found
     """
-    token = credentials.credentials
+    return await _authenticate(credentials.credentials, session)
 
-    # Verify token and extract user_id
-    user_id = verify_token(token)
 
-    # Get user from database
-    user = user_crud.get_user_by_id(session, user_id)
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid Token"
-        )
+async def get_current_user_from_query(token: str = Query(..., min_length=1)) -> User:
+    """Get current authenticated user from a JWT passed as ?token=.
 
-    return user
+    Only for long-lived streams consumed by EventSource, which cannot send
+    an Authorization header. Uses its own short session: a get_session
+    dependency would keep its connection until the stream ends.
+
+    Args:
+        token: JWT token
+
+    Returns:
+        User object
+
+    Raises:
+        HTTPException: If token is invalid or user not found
+    """
+    async with session_factory() as session:
+        return await _authenticate(token, session)
+
+
+async def check_etag(
+    request: Request,
+    response: Response,
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session)
+) -> None:
+    """Conditional GET support for the user's list endpoints.
+
+    The ETag is derived from the user's data version (bumped by every item
+    and category write), today's date (lists depend on it) and the request
+    path and query. Reading the version is a primary key lookup on the user
+    table, so an unchanged list is answered without touching the item tables.
+
+    Args:
+        request: Incoming request
+        response: Response to add the ETag header to
+        current_user: Current authenticated user
+        session: Database session
+
+    Raises:
+        HTTPException: 304 Not Modified if If-None-Match matches the current ETag
+    """
+    data_version = await user_crud.get_data_version(session, current_user.id) # type: ignore
+    etag = make_etag(current_user.id, data_version, date.today(), request.url.path, request.url.query)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
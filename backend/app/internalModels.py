@@ -1,6 +1,8 @@
 """Models for backend internal use"""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, List, Optional, Tuple
 
 @dataclass
 class Message:
@@ -10,4 +12,67 @@ class Message:
     content: str
 
     def __repr__(self) -> str:
-        return f"{self.title}\n{"="*20}\nTo: {self.to_email}\nSubject: {self.subject}\n{"-"*20}\n{self.content}"
\ No newline at end of file
+        return f"{self.title}\n{"="*20}\nTo: {self.to_email}\nSubject: {self.subject}\n{"-"*20}\n{self.content}"
+
+
+@dataclass
+class DispatchResult:
+    """Outcome of sending one message through the dispatcher."""
+    key: Any
+    message: Message
+    sent: bool
+    error: Optional[str] = None
+
+
+@dataclass
+class DueReminder:
+    """A tracking item due today, with the user email and category name its reminder needs."""
+    id: int
+    user_id: int
+    email: str
+    title: str
+    description: Optional[str]
+    category_name: Optional[str]
+
+
+@dataclass
+class ItemBatchOutcome:
+    """Result of one operation of an item batch; error is set if it was not applied."""
+    item_id: Optional[int]
+    item: Optional[Any] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class ImportResult:
+    """Outcome of an item import; errors are (line number, reason) pairs."""
+    imported: int = 0
+    created_categories: List[str] = field(default_factory=list)
+    errors: List[Tuple[int, str]] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class CalendarFeed:
+    """A rendered iCalendar feed with its validators."""
+    day: date
+    etag: str
+    last_modified: datetime
+    body: str
+
+
+@dataclass
+class BatchDeleteResult:
+    """Outcome of a batched delete."""
+    table: str
+    deleted: int
+    batches: int
+    elapsed_seconds: float
+    completed: bool
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.deleted / self.elapsed_seconds if self.elapsed_seconds > 0 else float(self.deleted)
+
+    def __str__(self) -> str:
+        state = "completed" if self.completed else "stopped at time budget"
+        return f"{self.deleted} row(s) deleted from {self.table} in {self.batches} batch(es), {self.elapsed_seconds:.2f}s, {self.rows_per_second:.0f} rows/s, {state}"
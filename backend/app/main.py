@@ -4,9 +4,11 @@ import sys
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.services.settings import settings
-from app.services.database import isDbHealthy
+from app.services.database import isDbHealthy, engine, session_factory
 from app.services.logSetup import setup_logging
 from app.services.scheduler import start_scheduler, stop_scheduler, run_startup_jobs
+from app.notifications import close_notification_services
+from app.crud import category as category_crud
 from app.routers import auth, categories, tracking_items, user
 
 
@@ -17,10 +19,14 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Starting TimeKeeper Backend")
-    if not isDbHealthy():
+    if not await isDbHealthy():
         logger.error("Database is not accessible")
         sys.exit(1)
 
+    async with session_factory() as session:
+        loaded = await category_crud.load_predefined_categories(session)
+    logger.info(f"Loaded {loaded} predefined categories")
+
     logger.info("Starting scheduler")
     start_scheduler()
 
@@ -33,6 +39,8 @@ async def lifespan(app: FastAPI):
 
     logger.info("Shutting down TimeKeeper Backend")
     stop_scheduler()
+    close_notification_services()
+    await engine.dispose()
     logger.info("TimeKeeper Backend shut down successfully")
 
 
@@ -48,7 +56,8 @@ app.add_middleware(
     allow_origins=settings.CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE"],
-    allow_headers=["Authorization", "Content-Type"],
+    allow_headers=["Authorization", "Content-Type", "If-None-Match"],
+    expose_headers=["ETag"],
     max_age=600
 )
 
@@ -68,7 +77,7 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    db_health_result = isDbHealthy()
+    db_health_result = await isDbHealthy()
     if not db_health_result:
         logger.error("Database is not accessible")
     return {
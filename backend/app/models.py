@@ -2,6 +2,7 @@
 
 from datetime import datetime, date
 from typing import Optional
+from sqlalchemy import Index, text
 from sqlmodel import Field, SQLModel, Relationship
 
 
@@ -11,6 +12,12 @@ class User(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     email: str = Field(unique=True, index=True, max_length=255)
     created_at: datetime = Field(default_factory=datetime.now)
+    # Bumped on every change to the user's items or categories (ETags, sync token)
+    data_version: int = Field(default=0)
+    # Sync tokens below this cannot be served incrementally, tombstones were purged
+    sync_floor: int = Field(default=0)
+    # SHA-256 of the secret in the user's calendar feed URL (the token itself is never stored)
+    calendar_token_hash: Optional[str] = Field(default=None, unique=True, index=True, max_length=64)
 
     # Relationships
     tracking_items: list["TrackingItem"] = Relationship(back_populates="user")
@@ -35,21 +42,97 @@ class Category(SQLModel, table=True):
 class TrackingItem(SQLModel, table=True):
     """Tracking item model for warranties, licenses, subscriptions, etc."""
     __tablename__ = "tracking_item" # type: ignore
+    __table_args__ = (
+        # Upcoming list: user_id, is_done=False, ordered by (reminder_date, id)
+        Index("ix_tracking_item_user_done_reminder", "user_id", "is_done", "reminder_date", "id"),
+        # Past list: user_id, is_done=True, ordered by (created_at, id)
+        Index("ix_tracking_item_user_done_created", "user_id", "is_done", "created_at", "id"),
+        # Search without an is_done filter, ordered by (reminder_date, id)
+        Index("ix_tracking_item_user_reminder", "user_id", "reminder_date", "id"),
+        # Scheduler: reminders due on a date that are not done yet
+        Index(
+            "ix_tracking_item_pending_reminder",
+            "reminder_date",
+            sqlite_where=text("is_done = 0"),
+            postgresql_where=text("NOT is_done")
+        ),
+        # Delta sync: a user's items changed after a sync token
+        Index("ix_tracking_item_user_sync_version", "user_id", "sync_version"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    user_id: int = Field(foreign_key="user.id", index=True)
+    user_id: int = Field(foreign_key="user.id")
     title: str = Field(max_length=255)
     category_id: int = Field(foreign_key="category.id", index=True)
     reminder_date: date = Field(index=True)
     description: Optional[str] = Field(default=None, max_length=1000)
-    is_done: bool = Field(default=False, index=True)
+    is_done: bool = Field(default=False)
     created_at: datetime = Field(default_factory=datetime.now, index=True)
+    updated_at: datetime = Field(default_factory=datetime.now)
+    # Owner's data_version as of the last change to this item
+    sync_version: int = Field(default=0)
 
     # Relationships
     user: User = Relationship(back_populates="tracking_items")
     category: Category = Relationship(back_populates="tracking_items")
 
 
+class TrackingItemTombstone(SQLModel, table=True):
+    """Record of a tracking item removed from tracking_item, for delta sync."""
+    __tablename__ = "tracking_item_tombstone" # type: ignore
+    __table_args__ = (
+        # Delta sync: a user's items removed after a sync token
+        Index("ix_tracking_item_tombstone_user_sync_version", "user_id", "sync_version"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    item_id: int
+    user_id: int
+    sync_version: int
+    deleted_at: datetime = Field(default_factory=datetime.now, index=True)
+
+
+class TrackingItemArchive(SQLModel, table=True):
+    """Finished tracking item moved out of tracking_item by the retention job.
+
+    Rows are only ever appended and read back. The category name is copied
+    so the history survives later category changes.
+    """
+    __tablename__ = "tracking_item_archive" # type: ignore
+    __table_args__ = (
+        # History stream: a user's archived items in archival (id) order
+        Index("ix_tracking_item_archive_user_id", "user_id", "id"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    # Id the item had in tracking_item (SQLite may reuse it for a later item)
+    item_id: int = Field(index=True)
+    user_id: int
+    title: str = Field(max_length=255)
+    category_name: str = Field(max_length=100)
+    reminder_date: date
+    description: Optional[str] = Field(default=None, max_length=1000)
+    created_at: datetime
+    archived_at: datetime = Field(default_factory=datetime.now)
+
+
+class UserItemStats(SQLModel, table=True):
+    """Number of a user's tracking items per category, reminder month and state.
+
+    Maintained by every write to tracking_item in the same transaction (see
+    crud/user_item_stats.py) and rebuilt by a daily reconciliation job.
+    Counts that drop to zero are kept until the next reconciliation.
+    """
+    __tablename__ = "user_item_stats" # type: ignore
+
+    user_id: int = Field(primary_key=True)
+    category_id: int = Field(primary_key=True)
+    # Reminder month as YYYY-MM
+    month: str = Field(primary_key=True, max_length=7)
+    is_done: bool = Field(primary_key=True)
+    item_count: int = Field(default=0)
+
+
 class OTP(SQLModel, table=True):
     __tablename__ = "otp" # type: ignore
 
@@ -57,7 +140,7 @@ class OTP(SQLModel, table=True):
     email: str = Field(index=True, max_length=255)
     otp_code: str = Field(max_length=6)
     expires_at: datetime = Field(index=True)
-    is_used: bool = Field(default=False, index=True)
+    is_used: bool = Field(default=False)
     created_at: datetime = Field(default_factory=datetime.now)
 
 
@@ -66,5 +149,29 @@ class SchedulerRun(SQLModel, table=True):
 
     id: Optional[int] = Field(default=None, primary_key=True)
     job_name: str = Field(unique=True, index=True, max_length=100)
-    last_run_at: datetime = Field(index=True)
+    last_run_at: Optional[datetime] = Field(default=None, index=True)
+    updated_at: datetime = Field(default_factory=datetime.now)
+    # Lease held by the instance currently running the job (multi-replica safety)
+    lease_owner: Optional[str] = Field(default=None, max_length=255)
+    lease_expires_at: Optional[datetime] = Field(default=None)
+
+
+class NotificationOutbox(SQLModel, table=True):
+    """Rendered notification waiting to be delivered by the outbox worker."""
+    __tablename__ = "notification_outbox" # type: ignore
+    __table_args__ = (
+        # Worker: messages of a status that are due for (re)delivery
+        Index("ix_notification_outbox_status_next_attempt", "status", "next_attempt_at"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    title: str = Field(max_length=100)
+    to_email: str = Field(max_length=255)
+    subject: str = Field(max_length=255)
+    content: str
+    status: str = Field(default="pending", max_length=20)
+    attempts: int = Field(default=0)
+    next_attempt_at: datetime = Field(default_factory=datetime.now)
+    last_error: Optional[str] = Field(default=None, max_length=1000)
+    created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
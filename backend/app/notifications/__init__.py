@@ -1,13 +1,20 @@
 """Notification service factory."""
 
+from typing import Dict
 from app.notifications.base import NotificationService
 from app.notifications.console import ConsoleNotificationService
 from app.notifications.email import EmailService
 
 
+# Services are reused so that transports (e.g. pooled SMTP connections) outlive a single job
+_services: Dict[str, NotificationService] = {}
+
+
 def get_notification_service(mode: str = "console") -> NotificationService:
     """Factory function to get notification service based on mode.
 
+    The service for a mode is created once and shared by later calls.
+
     Args:
         mode: Notification mode ("console", "email")
 
@@ -17,6 +24,12 @@ def get_notification_service(mode: str = "console") -> NotificationService:
     Raises:
         ValueError: If mode is not supported
     """
+    if mode not in _services:
+        _services[mode] = _create_notification_service(mode)
+    return _services[mode]
+
+
+def _create_notification_service(mode: str) -> NotificationService:
     if mode == "console":
         return ConsoleNotificationService()
     # Future implementations
@@ -24,3 +37,10 @@ def get_notification_service(mode: str = "console") -> NotificationService:
         return EmailService()
     else:
         raise ValueError(f"Unsupported notification mode: {mode}")
+
+
+def close_notification_services() -> None:
+    """Close every service created by get_notification_service."""
+    for service in _services.values():
+        service.close()
+    _services.clear()
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from typing import List
+from app.internalModels import Message
 from app.models import TrackingItem
 
 
@@ -44,3 +45,19 @@ class NotificationService(ABC):
             True if sent successfully, False otherwise
         """
         pass
+
+    @abstractmethod
+    def send_message(self, message: Message) -> bool:
+        """Send an already rendered message.
+
+        Args:
+            message: Message to deliver
+
+        Returns:
+            True if sent successfully, False otherwise
+        """
+        pass
+
+    def close(self) -> None:
+        """Release resources held by the service, such as open connections."""
+        pass
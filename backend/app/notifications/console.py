@@ -2,6 +2,7 @@
 
 import logging
 from typing import List
+from app.internalModels import Message
 from app.notifications.base import NotificationService
 from app.models import TrackingItem
 from app.notifications.messages import *
@@ -26,3 +27,7 @@ class ConsoleNotificationService(NotificationService):
     def send_batch_reminders(self, email: str, items: List[TrackingItem]) -> bool:
         logger.debug(message_for_batch_reminder(email, items))
         return True
+
+    def send_message(self, message: Message) -> bool:
+        logger.debug(message)
+        return True
@@ -0,0 +1,56 @@
+"""Concurrent notification dispatch that keeps the event loop free."""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterable, List, Tuple
+from app.internalModels import DispatchResult, Message
+from app.notifications.base import NotificationService
+
+
+logger = logging.getLogger(__name__)
+
+
+async def dispatch_messages(
+    service: NotificationService,
+    messages: Iterable[Tuple[Any, Message]],
+    concurrency: int
+) -> List[DispatchResult]:
+    """Send messages concurrently on worker threads.
+
+    Notification services are blocking (smtplib), so each send runs on a
+    dedicated thread pool. At most `concurrency` sends are in flight at once,
+    and a failing send never aborts the others.
+
+    Args:
+        service: Notification service to send through
+        messages: Pairs of (key, message); the key is returned with the result
+        concurrency: Maximum number of simultaneous sends
+
+    Returns:
+        One DispatchResult per message, in input order
+    """
+    loop = asyncio.get_running_loop()
+    slots = asyncio.Semaphore(concurrency)
+
+    async def send(executor: ThreadPoolExecutor, key: Any, message: Message) -> DispatchResult:
+        try:
+            sent = await loop.run_in_executor(executor, service.send_message, message)
+            return DispatchResult(key, message, sent, None if sent else "Notification service reported failure")
+        except Exception as e:
+            logger.error(f"Failed to send notification to {message.to_email}: {e}")
+            return DispatchResult(key, message, False, str(e))
+        finally:
+            slots.release()
+
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="notify")
+    try:
+        tasks = []
+        for key, message in messages:
+            # Bound the number of pending tasks, not just running threads
+            await slots.acquire()
+            tasks.append(asyncio.create_task(send(executor, key, message)))
+        return list(await asyncio.gather(*tasks))
+    finally:
+        # Never join worker threads from the event loop
+        executor.shutdown(wait=False)
@@ -1,10 +1,10 @@
-import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import List
+from typing import List, Optional
 from app.internalModels import Message
 from app.models import TrackingItem
 from app.notifications.base import NotificationService
+from app.notifications.transport import SMTPConnectionPool
 from app.notifications.messages import *
 from app.services.settings import settings
 import logging
@@ -16,23 +16,27 @@ class EmailService(NotificationService):
     """SMTP email notification service.
     """
 
-    def __init__(self):
+    def __init__(self, transport: Optional[SMTPConnectionPool] = None):
         """Initialize SMTP email service.
 
         Args:
-            smtp_host: SMTP server host
-            smtp_port: SMTP server port
-            smtp_user: SMTP username
-            smtp_password: SMTP password
-            smtp_from: From email address
-            smtp_host: str, smtp_port: int, smtp_user: str, smtp_password: str, smtp_from: str
+            transport: Connection pool to send through, built from settings when omitted
         """
         self.smtp_host = settings.SMTP_HOST
         self.smtp_port = settings.SMTP_PORT
         self.smtp_user = settings.SMTP_USER
         self.smtp_password = settings.SMTP_PASSWORD
         self.smtp_from = settings.SMTP_FROM
-    
+        self.transport = transport or SMTPConnectionPool(
+            self.smtp_host, # type: ignore
+            self.smtp_port, # type: ignore
+            self.smtp_user, # type: ignore
+            self.smtp_password, # type: ignore
+            pool_size=settings.SMTP_POOL_SIZE,
+            max_messages_per_connection=settings.SMTP_MAX_MESSAGES_PER_CONNECTION,
+            timeout=settings.SMTP_TIMEOUT
+        )
+
     def _send_email(self, messageObject: Message):
         if not self.smtp_host or not self.smtp_port or not self.smtp_user or not self.smtp_password:
             logger.error("SMTP credentials not set. Cannot send email.")
@@ -46,15 +50,9 @@ class EmailService(NotificationService):
             msg["Subject"] = messageObject.subject
             msg.attach(MIMEText(messageObject.content, "plain"))
 
-            # Connect to server
-            server = smtplib.SMTP(self.smtp_host, self.smtp_port)
-            server.starttls()  # Secure the connection
-            server.login(self.smtp_user, self.smtp_password)
-            
-            # Send
-            server.sendmail(self.smtp_from, messageObject.to_email, msg.as_string()) # type: ignore
-            server.quit()
-            
+            # Send over a pooled, already authenticated connection
+            self.transport.send(self.smtp_from, messageObject.to_email, msg.as_string()) # type: ignore
+
             logger.info(f"Email sent successfully to {messageObject.to_email}")
             return True
         except Exception as e:
@@ -69,3 +67,9 @@ class EmailService(NotificationService):
 
     def send_batch_reminders(self, email: str, items: List[TrackingItem]) -> bool:
         return self._send_email(message_for_batch_reminder(email, items))
+
+    def send_message(self, message: Message) -> bool:
+        return self._send_email(message)
+
+    def close(self) -> None:
+        self.transport.close()
@@ -0,0 +1,153 @@
+"""Pooled SMTP transport that reuses authenticated connections."""
+
+import logging
+import queue
+import smtplib
+import threading
+from typing import Callable
+
+
+logger = logging.getLogger(__name__)
+
+
+class _PooledConnection:
+    """An authenticated SMTP connection and the number of messages sent on it."""
+
+    def __init__(self, server: smtplib.SMTP):
+        self.server = server
+        self.sent = 0
+
+
+class SMTPConnectionPool:
+    """Thread-safe pool of keep-alive SMTP connections.
+
+    Connections are opened lazily (connect, STARTTLS, login) and reused across
+    messages. A connection is recycled after max_messages_per_connection
+    messages, and one that breaks is discarded and the message retried once on
+    a fresh connection.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        user: str,
+        password: str,
+        pool_size: int = 4,
+        max_messages_per_connection: int = 100,
+        timeout: float = 30,
+        use_starttls: bool = True,
+        smtp_factory: Callable[..., smtplib.SMTP] = smtplib.SMTP
+    ):
+        """Initialize the pool. No connection is opened until the first send.
+
+        Args:
+            host: SMTP server host
+            port: SMTP server port
+            user: SMTP username
+            password: SMTP password
+            pool_size: Maximum number of open connections
+            max_messages_per_connection: Messages sent before a connection is replaced
+            timeout: Socket timeout in seconds
+            use_starttls: Upgrade connections with STARTTLS before login
+            smtp_factory: Callable creating the SMTP client, replaceable with a test double
+        """
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.max_messages_per_connection = max_messages_per_connection
+        self.timeout = timeout
+        self.use_starttls = use_starttls
+        self._smtp_factory = smtp_factory
+        self._idle: queue.LifoQueue[_PooledConnection] = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(pool_size)
+        self._closed = False
+
+    def _connect(self) -> _PooledConnection:
+        server = self._smtp_factory(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.use_starttls:
+                server.starttls()
+            server.login(self.user, self.password)
+        except Exception:
+            self._quit(server)
+            raise
+        logger.debug(f"Opened SMTP connection to {self.host}:{self.port}")
+        return _PooledConnection(server)
+
+    def _acquire(self) -> _PooledConnection:
+        self._slots.acquire()
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            return self._connect()
+        except Exception:
+            self._slots.release()
+            raise
+
+    def _release(self, connection: _PooledConnection, reusable: bool) -> None:
+        if reusable and not self._closed and connection.sent < self.max_messages_per_connection:
+            self._idle.put(connection)
+        else:
+            self._quit(connection.server)
+        self._slots.release()
+
+    @staticmethod
+    def _quit(server: smtplib.SMTP) -> None:
+        try:
+            server.quit()
+        except Exception:
+            server.close()
+
+    @staticmethod
+    def _is_connection_error(error: Exception) -> bool:
+        if isinstance(error, (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError)):
+            return True
+        # 421: server is closing the transmission channel
+        if isinstance(error, smtplib.SMTPResponseException) and error.smtp_code == 421:
+            return True
+        # SMTPException subclasses OSError; only plain socket errors mean a broken connection
+        return isinstance(error, OSError) and not isinstance(error, smtplib.SMTPException)
+
+    def send(self, from_addr: str, to_addr: str, message: str) -> None:
+        """Send a message over a pooled connection.
+
+        Args:
+            from_addr: Envelope sender
+            to_addr: Envelope recipient
+            message: Complete RFC 5322 message
+
+        Raises:
+            smtplib.SMTPException or OSError: If the message could not be sent
+        """
+        for attempt in (1, 2):
+            connection = self._acquire()
+            try:
+                connection.server.sendmail(from_addr, to_addr, message)
+            except Exception as e:
+                if not self._is_connection_error(e):
+                    # Message level failure (e.g. recipient refused), connection is still fine
+                    self._release(connection, reusable=True)
+                    raise
+                self._release(connection, reusable=False)
+                if attempt == 2:
+                    raise
+                logger.warning(f"SMTP connection failed ({e}), reconnecting")
+                continue
+
+            connection.sent += 1
+            self._release(connection, reusable=True)
+            return
+
+    def close(self) -> None:
+        """Close all idle connections. Connections in use are closed on release."""
+        self._closed = True
+        while True:
+            try:
+                connection = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._quit(connection.server)
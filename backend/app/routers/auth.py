@@ -1,7 +1,7 @@
 """Authentication API endpoints."""
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from app.services.database import get_session
 from app.dependencies import get_current_user
 from app.schemas import EmailRequest, OTPVerifyRequest, TokenResponse, UserResponse
@@ -15,7 +15,7 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
 @router.post("/request-otp", status_code=status.HTTP_200_OK)
 async def request_otp(
     request: EmailRequest,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ):
     """Request OTP for email-based authentication.
 
@@ -29,7 +29,7 @@ async def request_otp(
         Success message
     """
     # Create OTP (this also deletes any existing OTPs for this email)
-    otp = otp_crud.create_otp(session, request.email)
+    otp = await otp_crud.create_otp(session, request.email)
 
     # TODO: Send OTP via notification service
     # For now, print to console
@@ -44,7 +44,7 @@ async def request_otp(
 @router.post("/verify-otp", response_model=TokenResponse, status_code=status.HTTP_200_OK)
 async def verify_otp(
     request: OTPVerifyRequest,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ):
     """Verify OTP and return JWT token.
 
@@ -61,7 +61,7 @@ async def verify_otp(
         HTTPException: If OTP is invalid or expired
     """
     # Verify OTP
-    is_valid = otp_crud.verify_otp(session, request.email, request.otp_code)
+    is_valid = await otp_crud.verify_otp(session, request.email, request.otp_code)
 
     if not is_valid:
         raise HTTPException(
@@ -70,9 +70,9 @@ async def verify_otp(
         )
 
     # Get or create user
-    user = user_crud.get_user_by_email(session, request.email)
+    user = await user_crud.get_user_by_email(session, request.email)
     if not user:
-        user = user_crud.create_user(session, request.email)
+        user = await user_crud.create_user(session, request.email)
 
     # Create JWT token
     access_token = create_access_token({"user_id": user.id})
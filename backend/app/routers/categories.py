@@ -2,9 +2,9 @@
 
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from app.services.database import get_session
-from app.dependencies import get_current_user
+from app.dependencies import get_current_user, check_etag
 from app.schemas import CategoryCreate, CategoryUpdate, CategoryResponse
 from app.crud import category as category_crud
 from app.models import User
@@ -12,13 +12,15 @@ from app.models import User
 router = APIRouter(prefix="/categories", tags=["Categories"])
 
 
-@router.get("", response_model=List[CategoryResponse], status_code=status.HTTP_200_OK)
+@router.get("", response_model=List[CategoryResponse], status_code=status.HTTP_200_OK, dependencies=[Depends(check_etag)])
 async def get_categories(
     current_user: User = Depends(get_current_user),
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ):
     """Get all categories available to the user (predefined + user's custom).
 
+    Responses carry an ETag; a matching If-None-Match gets 304 Not Modified.
+
     Args:
         current_user: Current authenticated user
         session: Database session
@@ -26,7 +28,7 @@ async def get_categories(
     Returns:
         List of categories
     """
-    categories = category_crud.get_categories_for_user(session, current_user.id)
+    categories = await category_crud.get_categories_for_user(session, current_user.id)
     return categories
 
 
@@ -34,7 +36,7 @@ async def get_categories(
 async def create_category(
     category_data: CategoryCreate,
     current_user: User = Depends(get_current_user),
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ):
     """Create a new user-specific category.
 
@@ -46,7 +48,7 @@ async def create_category(
     Returns:
         Created category
     """
-    category = category_crud.create_user_category(session, current_user.id, category_data.name)
+    category = await category_crud.create_user_category(session, current_user.id, category_data.name)
     return category
 
 
@@ -55,7 +57,7 @@ async def update_category(
     category_id: int,
     category_data: CategoryUpdate,
     current_user: User = Depends(get_current_user),
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ):
     """Update a user's custom category.
 
@@ -74,7 +76,7 @@ async def update_category(
         HTTPException: If category not found or cannot be modified
     """
     # Check if category exists and get it
-    category = category_crud.get_category_by_id(session, category_id)
+    category = await category_crud.get_category_by_id(session, category_id)
 
     if not category:
         raise HTTPException(
@@ -97,7 +99,7 @@ async def update_category(
         )
 
     # Update category
-    updated_category = category_crud.update_user_category(
+    updated_category = await category_crud.update_user_category(
         session, category_id, current_user.id, category_data.name
     )
 
@@ -114,7 +116,7 @@ async def update_category(
 async def delete_category(
     category_id: int,
     current_user: User = Depends(get_current_user),
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ):
     """Delete a user's custom category.
 
@@ -132,7 +134,7 @@ async def delete_category(
         HTTPException: If category not found or cannot be deleted
     """
     # Check if category exists and get it
-    category = category_crud.get_category_by_id(session, category_id)
+    category = await category_crud.get_category_by_id(session, category_id)
 
     if not category:
         raise HTTPException(
@@ -155,7 +157,7 @@ async def delete_category(
         )
 
     # Delete category
-    success, error_message = category_crud.delete_user_category(session, category_id, current_user.id)
+    success, error_message = await category_crud.delete_user_category(session, category_id, current_user.id)
 
     if not success:
         raise HTTPException(
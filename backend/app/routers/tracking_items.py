@@ -1,91 +1,589 @@
 """Tracking Item API endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlmodel import Session
-from app.services.database import get_session
-from app.dependencies import get_current_user
+import asyncio
+import csv
+import io
+import json
+from datetime import date
+from email.utils import format_datetime
+from typing import AsyncIterator, Dict, List, Literal, NoReturn, Optional
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query
+from fastapi.responses import Response, StreamingResponse
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.services.database import get_session, session_factory
+from app.dependencies import get_current_user, get_current_user_from_query, check_etag
+from app.services.eventHub import event_hub
+from app.services.etagUtil import etag_matches, not_modified_since
+from app.services import calendarFeed, itemImport
+from app.services.settings import settings
 from app.schemas import (
     TrackingItemCreate,
     TrackingItemUpdate,
     TrackingItemRecreate,
     TrackingItemResponse,
-    PaginatedResponse
+    ArchivedItemResponse,
+    ExportedItemResponse,
+    CategoryResponse,
+    PaginatedResponse,
+    ItemChangesResponse,
+    ItemStatsResponse,
+    CategoryItemStats,
+    MonthItemStats,
+    ItemBatchRequest,
+    ItemBatchResult,
+    ItemBatchResponse,
+    ItemImportError,
+    ItemImportResponse,
+    CalendarTokenResponse
 )
-from app.crud import tracking_item as tracking_item_crud
-from app.models import User
+from app.crud import tracking_item as tracking_item_crud, tracking_item_archive as archive_crud, category as category_crud, user as user_crud, user_item_stats as stats_crud
+from app.models import TrackingItem, User
 
 router = APIRouter(prefix="/items", tags=["Tracking Items"])
 
+# Status code and detail reported for batch operations refused by the crud layer
+BATCH_ERRORS = {
+    tracking_item_crud.BATCH_NOT_FOUND: (status.HTTP_404_NOT_FOUND, "Item not found"),
+    tracking_item_crud.BATCH_FORBIDDEN: (status.HTTP_403_FORBIDDEN, "Not authorized to modify this item"),
+    tracking_item_crud.BATCH_DONE: (status.HTTP_400_BAD_REQUEST, "Cannot modify completed items"),
+}
 
-@router.get("/upcoming", response_model=PaginatedResponse, status_code=status.HTTP_200_OK)
+
+async def _to_responses(session: AsyncSession, user_id: int, items: List[TrackingItem]) -> List[TrackingItemResponse]:
+    """Serialize items with their categories resolved from the category cache.
+
+    Args:
+        session: Database session
+        user_id: Owner of the items
+        items: Tracking items to serialize
+
+    Returns:
+        List of TrackingItemResponse, in input order
+    """
+    categories = dict(await category_crud.resolve_categories(session, user_id, {item.category_id for item in items}))
+    for category_id in {item.category_id for item in items} - categories.keys():
+        # Not available to the user (should not happen), fall back to the database
+        category = await category_crud.get_category_by_id(session, category_id)
+        categories[category_id] = CategoryResponse.model_validate(category)
+    return [TrackingItemResponse(**item.model_dump(), category=categories[item.category_id]) for item in items]
+
+
+async def _ensure_category_available(session: AsyncSession, user_id: int, category_id: int) -> None:
+    """Raise 400 unless the category is predefined or owned by the user."""
+    if not await category_crud.resolve_categories(session, user_id, [category_id]):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Category not found"
+        )
+
+
+async def _raise_refused_write(session: AsyncSession, user_id: int, item_id: int, action: str, check_done: bool = True) -> NoReturn:
+    """Explain why a conditional write on an item matched nothing.
+
+    Writes check ownership and state in their WHERE clause, so the item is
+    only read here, on the failure path.
+
+    Args:
+        session: Database session
+        user_id: ID of the user attempting the write
+        item_id: Tracking item ID
+        action: Verb used in the error details ("modify", "delete", ...)
+        check_done: Whether completed items are refused
+
+    Raises:
+        HTTPException: 404 if the item does not exist, 403 if it belongs to
+            another user, 400 if it is completed (or changed concurrently)
+    """
+    item = await tracking_item_crud.get_item_by_id(session, item_id)
+
+    if not item:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Item not found"
+        )
+
+    if item.user_id != user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Not authorized to {action} this item"
+        )
+
+    if check_done and item.is_done:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Cannot {action} completed items"
+        )
+
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"Failed to {action} item"
+    )
+
+
+async def _read_upload(request: Request, max_bytes: int) -> AsyncIterator[bytes]:
+    """Stream the request body, refusing it with 413 once it exceeds max_bytes.
+
+    The declared Content-Length is checked first; the count of bytes
+    actually received also covers chunked bodies. Chunks already imported
+    when the limit is hit stay imported.
+
+    Args:
+        request: Incoming request
+        max_bytes: Largest accepted body size
+
+    Returns:
+        Async iterator of body chunks
+
+    Raises:
+        HTTPException: 413 if the body is larger than max_bytes
+    """
+    too_large = HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"File is larger than {max_bytes} bytes"
+    )
+    content_length = request.headers.get("content-length")
+    if content_length is not None and content_length.isdigit() and int(content_length) > max_bytes:
+        raise too_large
+
+    received = 0
+    async for chunk in request.stream():
+        received += len(chunk)
+        if received > max_bytes:
+            raise too_large
+        yield chunk
+
+
+@router.get("/upcoming", response_model=PaginatedResponse, status_code=status.HTTP_200_OK, dependencies=[Depends(check_etag)])
 async def get_upcoming_items(
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1),
+    cursor: Optional[str] = Query(None),
     current_user: User = Depends(get_current_user),
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ):
     """Get upcoming tracking items (is_done=False, reminder_date >= today).
 
     Items are paginated and ordered by reminder_date ascending (earliest first).
     Page size is validated against [10, 20, 50].
+    Pass the returned next_cursor as cursor to fetch the following page with
+    keyset pagination, whose cost does not grow with page depth.
+    Responses carry an ETag; a matching If-None-Match gets 304 Not Modified.
 
     Args:
         page: Page number (1-indexed)
         limit: Items per page
+        cursor: Cursor from a previous response (takes precedence over page)
         current_user: Current authenticated user
         session: Database session
 
     Returns:
         Paginated response with upcoming items
     """
-    result = tracking_item_crud.get_upcoming_items(session, current_user.id, page, limit)
+    result = await tracking_item_crud.get_upcoming_items(session, current_user.id, page, limit, cursor)
 
     return PaginatedResponse(
-        items=[TrackingItemResponse.from_orm(item) for item in result["items"]],
+        items=await _to_responses(session, current_user.id, result["items"]),
         total=result["total"],
         page=result["page"],
         pages=result["pages"],
-        page_size=result["page_size"]
+        page_size=result["page_size"],
+        next_cursor=result["next_cursor"]
     )
 
 
-@router.get("/past", response_model=PaginatedResponse, status_code=status.HTTP_200_OK)
+@router.get("/past", response_model=PaginatedResponse, status_code=status.HTTP_200_OK, dependencies=[Depends(check_etag)])
 async def get_past_items(
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1),
+    cursor: Optional[str] = Query(None),
     current_user: User = Depends(get_current_user),
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ):
     """Get past tracking items (is_done=True).
 
     Items are paginated and ordered by created_at descending (latest first).
     Page size is validated against [10, 20, 50].
+    Pass the returned next_cursor as cursor to fetch the following page with
+    keyset pagination, whose cost does not grow with page depth.
+    Responses carry an ETag; a matching If-None-Match gets 304 Not Modified.
 
     Args:
         page: Page number (1-indexed)
         limit: Items per page
+        cursor: Cursor from a previous response (takes precedence over page)
         current_user: Current authenticated user
         session: Database session
 
     Returns:
         Paginated response with past items
     """
-    result = tracking_item_crud.get_past_items(session, current_user.id, page, limit)
+    result = await tracking_item_crud.get_past_items(session, current_user.id, page, limit, cursor)
+
+    return PaginatedResponse(
+        items=await _to_responses(session, current_user.id, result["items"]),
+        total=result["total"],
+        page=result["page"],
+        pages=result["pages"],
+        page_size=result["page_size"],
+        next_cursor=result["next_cursor"]
+    )
+
+
+@router.get("/search", response_model=PaginatedResponse, status_code=status.HTTP_200_OK, dependencies=[Depends(check_etag)])
+async def search_items(
+    q: Optional[str] = Query(None, max_length=200),
+    category_id: Optional[int] = Query(None, gt=0),
+    date_from: Optional[date] = Query(None),
+    date_to: Optional[date] = Query(None),
+    is_done: Optional[bool] = Query(None),
+    page: int = Query(1, ge=1),
+    limit: int = Query(10, ge=1),
+    cursor: Optional[str] = Query(None),
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session)
+):
+    """Search tracking items by text, category, reminder date range and state.
+
+    All filters are optional and combined. q matches items whose title or
+    description contain every word of q (prefix match, e.g. "warr" finds
+    "Warranty"), through a full-text index.
+    Items are ordered by reminder_date ascending, paginated like /upcoming
+    (page or cursor), and responses carry an ETag.
+
+    Args:
+        q: Search text
+        category_id: Category filter
+        date_from: Earliest reminder date (inclusive)
+        date_to: Latest reminder date (inclusive)
+        is_done: Done (true) or pending (false) items only
+        page: Page number (1-indexed)
+        limit: Items per page
+        cursor: Cursor from a previous response (takes precedence over page)
+        current_user: Current authenticated user
+        session: Database session
+
+    Returns:
+        Paginated response with matching items
+    """
+    result = await tracking_item_crud.search_items(
+        session, current_user.id, q, category_id, date_from, date_to, is_done, page, limit, cursor # type: ignore
+    )
 
     return PaginatedResponse(
-        items=[TrackingItemResponse.from_orm(item) for item in result["items"]],
+        items=await _to_responses(session, current_user.id, result["items"]),
         total=result["total"],
         page=result["page"],
         pages=result["pages"],
-        page_size=result["page_size"]
+        page_size=result["page_size"],
+        next_cursor=result["next_cursor"]
+    )
+
+
+@router.get("/stats", response_model=ItemStatsResponse, status_code=status.HTTP_200_OK, dependencies=[Depends(check_etag)])
+async def get_item_stats(
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session)
+):
+    """Get the number of pending and done items, overall, per category and per reminder month.
+
+    Counts come from precomputed per-user counters, so the cost does not
+    depend on the number of items. Responses carry an ETag.
+
+    Args:
+        current_user: Current authenticated user
+        session: Database session
+
+    Returns:
+        Item counts; categories and months without items are left out
+    """
+    counts = await stats_crud.get_item_stats(session, current_user.id)
+
+    by_category: Dict[int, Dict[bool, int]] = {}
+    by_month: Dict[str, Dict[bool, int]] = {}
+    for row in counts:
+        by_category.setdefault(row.category_id, {True: 0, False: 0})[row.is_done] += row.item_count
+        by_month.setdefault(row.month, {True: 0, False: 0})[row.is_done] += row.item_count
+    categories = await category_crud.resolve_categories(session, current_user.id, by_category.keys())
+
+    pending = sum(group[False] for group in by_month.values())
+    done = sum(group[True] for group in by_month.values())
+    return ItemStatsResponse(
+        total=pending + done,
+        pending=pending,
+        done=done,
+        by_category=[
+            CategoryItemStats(
+                category_id=category_id,
+                category_name=categories[category_id].name if category_id in categories else None,
+                pending=group[False],
+                done=group[True]
+            )
+            for category_id, group in sorted(by_category.items())
+        ],
+        by_month=[MonthItemStats(month=month, pending=group[False], done=group[True]) for month, group in sorted(by_month.items())]
+    )
+
+
+@router.get("/changes", response_model=ItemChangesResponse, status_code=status.HTTP_200_OK)
+async def get_item_changes(
+    since: Optional[int] = Query(None, ge=0),
+    cursor: Optional[str] = Query(None),
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session)
+):
+    """Delta sync: items created, updated, completed or removed since a sync token.
+
+    Call without since for a full snapshot, then pass the returned token as
+    since on the next call. Apply deleted before items (an ID can be reused
+    by a new item). When reset is true the response is a full snapshot and
+    the local copy must be replaced rather than patched.
+
+    A snapshot is paged: while next_cursor is set, fetch the following page
+    with cursor=<next_cursor>. Only the last page carries the token.
+
+    Args:
+        since: Token returned by the previous call
+        cursor: Cursor from the previous snapshot page
+        current_user: Current authenticated user
+        session: Database session
+
+    Returns:
+        Changed items, removed item IDs and the next token or snapshot cursor
+    """
+    result = await tracking_item_crud.get_changes(session, current_user.id, since, cursor)
+    if result is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid Token"
+        )
+
+    return ItemChangesResponse(
+        token=result["token"],
+        reset=result["reset"],
+        items=await _to_responses(session, current_user.id, result["items"]),
+        deleted=result["deleted"],
+        next_cursor=result["next_cursor"]
+    )
+
+
+@router.get("/events", status_code=status.HTTP_200_OK)
+async def stream_item_events(current_user: User = Depends(get_current_user_from_query)):
+    """Server-Sent Events stream telling the client when its data changed.
+
+    Authenticated with ?token=<JWT>, as EventSource cannot send headers.
+    A "changed" event carrying the new sync token is sent on connect and
+    after every change to the user's items or categories (edits from other
+    devices, reminders marked done by the scheduler, ...); the client then
+    calls /items/changes?since=<its last token>.
+
+    Changes made in this process are pushed at once. Changes made by other
+    replicas are picked up at the next heartbeat, when the user's data
+    version is re-read (a primary key lookup).
+
+    Args:
+        current_user: Current authenticated user
+
+    Returns:
+        Streaming text/event-stream response
+    """
+    user_id = current_user.id
+
+    async def current_version() -> Optional[int]:
+        async with session_factory() as session:
+            return await user_crud.get_data_version(session, user_id) # type: ignore
+
+    async def events():
+        queue = event_hub.subscribe(user_id) # type: ignore
+        try:
+            yield "retry: 5000\n\n"
+            last_sent = None
+            version = await current_version()
+            while version is not None:
+                if version != last_sent:
+                    last_sent = version
+                    yield f"event: changed\ndata: {json.dumps({'token': version})}\n\n"
+                try:
+                    version = await asyncio.wait_for(queue.get(), timeout=settings.SSE_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": heartbeat\n\n"
+                    # Also catches changes made on other replicas; None once the account is deleted
+                    version = await current_version()
+        finally:
+            event_hub.unsubscribe(user_id, queue) # type: ignore
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.get("/archive", status_code=status.HTTP_200_OK)
+async def stream_archived_items(current_user: User = Depends(get_current_user)):
+    """Stream the user's archived items as NDJSON, most recently archived first.
+
+    Items done and older than the retention period are moved to the archive
+    by the cleanup job. The whole history is streamed chunk by chunk, one
+    JSON object per line, so it is never held in memory.
+
+    Args:
+        current_user: Current authenticated user
+
+    Returns:
+        Streaming application/x-ndjson response
+    """
+    user_id = current_user.id
+
+    async def ndjson():
+        # Own session: the stream outlives the request handler
+        async with session_factory() as session:
+            async for chunk in archive_crud.iter_archived_items(session, user_id):
+                yield "".join(ArchivedItemResponse.model_validate(item).model_dump_json() + "\n" for item in chunk)
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
+@router.get("/export", status_code=status.HTTP_200_OK)
+async def export_items(
+    format: Literal["ndjson", "csv"] = Query("ndjson"),
+    current_user: User = Depends(get_current_user)
+):
+    """Export all of the user's items as NDJSON or CSV.
+
+    The export is streamed from a server-side cursor: memory use stays
+    constant and the first rows are sent before the whole account is read.
+
+    Args:
+        format: ndjson (one JSON object per line) or csv (with a header row)
+        current_user: Current authenticated user
+
+    Returns:
+        Streaming application/x-ndjson or text/csv attachment
+    """
+    user_id = current_user.id
+    columns = list(ExportedItemResponse.model_fields)
+
+    def to_ndjson(rows) -> str:
+        return "".join(ExportedItemResponse.model_validate(row).model_dump_json() + "\n" for row in rows)
+
+    def to_csv(rows) -> str:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            record = ExportedItemResponse.model_validate(row).model_dump(mode="json")
+            writer.writerow([record[column] for column in columns])
+        return buffer.getvalue()
+
+    async def export():
+        if format == "csv":
+            buffer = io.StringIO()
+            csv.writer(buffer).writerow(columns)
+            yield buffer.getvalue()
+        # Own session: the stream outlives the request handler
+        async with session_factory() as session:
+            async for rows in tracking_item_crud.iter_export_rows(session, user_id): # type: ignore
+                yield to_csv(rows) if format == "csv" else to_ndjson(rows)
+
+    return StreamingResponse(
+        export(),
+        media_type="text/csv" if format == "csv" else "application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="timekeeper-items.{format}"'}
     )
 
 
+@router.get("/calendar.ics", status_code=status.HTTP_200_OK)
+async def get_calendar_feed(
+    request: Request,
+    token: str = Query(..., min_length=1),
+    session: AsyncSession = Depends(get_session)
+):
+    """iCalendar feed of the user's upcoming items, for calendar subscriptions.
+
+    Authenticated by the feed token in the URL (see POST /items/calendar/token),
+    as calendar apps cannot send headers. The rendered feed is cached per user
+    and dropped when the user's items or categories change, so polls of an
+    unchanged feed do not query the database. Supports If-None-Match and
+    If-Modified-Since (304 Not Modified).
+
+    Args:
+        request: Incoming request
+        token: Feed token
+        session: Database session
+
+    Returns:
+        text/calendar response
+
+    Raises:
+        HTTPException: If the token is unknown or revoked
+    """
+    user_id = await calendarFeed.resolve_token(session, token)
+    if user_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Calendar feed not found"
+        )
+
+    feed = await calendarFeed.get_feed(session, user_id)
+    headers = {
+        "ETag": feed.etag,
+        "Last-Modified": format_datetime(feed.last_modified, usegmt=True),
+        "Cache-Control": "private, no-cache"
+    }
+    if_none_match = request.headers.get("if-none-match")
+    if etag_matches(if_none_match, feed.etag) or (
+        if_none_match is None and not_modified_since(request.headers.get("if-modified-since"), feed.last_modified)
+    ):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(feed.body, media_type="text/calendar", headers=headers)
+
+
+@router.post("/calendar/token", response_model=CalendarTokenResponse, status_code=status.HTTP_201_CREATED)
+async def create_calendar_token(
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session)
+):
+    """Enable the calendar feed, or replace its URL if it is already enabled.
+
+    The token is only returned here; the previous URL stops working.
+
+    Args:
+        request: Incoming request
+        current_user: Current authenticated user
+        session: Database session
+
+    Returns:
+        Feed token and the feed URL to subscribe to
+    """
+    token = await calendarFeed.rotate_token(session, current_user.id) # type: ignore
+    url = request.url_for("get_calendar_feed").include_query_params(token=token)
+    return CalendarTokenResponse(token=token, url=str(url))
+
+
+@router.delete("/calendar/token", status_code=status.HTTP_200_OK)
+async def delete_calendar_token(
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session)
+):
+    """Disable the calendar feed.
+
+    Args:
+        current_user: Current authenticated user
+        session: Database session
+
+    Returns:
+        Success message
+    """
+    await calendarFeed.revoke_token(session, current_user.id) # type: ignore
+    return {"message": "Calendar feed disabled"}
+
+
 @router.post("", response_model=TrackingItemResponse, status_code=status.HTTP_201_CREATED)
 async def create_item(
     item_data: TrackingItemCreate,
     current_user: User = Depends(get_current_user),
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ):
     """Create a new tracking item.
 
@@ -96,9 +594,134 @@ async def create_item(
 
     Returns:
         Created tracking item
+
+    Raises:
+        HTTPException: If the category is not available to the user
+    """
+    await _ensure_category_available(session, current_user.id, item_data.category_id)
+
+    item = await tracking_item_crud.create_item(session, current_user.id, item_data)
+    return (await _to_responses(session, current_user.id, [item]))[0]
+
+
+@router.post("/batch", response_model=ItemBatchResponse, status_code=status.HTTP_200_OK)
+async def apply_item_batch(
+    batch: ItemBatchRequest,
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session)
+):
+    """Create, update and delete several tracking items in one request.
+
+    Operations are validated in one pass (categories against the category
+    cache, items with a single read) and the valid ones are applied in one
+    transaction with bulk statements. Each operation gets its own result,
+    in request order, with the status code the single-item endpoint would
+    have answered; a refused operation does not stop the others.
+
+    Args:
+        batch: Operations to apply (at most ITEM_BATCH_MAX_OPERATIONS)
+        current_user: Current authenticated user
+        session: Database session
+
+    Returns:
+        Number of applied operations and per-operation results
+    """
+    user_id = current_user.id
+    operations = batch.operations
+
+    def category_id(operation) -> Optional[int]:
+        if operation.op == "create":
+            return operation.item.category_id
+        if operation.op == "update":
+            return operation.changes.category_id
+        return None
+
+    available = await category_crud.resolve_categories(
+        session, user_id, {category_id(operation) for operation in operations} - {None}
+    )
+    results: List[Optional[ItemBatchResult]] = [None] * len(operations)
+    pending = []
+    for index, operation in enumerate(operations):
+        if category_id(operation) not in (None, *available):
+            results[index] = ItemBatchResult(
+                index=index, op=operation.op, status=status.HTTP_400_BAD_REQUEST, id=operation.id, detail="Category not found"
+            )
+        else:
+            pending.append(index)
+
+    outcomes = await tracking_item_crud.apply_item_batch(session, user_id, [operations[index] for index in pending]) # type: ignore
+    responses = iter(await _to_responses(session, user_id, [outcome.item for outcome in outcomes if outcome.item is not None])) # type: ignore
+
+    applied = 0
+    for index, outcome in zip(pending, outcomes):
+        op = operations[index].op
+        if outcome.error:
+            status_code, detail = BATCH_ERRORS[outcome.error]
+            results[index] = ItemBatchResult(index=index, op=op, status=status_code, id=outcome.item_id, detail=detail)
+        else:
+            applied += 1
+            results[index] = ItemBatchResult(
+                index=index,
+                op=op,
+                status=status.HTTP_201_CREATED if op == "create" else status.HTTP_200_OK,
+                id=outcome.item_id,
+                item=next(responses) if outcome.item is not None else None
+            )
+
+    return ItemBatchResponse(applied=applied, results=results) # type: ignore
+
+
+@router.post("/import", response_model=ItemImportResponse, status_code=status.HTTP_200_OK)
+async def import_items(
+    request: Request,
+    format: Literal["csv", "ics"] = Query("csv"),
+    default_category: Optional[str] = Query(None, max_length=100),
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session)
+):
+    """Import items from a CSV or iCalendar file sent as the request body.
+
+    CSV needs a header row with title, category (or category_name) and
+    reminder_date columns, description and is_done are optional; an export
+    can be imported as is, done items stay done. From iCalendar, every VEVENT becomes an item (SUMMARY,
+    DTSTART, DESCRIPTION, first of CATEGORIES).
+
+    The body is parsed as it arrives and imported in chunks of
+    IMPORT_CHUNK_SIZE rows, each validated, resolved to categories
+    (unknown names become new categories) and bulk inserted in one
+    transaction. Invalid rows are reported with their line number and
+    skipped. Files larger than IMPORT_MAX_UPLOAD_BYTES are refused.
+
+    Args:
+        request: Request whose body is the file
+        format: csv or ics
+        default_category: Category name for rows or events without one
+        current_user: Current authenticated user
+        session: Database session
+
+    Returns:
+        Number of imported and rejected rows, created categories and per-row errors
+
+    Raises:
+        HTTPException: 400 if the file cannot be parsed at all (e.g. bad CSV
+            header), 413 if it is larger than IMPORT_MAX_UPLOAD_BYTES
     """
-    item = tracking_item_crud.create_item(session, current_user.id, item_data)
-    return TrackingItemResponse.from_orm(item)
+    lines = itemImport.iter_lines(_read_upload(request, settings.IMPORT_MAX_UPLOAD_BYTES))
+    rows = itemImport.iter_csv_rows(lines) if format == "csv" else itemImport.iter_ics_rows(lines)
+    try:
+        result = await itemImport.import_items(session, current_user.id, rows, default_category) # type: ignore
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    return ItemImportResponse(
+        imported=result.imported,
+        failed=len(result.errors),
+        created_categories=result.created_categories,
+        errors=[ItemImportError(line=line, detail=detail) for line, detail in result.errors]
+    )
 
 
 @router.put("/{item_id}", response_model=TrackingItemResponse, status_code=status.HTTP_200_OK)
@@ -106,7 +729,7 @@ async def update_item(
     item_id: int,
     item_data: TrackingItemUpdate,
     current_user: User = Depends(get_current_user),
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ):
     """Update a tracking item (only if is_done=False).
 
@@ -120,48 +743,26 @@ async def update_item(
         Updated tracking item
 
     Raises:
-        HTTPException: If item not found, not owned by user, or already completed
+        HTTPException: If item not found, not owned by user, already completed,
+            or the new category is not available to the user
     """
-    # Check if item exists
-    item = tracking_item_crud.get_item_by_id(session, item_id)
+    if item_data.category_id is not None:
+        await _ensure_category_available(session, current_user.id, item_data.category_id)
 
-    if not item:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Item not found"
-        )
-
-    # Check ownership
-    if item.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to modify this item"
-        )
-
-    # Check if item is done
-    if item.is_done:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Cannot modify completed items"
-        )
-
-    # Update item
-    updated_item = tracking_item_crud.update_item(session, item_id, current_user.id, item_data)
+    user_id = current_user.id
+    updated_item = await tracking_item_crud.update_item(session, item_id, user_id, item_data)
 
     if not updated_item:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Failed to update item"
-        )
+        await _raise_refused_write(session, user_id, item_id, "modify")
 
-    return TrackingItemResponse.from_orm(updated_item)
+    return (await _to_responses(session, user_id, [updated_item]))[0]
 
 
 @router.delete("/{item_id}", status_code=status.HTTP_200_OK)
 async def delete_item(
     item_id: int,
     current_user: User = Depends(get_current_user),
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ):
     """Delete a tracking item (only if is_done=False).
 
@@ -176,37 +777,11 @@ async def delete_item(
     Raises:
         HTTPException: If item not found, not owned by user, or already completed
     """
-    # Check if item exists
-    item = tracking_item_crud.get_item_by_id(session, item_id)
-
-    if not item:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Item not found"
-        )
-
-    # Check ownership
-    if item.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to delete this item"
-        )
-
-    # Check if item is done
-    if item.is_done:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Cannot delete completed items"
-        )
-
-    # Delete item
-    success = tracking_item_crud.delete_item(session, item_id, current_user.id)
+    user_id = current_user.id
+    success = await tracking_item_crud.delete_item(session, item_id, user_id)
 
     if not success:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Failed to delete item"
-        )
+        await _raise_refused_write(session, user_id, item_id, "delete")
 
     return {"message": "Item deleted successfully"}
 
@@ -216,7 +791,7 @@ async def recreate_item(
     item_id: int,
     recreate_data: TrackingItemRecreate,
     current_user: User = Depends(get_current_user),
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ):
     """Recreate a tracking item with a new date.
 
@@ -234,31 +809,10 @@ async def recreate_item(
     Raises:
         HTTPException: If item not found or not owned by user
     """
-    # Check if item exists
-    item = tracking_item_crud.get_item_by_id(session, item_id)
-
-    if not item:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Item not found"
-        )
-
-    # Check ownership
-    if item.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to recreate this item"
-        )
-
-    # Recreate item
-    new_item = tracking_item_crud.recreate_item(
-        session, item_id, current_user.id, recreate_data.reminder_date
-    )
+    user_id = current_user.id
+    new_item = await tracking_item_crud.recreate_item(session, item_id, user_id, recreate_data.reminder_date)
 
     if not new_item:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Failed to recreate item"
-        )
+        await _raise_refused_write(session, user_id, item_id, "recreate", check_done=False)
 
-    return TrackingItemResponse.from_orm(new_item)
+    return (await _to_responses(session, user_id, [new_item]))[0]
@@ -1,11 +1,12 @@
 """User Account API endpoints."""
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from app.services.database import get_session
-from app.dependencies import get_current_user
+from app.dependencies import get_current_user, invalidate_cached_user
+from app.services import calendarFeed
 from app.schemas import DeleteAccountConfirm
-from app.crud import otp as otp_crud, user as user_crud, category as category_crud, tracking_item as tracking_item_crud
+from app.crud import otp as otp_crud, user as user_crud, category as category_crud, tracking_item as tracking_item_crud, tracking_item_archive as archive_crud, tracking_item_tombstone as tombstone_crud, user_item_stats as stats_crud
 from app.models import User
 
 router = APIRouter(prefix="/user", tags=["User Account"])
@@ -14,7 +15,7 @@ router = APIRouter(prefix="/user", tags=["User Account"])
 @router.delete("/delete-account", status_code=status.HTTP_200_OK)
 async def request_account_deletion(
     current_user: User = Depends(get_current_user),
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ):
     """Request account deletion by sending OTP.
 
@@ -26,7 +27,7 @@ async def request_account_deletion(
         Success message
     """
     # Create OTP for account deletion confirmation
-    otp = otp_crud.create_otp(session, current_user.email)
+    otp = await otp_crud.create_otp(session, current_user.email)
 
     # TODO: Send OTP via notification service
     # For now, print to console
@@ -42,7 +43,7 @@ async def request_account_deletion(
 async def confirm_account_deletion(
     confirmation: DeleteAccountConfirm,
     current_user: User = Depends(get_current_user),
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ):
     """Confirm account deletion with OTP and delete user account.
 
@@ -64,7 +65,7 @@ async def confirm_account_deletion(
         HTTPException: If OTP is invalid or expired
     """
     # Verify OTP
-    is_valid = otp_crud.verify_otp(session, current_user.email, confirmation.otp_code)
+    is_valid = await otp_crud.verify_otp(session, current_user.email, confirmation.otp_code)
 
     if not is_valid:
         raise HTTPException(
@@ -74,16 +75,22 @@ async def confirm_account_deletion(
 
     # Delete user-related data
     # 1. Delete user's tracking items
-    tracking_item_crud.delete_user_tracking_items(session, current_user.id)
+    await tracking_item_crud.delete_user_tracking_items(session, current_user.id)
+
+    await archive_crud.delete_user_archived_items(session, current_user.id)
+    await tombstone_crud.delete_user_tombstones(session, current_user.id)
+    await stats_crud.delete_user_item_stats(session, current_user.id)
 
     # 2. Delete user's custom categories
-    category_crud.delete_user_categories(session, current_user.id)
+    await category_crud.delete_user_categories(session, current_user.id)
 
     # 3. Delete user's OTPs
-    otp_crud.delete_user_otps(session, current_user.email)
+    await otp_crud.delete_user_otps(session, current_user.email)
 
     # 4. Delete user account
-    user_crud.delete_user(session, current_user.id)
+    await user_crud.delete_user(session, current_user.id)
+    invalidate_cached_user(current_user.id)
+    calendarFeed.forget_user(current_user.id)
 
     return {
         "message": "Account deleted successfully"
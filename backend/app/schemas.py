@@ -2,11 +2,28 @@
 
 import re
 from datetime import date, datetime
-from typing import Optional
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from typing import List, Literal, Optional
+from pydantic import BaseModel, EmailStr, Field, field_validator, model_validator
 from app.services.settings import settings
 
 
+def sanitize_text(v: Optional[str]) -> Optional[str]:
+    """Strip a free-text field and reject markup."""
+    if v is None:
+        return v
+    v = v.strip()
+    # Basic XSS prevention
+    if '<' in v or '>' in v or 'script' in v.lower():
+        raise ValueError('Invalid characters detected')
+    return v
+
+
+def sanitize_category_name(v: str) -> str:
+    """Strip a category name and reject anything but alphanumerics, spaces, - and _."""
+    v = v.strip()
+    if not re.match(r'^[a-zA-Z0-9\s\-_]+$', v):
+        raise ValueError('Category can contain alphnumeric characters only')
+    return v
 
 
 # ============= Auth Schemas =============
@@ -52,10 +69,7 @@ class CategoryCreateOrUpdate(BaseModel):
 
     @field_validator('name')
     def sanitize_name(cls, v):
-        v = v.strip()
-        if not re.match(r'^[a-zA-Z0-9\s\-_]+$', v):
-            raise ValueError('Category can contain alphnumeric characters only')
-        return v
+        return sanitize_category_name(v)
 
 
 class CategoryResponse(BaseModel):
@@ -81,13 +95,7 @@ class TrackingItemCreate(BaseModel):
 
     @field_validator('title', 'description')
     def sanitize_string(cls, v):
-        if v is None:
-            return v
-        v = v.strip()
-        # Basic XSS prevention
-        if '<' in v or '>' in v or 'script' in v.lower():
-            raise ValueError('Invalid characters detected')
-        return v
+        return sanitize_text(v)
 
 
 class TrackingItemUpdate(BaseModel):
@@ -99,13 +107,7 @@ class TrackingItemUpdate(BaseModel):
 
     @field_validator('title', 'description')
     def sanitize_string(cls, v):
-        if v is None:
-            return v
-        v = v.strip()
-        # Basic XSS prevention
-        if '<' in v or '>' in v or 'script' in v.lower():
-            raise ValueError('Invalid characters detected')
-        return v
+        return sanitize_text(v)
 
 
 class TrackingItemRecreate(BaseModel):
@@ -113,6 +115,49 @@ class TrackingItemRecreate(BaseModel):
     reminder_date: date
 
 
+class ItemImportRow(BaseModel):
+    """One row of an item import; the category is given by name."""
+    title: str = Field(..., min_length=1, max_length=255)
+    category: str = Field(..., min_length=1, max_length=100)
+    reminder_date: date
+    description: Optional[str] = Field(None, max_length=1000)
+    is_done: bool = False
+
+    @field_validator('title', 'description')
+    def sanitize_string(cls, v):
+        return sanitize_text(v)
+
+    @field_validator('category')
+    def sanitize_category(cls, v):
+        return sanitize_category_name(v)
+
+
+class ItemBatchOperation(BaseModel):
+    """One operation of a batch request.
+
+    create takes item, update takes id and changes, delete takes id.
+    """
+    op: Literal["create", "update", "delete"]
+    id: Optional[int] = Field(None, gt=0)
+    item: Optional[TrackingItemCreate] = None
+    changes: Optional[TrackingItemUpdate] = None
+
+    @model_validator(mode='after')
+    def check_operands(self) -> 'ItemBatchOperation':
+        if self.op == "create" and self.item is None:
+            raise ValueError("create requires item")
+        if self.op != "create" and self.id is None:
+            raise ValueError(f"{self.op} requires id")
+        if self.op == "update" and self.changes is None:
+            raise ValueError("update requires changes")
+        return self
+
+
+class ItemBatchRequest(BaseModel):
+    """Request schema for applying several item operations at once."""
+    operations: List[ItemBatchOperation] = Field(..., min_length=1, max_length=settings.ITEM_BATCH_MAX_OPERATIONS)
+
+
 class TrackingItemResponse(BaseModel):
     """Response schema for tracking item."""
     id: int
@@ -123,12 +168,42 @@ class TrackingItemResponse(BaseModel):
     description: Optional[str] = None
     is_done: bool
     created_at: datetime
+    updated_at: Optional[datetime] = None
     category: CategoryResponse
 
     class Config:
         from_attributes = True
 
 
+class ArchivedItemResponse(BaseModel):
+    """Response schema for an archived tracking item (id is the item's original id)."""
+    id: int = Field(..., validation_alias="item_id")
+    title: str
+    category_name: str
+    reminder_date: date
+    description: Optional[str] = None
+    created_at: datetime
+    archived_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class ExportedItemResponse(BaseModel):
+    """Row schema for exported tracking items (NDJSON objects and CSV columns)."""
+    id: int
+    title: str
+    category_name: str
+    reminder_date: date
+    description: Optional[str] = None
+    is_done: bool
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
 class PaginatedResponse(BaseModel):
     """Generic paginated response schema."""
     items: list
@@ -136,3 +211,77 @@ class PaginatedResponse(BaseModel):
     page: int
     pages: int
     page_size: int
+    next_cursor: Optional[str] = None
+
+
+class ItemChangesResponse(BaseModel):
+    """Response schema for delta sync of tracking items.
+
+    A reset snapshot spanning several pages has token None and a next_cursor
+    on every page but the last.
+    """
+    token: Optional[int] = None
+    reset: bool
+    items: list
+    deleted: list[int]
+    next_cursor: Optional[str] = None
+
+
+class CategoryItemStats(BaseModel):
+    """Item counts of one category."""
+    category_id: int
+    category_name: Optional[str] = None
+    pending: int
+    done: int
+
+
+class MonthItemStats(BaseModel):
+    """Item counts of one reminder month (YYYY-MM)."""
+    month: str
+    pending: int
+    done: int
+
+
+class ItemStatsResponse(BaseModel):
+    """Response schema for a user's item counts, overall, per category and per reminder month."""
+    total: int
+    pending: int
+    done: int
+    by_category: List[CategoryItemStats]
+    by_month: List[MonthItemStats]
+
+
+class ItemBatchResult(BaseModel):
+    """Outcome of one operation of a batch request."""
+    index: int
+    op: str
+    status: int
+    id: Optional[int] = None
+    item: Optional[TrackingItemResponse] = None
+    detail: Optional[str] = None
+
+
+class ItemBatchResponse(BaseModel):
+    """Response schema for a batch request, one result per operation in request order."""
+    applied: int
+    results: List[ItemBatchResult]
+
+
+class ItemImportError(BaseModel):
+    """A rejected row of an item import."""
+    line: int
+    detail: str
+
+
+class ItemImportResponse(BaseModel):
+    """Response schema for an item import."""
+    imported: int
+    failed: int
+    created_categories: List[str]
+    errors: List[ItemImportError]
+
+
+class CalendarTokenResponse(BaseModel):
+    """Response schema for a new calendar feed token."""
+    token: str
+    url: str
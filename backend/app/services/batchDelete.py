@@ -0,0 +1,89 @@
+"""Set-based deletes in primary key ranged, separately committed batches."""
+
+import logging
+import time
+from typing import Any, Callable, List, Optional, Sequence, Type
+from sqlalchemy.sql import Executable
+from sqlmodel import SQLModel, select, delete
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.internalModels import BatchDeleteResult
+
+
+logger = logging.getLogger(__name__)
+
+
+async def delete_in_batches(
+    session: AsyncSession,
+    model: Type[SQLModel],
+    *conditions: Any,
+    batch_size: int,
+    time_budget_seconds: Optional[float] = None,
+    before_delete: Optional[Callable[[List[Any]], Sequence[Executable]]] = None
+) -> BatchDeleteResult:
+    """Delete the rows of `model` matching `conditions` with batched DELETE statements.
+
+    Rows are walked in primary key order. Each batch looks up the key of its
+    last matching row, deletes the matching rows in that key range with one
+    DELETE ... WHERE and commits, so no transaction ever spans more than
+    `batch_size` rows and no row is loaded into the ORM.
+
+    `before_delete` receives the WHERE conditions of a batch and returns
+    statements that run in the same transaction just before its DELETE, e.g.
+    an INSERT ... SELECT copying the rows elsewhere.
+
+    When the time budget runs out, the remaining rows are left for the next
+    run and the result is marked incomplete.
+
+    Args:
+        session: Database session
+        model: Table model with an integer `id` primary key
+        *conditions: WHERE conditions selecting the rows to delete
+        batch_size: Maximum number of rows deleted per statement
+        time_budget_seconds: Stop starting new batches after this long; None for no limit
+        before_delete: Builds the statements to run before each batch's DELETE
+
+    Returns:
+        BatchDeleteResult with the number of rows deleted and the throughput
+    """
+    primary_key = model.id # type: ignore
+    started = time.monotonic()
+    deleted = 0
+    batches = 0
+    last_id = None
+    completed = False
+
+    while True:
+        key_range = [primary_key > last_id] if last_id is not None else []
+
+        # Key of the batch_size-th matching row, None when fewer remain
+        upper_statement = select(primary_key).where(*conditions, *key_range).order_by(
+            primary_key
+        ).offset(batch_size - 1).limit(1)
+        upper_id = (await session.exec(upper_statement)).first()
+        if upper_id is not None:
+            key_range.append(primary_key <= upper_id)
+
+        if before_delete is not None:
+            for statement in before_delete([*conditions, *key_range]):
+                await session.exec(statement) # type: ignore
+        result = await session.exec(delete(model).where(*conditions, *key_range)) # type: ignore
+        await session.commit()
+        deleted += result.rowcount
+        batches += 1
+
+        if upper_id is None:
+            completed = True
+            break
+        last_id = upper_id
+
+        if time_budget_seconds is not None and time.monotonic() - started >= time_budget_seconds:
+            logger.warning(f"Time budget of {time_budget_seconds}s exhausted while deleting from {model.__tablename__}, resuming next run")
+            break
+
+    return BatchDeleteResult(
+        table=str(model.__tablename__),
+        deleted=deleted,
+        batches=batches,
+        elapsed_seconds=time.monotonic() - started,
+        completed=completed
+    )
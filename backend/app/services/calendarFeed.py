@@ -0,0 +1,207 @@
+"""Per-user iCalendar feed of upcoming items, rendered once and cached."""
+
+import collections
+import hashlib
+import secrets
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Counter, Dict, Iterable, List, Optional
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.crud import tracking_item as tracking_item_crud, user as user_crud
+from app.internalModels import CalendarFeed
+from app.services.cache import TTLCache
+from app.services.etagUtil import make_etag
+from app.services.eventHub import event_hub
+from app.services.settings import settings
+
+# Content lines are folded at this many octets (RFC 5545, section 3.1)
+MAX_LINE_OCTETS = 75
+
+# User ID -> rendered feed; dropped on every change published by this process
+_feeds: TTLCache[int, CalendarFeed] = TTLCache(
+    settings.CALENDAR_FEED_CACHE_MAX_USERS, settings.CALENDAR_FEED_CACHE_TTL_SECONDS
+)
+# SHA-256 of a feed token -> user ID
+_token_owners: TTLCache[str, int] = TTLCache(settings.AUTH_CACHE_MAX_SIZE, settings.AUTH_CACHE_TTL_SECONDS)
+# User ID -> invalidations of the user's feed, tracked while renderings of it are in flight;
+# a rendering that raced with an invalidation is not cached
+_generations: Dict[int, int] = {}
+_renders_in_flight: Counter[int] = collections.Counter()
+
+
+def _hash_token(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def _invalidate(user_id: int, _data_version: Optional[int] = None) -> None:
+    if user_id in _generations:
+        _generations[user_id] += 1
+    _feeds.delete(user_id)
+
+
+event_hub.add_listener(_invalidate)
+
+
+def forget_user(user_id: int) -> None:
+    """Drop a user's feed and feed tokens from the caches (token rotated or revoked, user deleted).
+
+    Args:
+        user_id: User's ID
+    """
+    _token_owners.delete_where(lambda _, owner: owner == user_id)
+    _invalidate(user_id)
+
+
+async def rotate_token(session: AsyncSession, user_id: int) -> str:
+    """Issue a new feed token for a user; the previous one stops working.
+
+    Only a hash of the token is stored, so it cannot be shown again.
+
+    Args:
+        session: Database session
+        user_id: User's ID
+
+    Returns:
+        New token
+    """
+    token = secrets.token_urlsafe(32)
+    await user_crud.set_calendar_token_hash(session, user_id, _hash_token(token))
+    forget_user(user_id)
+    return token
+
+
+async def revoke_token(session: AsyncSession, user_id: int) -> None:
+    """Disable a user's feed.
+
+    Args:
+        session: Database session
+        user_id: User's ID
+    """
+    await user_crud.set_calendar_token_hash(session, user_id, None)
+    forget_user(user_id)
+
+
+async def resolve_token(session: AsyncSession, token: str) -> Optional[int]:
+    """Get the user a feed token belongs to, from the cache when possible.
+
+    Args:
+        session: Database session
+        token: Token from the feed URL
+
+    Returns:
+        User ID, None if the token is unknown or revoked
+    """
+    key = _hash_token(token)
+    user_id = _token_owners.get(key)
+    if user_id is None:
+        user_id = await user_crud.get_user_id_by_calendar_token_hash(session, key)
+        if user_id is None:
+            return None
+        _token_owners.set(key, user_id)
+    return user_id
+
+
+def _escape(value: str) -> str:
+    """Apply iCalendar TEXT escaping."""
+    return (
+        value.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+        .replace("\r\n", "\\n").replace("\n", "\\n")
+    )
+
+
+def _fold(line: str) -> str:
+    """Fold a content line into chunks of at most MAX_LINE_OCTETS octets, never splitting a character."""
+    if len(line.encode()) <= MAX_LINE_OCTETS:
+        return line
+    parts: List[str] = []
+    current, size = "", 0
+    for char in line:
+        octets = len(char.encode())
+        # Continuation lines start with a space, which counts towards the limit
+        if size + octets > MAX_LINE_OCTETS - (1 if parts else 0):
+            parts.append(current)
+            current, size = "", 0
+        current += char
+        size += octets
+    parts.append(current)
+    return "\r\n ".join(parts)
+
+
+def _utc_stamp(value: datetime) -> str:
+    # Stored times are naive local times
+    return value.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def render_calendar(items: Iterable[Any]) -> str:
+    """Render items as an iCalendar document with one all-day event per item.
+
+    Args:
+        items: Rows with id, title, category_name, reminder_date, description and updated_at
+
+    Returns:
+        iCalendar text (CRLF line endings)
+    """
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        "PRODID:-//TimeKeeper//Reminders//EN",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        "X-WR-CALNAME:TimeKeeper",
+    ]
+    for item in items:
+        lines += [
+            "BEGIN:VEVENT",
+            f"UID:item-{item.id}@timekeeper",
+            f"DTSTAMP:{_utc_stamp(item.updated_at)}",
+            f"LAST-MODIFIED:{_utc_stamp(item.updated_at)}",
+            f"DTSTART;VALUE=DATE:{item.reminder_date.strftime('%Y%m%d')}",
+            f"DTEND;VALUE=DATE:{(item.reminder_date + timedelta(days=1)).strftime('%Y%m%d')}",
+            f"SUMMARY:{_escape(item.title)}",
+            f"CATEGORIES:{_escape(item.category_name)}",
+        ]
+        if item.description:
+            lines.append(f"DESCRIPTION:{_escape(item.description)}")
+        lines += ["TRANSP:TRANSPARENT", "END:VEVENT"]
+    lines.append("END:VCALENDAR")
+    return "".join(_fold(line) + "\r\n" for line in lines)
+
+
+async def get_feed(session: AsyncSession, user_id: int) -> CalendarFeed:
+    """Get a user's feed, rendering it only if it is not cached.
+
+    A cached feed is reused until the user's data changes (in this process),
+    the date changes (the feed only lists upcoming items) or it expires.
+
+    Args:
+        session: Database session
+        user_id: User's ID
+
+    Returns:
+        CalendarFeed with body, ETag (derived from the body) and Last-Modified
+    """
+    today = date.today()
+    feed = _feeds.get(user_id)
+    if feed is not None and feed.day == today:
+        return feed
+
+    generation = _generations.setdefault(user_id, 0)
+    _renders_in_flight[user_id] += 1
+    try:
+        body = render_calendar(await tracking_item_crud.get_calendar_items(session, user_id))
+    finally:
+        current_generation = _generations[user_id]
+        _renders_in_flight[user_id] -= 1
+        if not _renders_in_flight[user_id]:
+            del _renders_in_flight[user_id], _generations[user_id]
+
+    etag = make_etag(body)
+    if feed is not None and feed.etag == etag:
+        # Same content (e.g. re-rendered on the next day): keep the validator stable
+        last_modified = feed.last_modified
+    else:
+        last_modified = datetime.now(timezone.utc).replace(microsecond=0)
+
+    feed = CalendarFeed(today, etag, last_modified, body)
+    if generation == current_generation:
+        _feeds.set(user_id, feed)
+    return feed
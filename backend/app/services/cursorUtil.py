@@ -0,0 +1,93 @@
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, List, Tuple
+from fastapi import HTTPException, status
+
+
+def _encode(values: List[Any]) -> str:
+    payload = json.dumps(values, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _decode(cursor: str) -> Any:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded.encode()))
+
+
+def _invalid_cursor() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Invalid cursor"
+    )
+
+
+def encode_cursor(sort_value: date | datetime, item_id: int) -> str:
+    """Encode a keyset position into an opaque cursor token.
+
+    Args:
+        sort_value: Value of the sort column of the last item on the page
+        item_id: ID of the last item on the page (tie-breaker)
+
+    Returns:
+        URL-safe cursor string
+    """
+    return _encode([sort_value.isoformat(), item_id])
+
+
+def decode_cursor(cursor: str, value_type: type) -> Tuple[Any, int]:
+    """Decode a cursor token created by encode_cursor.
+
+    Args:
+        cursor: Cursor string received from the client
+        value_type: Expected type of the sort value (date or datetime)
+
+    Returns:
+        Tuple of (sort_value, item_id)
+
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    try:
+        raw_value, item_id = _decode(cursor)
+        sort_value = value_type.fromisoformat(raw_value)
+        if not isinstance(item_id, int):
+            raise ValueError("cursor id must be an integer")
+        return sort_value, item_id
+    except (ValueError, TypeError, json.JSONDecodeError):
+        raise _invalid_cursor()
+
+
+def encode_snapshot_cursor(token: int, sync_version: int, item_id: int) -> str:
+    """Encode a position in a paged sync snapshot into an opaque cursor token.
+
+    Args:
+        token: Sync token the snapshot was started at
+        sync_version: sync_version of the last item on the page
+        item_id: ID of the last item on the page (tie-breaker)
+
+    Returns:
+        URL-safe cursor string
+    """
+    return _encode([token, sync_version, item_id])
+
+
+def decode_snapshot_cursor(cursor: str) -> Tuple[int, int, int]:
+    """Decode a cursor token created by encode_snapshot_cursor.
+
+    Args:
+        cursor: Cursor string received from the client
+
+    Returns:
+        Tuple of (token, sync_version, item_id)
+
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    try:
+        token, sync_version, item_id = _decode(cursor)
+        if not all(isinstance(value, int) for value in (token, sync_version, item_id)):
+            raise ValueError("cursor values must be integers")
+        return token, sync_version, item_id
+    except (ValueError, TypeError, json.JSONDecodeError):
+        raise _invalid_cursor()
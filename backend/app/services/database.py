@@ -1,30 +1,79 @@
+import asyncio
 import logging
-import time
-from sqlmodel import create_engine, Session, text
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlmodel import text
+from sqlmodel.ext.asyncio.session import AsyncSession
 from app.services.settings import settings
 
 
 logger = logging.getLogger(__name__)
-engine = create_engine(
-    settings.DATABASE_URL, # type: ignore
+
+# Async driver used for each backend when DATABASE_URL names a sync one
+ASYNC_DRIVERS = {
+    "sqlite": "aiosqlite",
+    "postgresql": "asyncpg",
+    "postgres": "asyncpg",
+}
+
+
+def to_async_database_url(url: str) -> str:
+    """Rewrite a database URL to use an asyncio driver.
+
+    DATABASE_URL stays a plain (sync) URL so Alembic can keep using it, e.g.
+    sqlite:///./timekeeper.db becomes sqlite+aiosqlite:///./timekeeper.db and
+    postgresql://... becomes postgresql+asyncpg://...
+
+    Args:
+        url: Configured database URL
+
+    Returns:
+        Database URL with an async driver
+    """
+    scheme, separator, rest = url.partition("://")
+    dialect, _, driver = scheme.partition("+")
+    if dialect not in ASYNC_DRIVERS or driver in ("aiosqlite", "asyncpg", "psycopg"):
+        return url
+    return f"{'postgresql' if dialect == 'postgres' else dialect}+{ASYNC_DRIVERS[dialect]}{separator}{rest}"
+
+
+def _engine_options(url: str) -> dict:
+    if url.startswith("sqlite"):
+        return {}
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_pre_ping": True,
+    }
+
+
+engine = create_async_engine(
+    to_async_database_url(settings.DATABASE_URL), # type: ignore
     echo=False,
-    connect_args={"check_same_thread": False} if settings.DATABASE_URL.startswith("sqlite") else {} # type: ignore
+    **_engine_options(settings.DATABASE_URL) # type: ignore
 )
 
+# Objects stay usable after commit; lazy refreshes are not possible under asyncio
+session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+def dialect_name(session: AsyncSession) -> str:
+    """Name of the database backend a session talks to (e.g. "sqlite", "postgresql")."""
+    return session.get_bind().dialect.name
+
 
-def get_session():
-    with Session(engine) as session:
+async def get_session():
+    async with session_factory() as session:
         yield session
 
 
-def isDbHealthy(retries: int = 3, delay: int = 3) -> bool:
+async def isDbHealthy(retries: int = 3, delay: int = 3) -> bool:
     for i in range(retries):
         try:
-            with engine.connect() as conn:
-                conn.execute(text("SELECT 1"))
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
                 return True
         except Exception as e:
             logger.error(f"DB health check attempt {i+1} failed for error {e}")
-            time.sleep(delay)
+            await asyncio.sleep(delay)
     logger.error("Could not connect to database. Check logs for details.")
-    return False
\ No newline at end of file
+    return False
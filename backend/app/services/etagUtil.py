@@ -0,0 +1,60 @@
+"""ETag helpers for conditional GET requests."""
+
+import hashlib
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from typing import Any, Optional
+
+
+def make_etag(*parts: Any) -> str:
+    """Build a weak ETag from the values a response depends on.
+
+    Args:
+        *parts: Values identifying the response content (version stamp, query parameters, ...)
+
+    Returns:
+        Weak ETag, e.g. W/"3f2a..."
+    """
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode()).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison).
+
+    Args:
+        if_none_match: Value of the If-None-Match request header
+        etag: Current ETag of the resource
+
+    Returns:
+        True if the client's copy is current and 304 can be returned
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def not_modified_since(if_modified_since: Optional[str], last_modified: datetime) -> bool:
+    """Check an If-Modified-Since header against a Last-Modified time.
+
+    Only consult it when the request has no If-None-Match.
+
+    Args:
+        if_modified_since: Value of the If-Modified-Since request header
+        last_modified: Timezone-aware, whole-second modification time of the resource
+
+    Returns:
+        True if the client's copy is current and 304 can be returned
+    """
+    if not if_modified_since:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        return False
+    return last_modified <= since
@@ -0,0 +1,77 @@
+"""In-process publish/subscribe of per-user change notifications."""
+
+import asyncio
+from collections import defaultdict
+from typing import Callable, Dict, List, Mapping, Set
+
+
+class EventHub:
+    """Fan out "your data changed" notifications to a user's open streams.
+
+    A notification carries the user's new data version (the delta sync
+    token). Subscribers only need the latest one, so each subscriber queue
+    holds a single token and a newer token replaces an unread older one:
+    a slow client never makes the hub buffer more than one value.
+
+    The hub lives in one process and must only be used from the event loop.
+    """
+
+    def __init__(self):
+        self._subscribers: Dict[int, Set[asyncio.Queue]] = defaultdict(set)
+        self._listeners: List[Callable[[int, int], None]] = []
+
+    def subscribe(self, user_id: int) -> asyncio.Queue:
+        """Register a new stream for a user.
+
+        Args:
+            user_id: User's ID
+
+        Returns:
+            Queue receiving the user's data versions
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        self._subscribers[user_id].add(queue)
+        return queue
+
+    def unsubscribe(self, user_id: int, queue: asyncio.Queue) -> None:
+        """Remove a stream registered with subscribe."""
+        queues = self._subscribers.get(user_id)
+        if queues is None:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._subscribers[user_id]
+
+    def add_listener(self, listener: Callable[[int, int], None]) -> None:
+        """Call `listener(user_id, data_version)` on every publish, e.g. to drop cached renderings.
+
+        Args:
+            listener: Non-blocking callback
+        """
+        self._listeners.append(listener)
+
+    def publish(self, user_id: int, data_version: int) -> None:
+        """Notify a user's streams of a new data version. Never blocks.
+
+        Args:
+            user_id: User's ID
+            data_version: User's data version after the change
+        """
+        for queue in self._subscribers.get(user_id, ()):
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(data_version)
+        for listener in self._listeners:
+            listener(user_id, data_version)
+
+    def publish_many(self, versions: Mapping[int, int]) -> None:
+        """Publish the new data version of several users.
+
+        Args:
+            versions: Map of user ID to data version
+        """
+        for user_id, data_version in versions.items():
+            self.publish(user_id, data_version)
+
+
+event_hub = EventHub()
@@ -0,0 +1,287 @@
+"""Streaming CSV / iCalendar import of tracking items."""
+
+import codecs
+import csv
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from pydantic import ValidationError
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.crud import category as category_crud, tracking_item as tracking_item_crud
+from app.internalModels import ImportResult
+from app.schemas import ItemImportRow, TrackingItemCreate
+from app.services.settings import settings
+
+# Accepted CSV header names for each import field (category_name matches the CSV export)
+CSV_COLUMNS = {
+    "title": ("title",),
+    "category": ("category", "category_name"),
+    "reminder_date": ("reminder_date", "date"),
+    "description": ("description",),
+    "is_done": ("is_done", "done"),
+}
+
+# Longest CSV record accepted, in characters; an unbalanced quote would otherwise
+# make the rest of the upload a single record held in memory
+CSV_MAX_RECORD_LENGTH = 64 * 1024
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Decode a UTF-8 byte stream into lines, without line terminators.
+
+    Args:
+        chunks: Byte chunks as they arrive (e.g. Request.stream())
+
+    Returns:
+        Async iterator of lines
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.rstrip("\r")
+
+
+async def iter_csv_rows(lines: AsyncIterator[str]) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+    """Parse CSV with a header row into import fields.
+
+    Quoted values may span lines, up to CSV_MAX_RECORD_LENGTH characters
+    per record. Blank lines are skipped and unknown columns (e.g. id or
+    created_at from an export) are ignored.
+
+    Args:
+        lines: Lines of the file
+
+    Returns:
+        Async iterator of (line number where the record starts, fields)
+
+    Raises:
+        ValueError: If the header lacks a required column, or a record is
+            longer than CSV_MAX_RECORD_LENGTH (e.g. an unclosed quote)
+    """
+    columns: Optional[Dict[str, int]] = None
+    record: List[str] = []
+    record_length = 0
+    quotes = 0
+    start = 0
+    line_number = 0
+    async for line in lines:
+        line_number += 1
+        if not record:
+            start = line_number
+        record.append(line)
+        record_length += len(line) + 1
+        if record_length > CSV_MAX_RECORD_LENGTH:
+            raise ValueError(f"CSV record starting on line {start} is too long (unclosed quote?)")
+        quotes += line.count('"')
+        if quotes % 2:
+            # Inside a quoted value that continues on the next line
+            continue
+
+        values = next(csv.reader(["\n".join(record)]), [])
+        record, record_length, quotes = [], 0, 0
+        if not any(value.strip() for value in values):
+            continue
+
+        if columns is None:
+            header = [name.strip().lower() for name in values]
+            columns = {
+                field: header.index(next(name for name in names if name in header))
+                for field, names in CSV_COLUMNS.items()
+                if any(name in header for name in names)
+            }
+            missing = [field for field in ("title", "category", "reminder_date") if field not in columns]
+            if missing:
+                raise ValueError(f"CSV header is missing column(s): {', '.join(missing)}")
+            continue
+
+        fields = {field: values[index] if index < len(values) else None for field, index in columns.items()}
+        fields["description"] = fields.get("description") or None
+        if not (fields.get("is_done") or "").strip():
+            # Missing or empty: the item is pending
+            fields.pop("is_done", None)
+        yield start, fields
+
+
+def _split_property(line: str) -> Tuple[str, str]:
+    """Split an iCalendar content line into (upper-case name, value), skipping parameters."""
+    quoted = False
+    for index, char in enumerate(line):
+        if char == '"':
+            quoted = not quoted
+        elif char == ":" and not quoted:
+            return line[:index].split(";", 1)[0].upper(), line[index + 1:]
+    return line.upper(), ""
+
+
+def _unescape(value: str) -> str:
+    """Undo iCalendar TEXT escaping."""
+    result = []
+    escaped = False
+    for char in value:
+        if escaped:
+            result.append("\n" if char in "nN" else char)
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        else:
+            result.append(char)
+    return "".join(result)
+
+
+def _first_category(value: str) -> str:
+    """First entry of a CATEGORIES value (a comma-separated list)."""
+    index = 0
+    while True:
+        index = value.find(",", index)
+        if index == -1 or value[index - 1] != "\\":
+            return _unescape(value if index == -1 else value[:index])
+        index += 1
+
+
+def _ics_date(value: str) -> str:
+    """ISO date of a DATE or DATE-TIME value (e.g. 20261018 or 20261018T090000Z)."""
+    digits = value.strip()[:8]
+    if len(digits) == 8 and digits.isdigit():
+        return f"{digits[:4]}-{digits[4:6]}-{digits[6:]}"
+    return value
+
+
+async def _unfold(lines: AsyncIterator[str]) -> AsyncIterator[Tuple[int, str]]:
+    """Join folded iCalendar lines (continuations start with a space or tab)."""
+    current: Optional[str] = None
+    start = 0
+    line_number = 0
+    async for line in lines:
+        line_number += 1
+        if line[:1] in (" ", "\t") and current is not None:
+            current += line[1:]
+            continue
+        if current:
+            yield start, current
+        current, start = line, line_number
+    if current:
+        yield start, current
+
+
+async def iter_ics_rows(lines: AsyncIterator[str]) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+    """Parse the VEVENTs of an iCalendar file into import fields.
+
+    SUMMARY becomes the title, DTSTART the reminder date, DESCRIPTION the
+    description and the first CATEGORIES entry the category. Components
+    nested in an event (e.g. VALARM) are ignored.
+
+    Args:
+        lines: Lines of the file
+
+    Returns:
+        Async iterator of (line number of BEGIN:VEVENT, fields)
+    """
+    event: Optional[Dict[str, Any]] = None
+    nested = 0
+    start = 0
+    async for line_number, line in _unfold(lines):
+        name, value = _split_property(line)
+        if event is None:
+            if name == "BEGIN" and value.strip().upper() == "VEVENT":
+                event, nested, start = {}, 0, line_number
+            continue
+
+        if name == "BEGIN":
+            nested += 1
+        elif name == "END" and nested:
+            nested -= 1
+        elif name == "END":
+            yield start, event
+            event = None
+        elif nested:
+            continue
+        elif name == "SUMMARY":
+            event["title"] = _unescape(value)
+        elif name == "DESCRIPTION":
+            event["description"] = _unescape(value) or None
+        elif name == "CATEGORIES" and "category" not in event:
+            event["category"] = _first_category(value)
+        elif name == "DTSTART":
+            event["reminder_date"] = _ics_date(value)
+
+
+def _describe(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in detail['loc'])}: {detail['msg']}" if detail["loc"] else detail["msg"]
+        for detail in error.errors()
+    )
+
+
+async def _import_chunk(
+    session: AsyncSession,
+    user_id: int,
+    rows: List[Tuple[int, Dict[str, Any]]],
+    default_category: Optional[str],
+    result: ImportResult
+) -> None:
+    valid: List[ItemImportRow] = []
+    for line, fields in rows:
+        if not fields.get("category") and default_category:
+            fields["category"] = default_category
+        try:
+            valid.append(ItemImportRow.model_validate(fields))
+        except ValidationError as e:
+            result.errors.append((line, _describe(e)))
+    if not valid:
+        return
+
+    category_ids, created = await category_crud.resolve_category_names(session, user_id, {row.category for row in valid})
+    result.created_categories.extend(created)
+    items = [
+        TrackingItemCreate.model_construct(
+            title=row.title,
+            category_id=category_ids[row.category.lower()],
+            reminder_date=row.reminder_date,
+            description=row.description
+        )
+        for row in valid
+    ]
+    result.imported += await tracking_item_crud.insert_items(session, user_id, items, [row.is_done for row in valid])
+
+
+async def import_items(
+    session: AsyncSession,
+    user_id: int,
+    rows: AsyncIterator[Tuple[int, Dict[str, Any]]],
+    default_category: Optional[str] = None,
+    chunk_size: int = settings.IMPORT_CHUNK_SIZE
+) -> ImportResult:
+    """Import parsed rows as new items of a user, chunk by chunk.
+
+    Each chunk is validated with the TrackingItemCreate rules, its distinct
+    category names are resolved (missing categories are created once), and
+    its valid rows are inserted with one bulk INSERT and committed. Invalid
+    rows are reported and skipped; they never fail the import.
+
+    Args:
+        session: Database session
+        user_id: User's ID
+        rows: (line number, fields) pairs from iter_csv_rows or iter_ics_rows
+        default_category: Category name for rows without one
+        chunk_size: Rows validated and inserted per transaction
+
+    Returns:
+        ImportResult of the import
+
+    Raises:
+        ValueError: If the file cannot be parsed at all (e.g. bad CSV header)
+    """
+    result = ImportResult()
+    chunk: List[Tuple[int, Dict[str, Any]]] = []
+    async for row in rows:
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            await _import_chunk(session, user_id, chunk, default_category, result)
+            chunk = []
+    if chunk:
+        await _import_chunk(session, user_id, chunk, default_category, result)
+    return result
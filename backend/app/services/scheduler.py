@@ -1,28 +1,55 @@
 import logging
+import os
+import socket
+import uuid
 from datetime import date, timedelta, datetime
+from functools import wraps
+from typing import Awaitable, Callable, List, Set
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
-from sqlmodel import Session, select
-from app.services.database import engine
+from apscheduler.triggers.interval import IntervalTrigger
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import select, update, or_
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.services.database import session_factory
 from app.models import SchedulerRun
-from app.crud import tracking_item as tracking_item_crud, otp as otp_crud
+from app.crud import (
+    tracking_item as tracking_item_crud,
+    tracking_item_archive as archive_crud,
+    tracking_item_tombstone as tombstone_crud,
+    otp as otp_crud,
+    notification_outbox as outbox_crud,
+    user_item_stats as stats_crud
+)
+from app.internalModels import DueReminder, Message
 from app.notifications import get_notification_service
+from app.notifications.dispatcher import dispatch_messages
+from app.notifications.messages import message_for_single_reminder, message_for_batch_reminder
 from app.services.settings import settings
 
 
 logger = logging.getLogger(__name__)
 scheduler = AsyncIOScheduler(timezone=settings.SCHEDULER_TIMEZONE)
 
+# Identifies this process as a job lease holder
+INSTANCE_ID = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
 
-def get_last_run_time(session: Session, job_name: str) -> datetime | None:
+# Jobs currently running in this process (a lease outliving JOB_LEASE_SECONDS must not start a second run)
+_running_jobs: Set[str] = set()
+
+# Due items claimed and queued per outbox transaction by the reminder job
+OUTBOX_ENQUEUE_MAX_ITEMS = 500
+
+
+async def get_last_run_time(session: AsyncSession, job_name: str) -> datetime | None:
     statement = select(SchedulerRun).where(SchedulerRun.job_name == job_name)
-    scheduler_run = session.exec(statement).first()
+    scheduler_run = (await session.exec(statement)).first()
     return scheduler_run.last_run_at if scheduler_run else None
 
 
-def save_last_run_time(session: Session, job_name: str, run_time: datetime):
+async def save_last_run_time(session: AsyncSession, job_name: str, run_time: datetime):
     statement = select(SchedulerRun).where(SchedulerRun.job_name == job_name)
-    scheduler_run = session.exec(statement).first()
+    scheduler_run = (await session.exec(statement)).first()
 
     if scheduler_run:
         # Update existing record
@@ -36,10 +63,86 @@ def save_last_run_time(session: Session, job_name: str, run_time: datetime):
         )
         session.add(scheduler_run)
 
-    session.commit()
+    await session.commit()
+
+
+async def acquire_job_lease(session: AsyncSession, job_name: str, ttl: timedelta) -> bool:
+    """Try to take the lease that lets this instance run a job.
+
+    The lease lives on the job's SchedulerRun row and is taken with a
+    conditional UPDATE, so only one run of a job happens at a time, across
+    replicas and within this one. An expired lease (crashed holder) can be
+    taken over.
+
+    Returns:
+        True if this instance now holds the lease
+    """
+    now = datetime.now()
+    statement = update(SchedulerRun).where(
+        SchedulerRun.job_name == job_name,
+        or_(
+            SchedulerRun.lease_expires_at == None, # type: ignore
+            SchedulerRun.lease_expires_at < now # type: ignore
+        )
+    ).values(lease_owner=INSTANCE_ID, lease_expires_at=now + ttl)
+    result = await session.exec(statement) # type: ignore
+    await session.commit()
+    if result.rowcount:
+        return True
+
+    # First run of this job anywhere: create its row already holding the lease
+    existing = await session.exec(select(SchedulerRun.id).where(SchedulerRun.job_name == job_name))
+    if existing.first() is None:
+        session.add(SchedulerRun(job_name=job_name, lease_owner=INSTANCE_ID, lease_expires_at=now + ttl))
+        try:
+            await session.commit()
+            return True
+        except IntegrityError:
+            # Another replica created it first
+            await session.rollback()
+    return False
+
+
+async def release_job_lease(session: AsyncSession, job_name: str) -> None:
+    statement = update(SchedulerRun).where(
+        SchedulerRun.job_name == job_name,
+        SchedulerRun.lease_owner == INSTANCE_ID
+    ).values(lease_owner=None, lease_expires_at=None)
+    await session.exec(statement) # type: ignore
+    await session.commit()
+
 
+def single_instance_job(job_name: str):
+    """Run the decorated job only on the instance that holds its lease.
 
-def should_run_on_startup(session: Session, job_name: str, next_run_hour: int) -> bool:
+    Every replica schedules every job; the ones that lose the lease skip the run.
+    A run that starts while the job is still running in this process (e.g. a
+    startup run overlapping a scheduled one) is skipped too.
+    """
+    def decorator(job: Callable[[], Awaitable[None]]):
+        @wraps(job)
+        async def wrapper() -> None:
+            if job_name in _running_jobs:
+                logger.info(f"Skipping {job_name}: already running in this instance")
+                return
+            _running_jobs.add(job_name)
+            try:
+                async with session_factory() as session:
+                    if not await acquire_job_lease(session, job_name, timedelta(seconds=settings.JOB_LEASE_SECONDS)):
+                        logger.info(f"Skipping {job_name}: another instance is running it")
+                        return
+                try:
+                    await job()
+                finally:
+                    async with session_factory() as session:
+                        await release_job_lease(session, job_name)
+            finally:
+                _running_jobs.discard(job_name)
+        return wrapper
+    return decorator
+
+
+async def should_run_on_startup(session: AsyncSession, job_name: str, next_run_hour: int) -> bool:
     """Check if a job should run on startup.
 
     Returns True if:
@@ -47,7 +150,7 @@ def should_run_on_startup(session: Session, job_name: str, next_run_hour: int) -
     - Last run was before today's scheduled time, AND
     - Next scheduled run is more than 1-2 hours away
     """
-    last_run = get_last_run_time(session, job_name)
+    last_run = await get_last_run_time(session, job_name)
 
     # If job has never run, run it
     if last_run is None:
@@ -76,74 +179,144 @@ def should_run_on_startup(session: Session, job_name: str, next_run_hour: int) -
         return False
 
 
+def _reminder_message(reminders: List[DueReminder]) -> Message:
+    """Notification for a user's reminders due today."""
+    if len(reminders) == 1:
+        return message_for_single_reminder(reminders[0].email, reminders[0])
+    return message_for_batch_reminder(reminders[0].email, reminders) # type: ignore
+
+
+@single_instance_job('check_reminders')
 async def check_reminders_and_send_notifications() -> None:
     """Daily job to check reminders and send notifications.
     """
     logger.info(f"Running reminder check at {datetime.now()}")
 
-    with Session(engine) as session:
-        items_due_today = tracking_item_crud.get_items_due_today(session)
-
-        if not items_due_today:
+    async with session_factory() as session:
+        item_count = 0
+        queued_count = 0
+        groups: List[List[DueReminder]] = []
+        pending_items = 0
+
+        # One notification per user for all of their items due today. Due items
+        # are streamed in bounded chunks and queued as they come in, so memory
+        # and transaction size do not grow with the number of due items.
+        async for user_reminders in tracking_item_crud.iter_due_reminders_by_user(session, OUTBOX_ENQUEUE_MAX_ITEMS):
+            item_count += len(user_reminders)
+            if groups and pending_items + len(user_reminders) > OUTBOX_ENQUEUE_MAX_ITEMS:
+                # Only enqueue here; the outbox worker delivers and retries
+                queued_count += await outbox_crud.enqueue_reminders(session, groups, _reminder_message)
+                groups, pending_items = [], 0
+            groups.append(user_reminders)
+            pending_items += len(user_reminders)
+        queued_count += await outbox_crud.enqueue_reminders(session, groups, _reminder_message)
+
+        if not item_count:
             logger.info("No reminders due today")
-            save_last_run_time(session, 'check_reminders', datetime.now())
-            return
-        logger.info(f"Found {len(items_due_today)} item(s) due today")
-
-        # Send notifications
-        #! restructure it to send batch notification
-        notification_service = get_notification_service(settings.NOTIFICATION_MODE) # type: ignore
-        # notification_service.send_batch_reminders()
-        for item in items_due_today:
-            user_email = item.user.email if item.user else None
-            if not user_email:
-                continue
-            try:
-                logger.debug(f"Sending reminder to {user_email} for {item.title}")
-                notification_service.send_reminder(user_email, item)
-                tracking_item_crud.mark_item_done(session, item.id) # type: ignore
-                logger.debug("Reminder sent")
-            except Exception as e:
-                logger.error(f"Failed for {e}")
+        else:
+            logger.info(f"Reminder job completed: {item_count} reminder(s) due, {queued_count} notification(s) queued")
+        await save_last_run_time(session, 'check_reminders', datetime.now())
 
-        logger.info(f"Reminder job completed: {len(items_due_today)} reminders processed")
-        save_last_run_time(session, 'check_reminders', datetime.now())
 
+async def deliver_outbox_notifications() -> None:
+    """Frequent job that drains the notification outbox.
 
+    Messages are claimed in batches and sent concurrently. Failed sends are
+    retried with exponential backoff until OUTBOX_MAX_ATTEMPTS is reached.
+    """
+    notification_service = get_notification_service(settings.NOTIFICATION_MODE) # type: ignore
+    sent_count = 0
+    failed_count = 0
+
+    async with session_factory() as session:
+        while True:
+            claimed = await outbox_crud.claim_due_messages(session, settings.OUTBOX_BATCH_SIZE, settings.OUTBOX_MAX_ATTEMPTS)
+            if not claimed:
+                break
+
+            results = await dispatch_messages(
+                notification_service,
+                [(row, Message(row.title, row.to_email, row.subject, row.content)) for row in claimed],
+                settings.NOTIFICATION_CONCURRENCY
+            )
+
+            sent_count += await outbox_crud.mark_sent(session, [result.key.id for result in results if result.sent])
+            for result in results:
+                if result.sent:
+                    continue
+                failed_count += 1
+                new_status = await outbox_crud.record_failure(
+                    session, result.key, result.error, settings.OUTBOX_MAX_ATTEMPTS, settings.OUTBOX_RETRY_BASE_SECONDS
+                )
+                if new_status == outbox_crud.STATUS_FAILED:
+                    logger.error(f"Giving up on notification {result.key.id} to {result.message.to_email}: {result.error}")
+
+    if sent_count or failed_count:
+        logger.info(f"Outbox delivery completed: {sent_count} sent, {failed_count} failed attempt(s)")
+
+
+@single_instance_job('cleanup_old_records')
 async def cleanup_old_records():
     """Daily job to cleanup old tracking items (older than 180 days).
+
+    Depending on RETENTION_MODE, done items are moved to the archive or all
+    old items are deleted.
     """
     logger.info(f"Running old records cleanup at {datetime.now()}")
 
-    with Session(engine) as session:
+    async with session_factory() as session:
         cutoff_date = date.today() - timedelta(days=180)
-        deleted_count = tracking_item_crud.delete_old_records(session, cutoff_date)
+        if settings.RETENTION_MODE.lower() == "delete":
+            result = await tracking_item_crud.delete_old_records(session, cutoff_date)
+        else:
+            result = await archive_crud.archive_done_items(session, cutoff_date)
+
+        logger.info(f"Cleanup job completed (older than {cutoff_date}, {settings.RETENTION_MODE} mode): {result}")
+
+        result = await outbox_crud.purge_sent_messages(session, datetime.now() - timedelta(days=7))
+        logger.info(f"Outbox cleanup completed: {result}")
+
+        result = await tombstone_crud.purge_tombstones(session, datetime.now() - timedelta(days=settings.TOMBSTONE_RETENTION_DAYS))
+        logger.info(f"Tombstone cleanup completed: {result}")
+        await save_last_run_time(session, 'cleanup_old_records', datetime.now())
+
+
+@single_instance_job('reconcile_item_stats')
+async def reconcile_item_stats():
+    """Daily job rebuilding the per-user item counters from tracking_item.
 
-        logger.info(f"Cleanup job completed: {deleted_count} old record(s) deleted (older than {cutoff_date})")
-        save_last_run_time(session, 'cleanup_old_records', datetime.now())
+    The counters are maintained by every item write; this repairs any drift.
+    """
+    logger.info(f"Running item stats reconciliation at {datetime.now()}")
+
+    async with session_factory() as session:
+        result = await stats_crud.reconcile_item_stats(session)
+        logger.info(f"Item stats reconciliation completed: {result} users")
+        await save_last_run_time(session, 'reconcile_item_stats', datetime.now())
 
 
+@single_instance_job('cleanup_expired_otps')
 async def cleanup_expired_otps():
     logger.info(f"Running OTP cleanup at {datetime.now()}")
 
-    with Session(engine) as session:
-        deleted_count = otp_crud.cleanup_expired_otps(session)
-        logger.info(f"OTP cleanup completed: {deleted_count} expired OTP(s) deleted")
-        save_last_run_time(session, 'cleanup_expired_otps', datetime.now())
+    async with session_factory() as session:
+        result = await otp_crud.cleanup_expired_otps(session)
+        logger.info(f"OTP cleanup completed: {result}")
+        await save_last_run_time(session, 'cleanup_expired_otps', datetime.now())
 
 
 async def run_startup_jobs():
     """Run jobs on startup if they haven't run recently."""
     logger.info("Checking if any jobs need to run on startup...")
 
-    with Session(engine) as session:
-        if should_run_on_startup(session, 'check_reminders', 8):
+    async with session_factory() as session:
+        if await should_run_on_startup(session, 'check_reminders', 8):
             logger.info("[STARTUP] Running check_reminders job (missed or not run recently)")
             await check_reminders_and_send_notifications()
         else:
             logger.info("[STARTUP] check_reminders job: Up to date, skipping")
 
-        if should_run_on_startup(session, 'cleanup_old_records', 2):
+        if await should_run_on_startup(session, 'cleanup_old_records', 2):
             logger.info("[STARTUP] Running cleanup_old_records job (missed or not run recently)")
             await cleanup_old_records()
         else:
@@ -175,6 +348,24 @@ def start_scheduler():
         replace_existing=True
     )
 
+    # Rebuild item counters at 3 AM SCHEDULER_TIMEZONE (daily), after the cleanup
+    scheduler.add_job(
+        reconcile_item_stats,
+        trigger=CronTrigger(hour=3, minute=0, timezone=settings.SCHEDULER_TIMEZONE),
+        id='reconcile_item_stats',
+        name='Reconcile item stats at 3 AM SCHEDULER_TIMEZONE',
+        replace_existing=True
+    )
+
+    # Deliver queued notifications (every OUTBOX_POLL_SECONDS)
+    scheduler.add_job(
+        deliver_outbox_notifications,
+        trigger=IntervalTrigger(seconds=settings.OUTBOX_POLL_SECONDS, timezone=settings.SCHEDULER_TIMEZONE),
+        id='deliver_outbox_notifications',
+        name='Deliver queued notifications',
+        replace_existing=True
+    )
+
     # Cleanup expired OTPs (every hour)
     scheduler.add_job(
         cleanup_expired_otps,
@@ -11,17 +11,42 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: Optional[str] = None
     JWT_SECRET_KEY: Optional[str] = None
     ACCESS_TOKEN_EXPIRE_MINUTES: Optional[int] = None
+    AUTH_CACHE_TTL_SECONDS: int = 60
+    AUTH_CACHE_MAX_SIZE: int = 10000
+    CATEGORY_CACHE_TTL_SECONDS: int = 300
+    CATEGORY_CACHE_MAX_USERS: int = 10000
     OTP_VALIDITY_MINUTES: Optional[int] = None
     OTP_LENGTH: Optional[int] = None
     DATABASE_URL: Optional[str] = None
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
     CORS_ORIGINS: Optional[List[str]] = None
     NOTIFICATION_MODE: Optional[str] = None
+    NOTIFICATION_CONCURRENCY: int = 8
+    OUTBOX_BATCH_SIZE: int = 100
+    OUTBOX_POLL_SECONDS: int = 30
+    OUTBOX_MAX_ATTEMPTS: int = 5
+    OUTBOX_RETRY_BASE_SECONDS: int = 60
     SMTP_HOST: Optional[str] = None
     SMTP_PORT: Optional[int] = None
     SMTP_USER: Optional[str] = None
     SMTP_PASSWORD: Optional[str] = None
     SMTP_FROM: Optional[str] = None
+    SMTP_POOL_SIZE: int = 4
+    SMTP_MAX_MESSAGES_PER_CONNECTION: int = 100
+    SMTP_TIMEOUT: int = 30
     SCHEDULER_TIMEZONE: Optional[str] = None
+    JOB_LEASE_SECONDS: int = 1800
+    CLEANUP_BATCH_SIZE: int = 1000
+    CLEANUP_TIME_BUDGET_SECONDS: float = 300
+    RETENTION_MODE: str = "archive"
+    TOMBSTONE_RETENTION_DAYS: int = 30
+    SSE_HEARTBEAT_SECONDS: int = 25
+    ITEM_BATCH_MAX_OPERATIONS: int = 500
+    IMPORT_CHUNK_SIZE: int = 1000
+    IMPORT_MAX_UPLOAD_BYTES: int = 10 * 1024 * 1024
+    CALENDAR_FEED_CACHE_TTL_SECONDS: int = 300
+    CALENDAR_FEED_CACHE_MAX_USERS: int = 10000
     LOGGER_TOKEN: Optional[str] = None
     LOGGER_HOST: Optional[str] = None
 
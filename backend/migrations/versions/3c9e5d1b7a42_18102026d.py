@@ -0,0 +1,42 @@
+"""18102026d
+
+Archive table for finished tracking items moved out by the retention job.
+
+Revision ID: 3c9e5d1b7a42
+Revises: f514ac7aa018
+Create Date: 2026-10-18 17:48:52.913027
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c9e5d1b7a42'
+down_revision: Union[str, Sequence[str], None] = 'f514ac7aa018'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('tracking_item_archive',
+        sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('title', sqlmodel.sql.sqltypes.AutoString(length=255), nullable=False),
+        sa.Column('category_name', sqlmodel.sql.sqltypes.AutoString(length=100), nullable=False),
+        sa.Column('reminder_date', sa.Date(), nullable=False),
+        sa.Column('description', sqlmodel.sql.sqltypes.AutoString(length=1000), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('archived_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_tracking_item_archive_user_id', 'tracking_item_archive', ['user_id', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tracking_item_archive_user_id', table_name='tracking_item_archive')
+    op.drop_table('tracking_item_archive')
@@ -0,0 +1,93 @@
+"""18102026h
+
+Item search: full-text index on tracking_item title and description, and
+an index for searches ordered by reminder date without an is_done filter.
+
+SQLite gets an external-content FTS5 table kept in sync by triggers,
+PostgreSQL a generated tsvector column with a GIN index. Both are
+maintained by the database on every write, set-based ones included, and
+are excluded from autogenerate in env.py.
+
+Note: a later batch_alter_table on tracking_item recreates the table on
+SQLite, which drops the triggers; such a migration must recreate them.
+
+Revision ID: 5d8f2c6a9e13
+Revises: c71e4a9d3b26
+Create Date: 2026-10-18 21:03:17.226431
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d8f2c6a9e13'
+down_revision: Union[str, Sequence[str], None] = 'c71e4a9d3b26'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SQLITE_UPGRADE = [
+    """
+    CREATE VIRTUAL TABLE tracking_item_fts USING fts5(
+        title, description, content='tracking_item', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER tracking_item_fts_insert AFTER INSERT ON tracking_item BEGIN
+        INSERT INTO tracking_item_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER tracking_item_fts_delete AFTER DELETE ON tracking_item BEGIN
+        INSERT INTO tracking_item_fts(tracking_item_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER tracking_item_fts_update AFTER UPDATE OF title, description ON tracking_item BEGIN
+        INSERT INTO tracking_item_fts(tracking_item_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO tracking_item_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END
+    """,
+    "INSERT INTO tracking_item_fts(tracking_item_fts) VALUES ('rebuild')",
+]
+
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER tracking_item_fts_update",
+    "DROP TRIGGER tracking_item_fts_delete",
+    "DROP TRIGGER tracking_item_fts_insert",
+    "DROP TABLE tracking_item_fts",
+]
+
+POSTGRESQL_UPGRADE = [
+    """
+    ALTER TABLE tracking_item ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        to_tsvector('simple', title || ' ' || coalesce(description, ''))
+    ) STORED
+    """,
+    "CREATE INDEX ix_tracking_item_search_vector ON tracking_item USING gin (search_vector)",
+]
+
+POSTGRESQL_DOWNGRADE = [
+    "DROP INDEX ix_tracking_item_search_vector",
+    "ALTER TABLE tracking_item DROP COLUMN search_vector",
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_tracking_item_user_reminder', 'tracking_item', ['user_id', 'reminder_date', 'id'], unique=False)
+    statements = POSTGRESQL_UPGRADE if op.get_bind().dialect.name == "postgresql" else SQLITE_UPGRADE
+    for statement in statements:
+        op.execute(sa.text(statement))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    statements = POSTGRESQL_DOWNGRADE if op.get_bind().dialect.name == "postgresql" else SQLITE_DOWNGRADE
+    for statement in statements:
+        op.execute(sa.text(statement))
+    op.drop_index('ix_tracking_item_user_reminder', table_name='tracking_item')
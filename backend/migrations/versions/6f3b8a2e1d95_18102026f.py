@@ -0,0 +1,60 @@
+"""18102026f
+
+Delta sync: updated_at and sync_version on tracking_item, tombstones for
+removed items and a sync floor per user.
+
+Revision ID: 6f3b8a2e1d95
+Revises: a4d27f90c8e1
+Create Date: 2026-10-18 19:05:44.120386
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6f3b8a2e1d95'
+down_revision: Union[str, Sequence[str], None] = 'a4d27f90c8e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('tracking_item') as batch_op:
+        batch_op.add_column(sa.Column('updated_at', sa.DateTime(), nullable=True))
+        batch_op.add_column(sa.Column('sync_version', sa.Integer(), server_default='0', nullable=False))
+    op.execute("UPDATE tracking_item SET updated_at = created_at")
+    with op.batch_alter_table('tracking_item') as batch_op:
+        batch_op.alter_column('updated_at', existing_type=sa.DateTime(), nullable=False)
+        batch_op.create_index('ix_tracking_item_user_sync_version', ['user_id', 'sync_version'], unique=False)
+
+    with op.batch_alter_table('user') as batch_op:
+        batch_op.add_column(sa.Column('sync_floor', sa.Integer(), server_default='0', nullable=False))
+
+    op.create_table('tracking_item_tombstone',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('item_id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('sync_version', sa.Integer(), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_tracking_item_tombstone_user_sync_version', 'tracking_item_tombstone', ['user_id', 'sync_version'], unique=False)
+    op.create_index(op.f('ix_tracking_item_tombstone_deleted_at'), 'tracking_item_tombstone', ['deleted_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_tracking_item_tombstone_deleted_at'), table_name='tracking_item_tombstone')
+    op.drop_index('ix_tracking_item_tombstone_user_sync_version', table_name='tracking_item_tombstone')
+    op.drop_table('tracking_item_tombstone')
+
+    with op.batch_alter_table('user') as batch_op:
+        batch_op.drop_column('sync_floor')
+
+    with op.batch_alter_table('tracking_item') as batch_op:
+        batch_op.drop_index('ix_tracking_item_user_sync_version')
+        batch_op.drop_column('sync_version')
+        batch_op.drop_column('updated_at')
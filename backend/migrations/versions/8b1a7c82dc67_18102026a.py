@@ -0,0 +1,48 @@
+"""18102026a
+
+Composite indexes for the item list queries, a partial index for pending
+reminders and removal of low-selectivity boolean indexes.
+
+Revision ID: 8b1a7c82dc67
+Revises: e89f8fec77de
+Create Date: 2026-10-18 10:12:41.208314
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b1a7c82dc67'
+down_revision: Union[str, Sequence[str], None] = 'e89f8fec77de'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_tracking_item_user_done_reminder', 'tracking_item', ['user_id', 'is_done', 'reminder_date', 'id'], unique=False)
+    op.create_index('ix_tracking_item_user_done_created', 'tracking_item', ['user_id', 'is_done', 'created_at', 'id'], unique=False)
+    # Partial index on SQLite and PostgreSQL, plain index elsewhere
+    op.create_index(
+        'ix_tracking_item_pending_reminder', 'tracking_item', ['reminder_date'], unique=False,
+        sqlite_where=sa.text('is_done = 0'),
+        postgresql_where=sa.text('NOT is_done')
+    )
+
+    # Covered by the composite indexes above / too unselective to help reads
+    op.drop_index(op.f('ix_tracking_item_user_id'), table_name='tracking_item')
+    op.drop_index(op.f('ix_tracking_item_is_done'), table_name='tracking_item')
+    op.drop_index(op.f('ix_otp_is_used'), table_name='otp')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_otp_is_used'), 'otp', ['is_used'], unique=False)
+    op.create_index(op.f('ix_tracking_item_is_done'), 'tracking_item', ['is_done'], unique=False)
+    op.create_index(op.f('ix_tracking_item_user_id'), 'tracking_item', ['user_id'], unique=False)
+
+    op.drop_index('ix_tracking_item_pending_reminder', table_name='tracking_item')
+    op.drop_index('ix_tracking_item_user_done_created', table_name='tracking_item')
+    op.drop_index('ix_tracking_item_user_done_reminder', table_name='tracking_item')
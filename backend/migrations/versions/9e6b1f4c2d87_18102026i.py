@@ -0,0 +1,53 @@
+"""18102026i
+
+Per-user item counters: user_item_stats, backfilled from tracking_item.
+
+Revision ID: 9e6b1f4c2d87
+Revises: 5d8f2c6a9e13
+Create Date: 2026-10-18 22:14:52.603187
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e6b1f4c2d87'
+down_revision: Union[str, Sequence[str], None] = '5d8f2c6a9e13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Reminder month (YYYY-MM); SQLite stores dates as ISO text
+MONTH_EXPRESSIONS = {
+    "postgresql": "to_char(reminder_date, 'YYYY-MM')",
+    "sqlite": "substr(reminder_date, 1, 7)",
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('user_item_stats',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('category_id', sa.Integer(), nullable=False),
+        sa.Column('month', sqlmodel.sql.sqltypes.AutoString(length=7), nullable=False),
+        sa.Column('is_done', sa.Boolean(), nullable=False),
+        sa.Column('item_count', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('user_id', 'category_id', 'month', 'is_done')
+    )
+    month = MONTH_EXPRESSIONS.get(op.get_bind().dialect.name, MONTH_EXPRESSIONS["sqlite"])
+    op.execute(sa.text(
+        f"""
+        INSERT INTO user_item_stats (user_id, category_id, month, is_done, item_count)
+        SELECT user_id, category_id, {month}, is_done, count(*)
+        FROM tracking_item
+        GROUP BY user_id, category_id, {month}, is_done
+        """
+    ))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('user_item_stats')
@@ -0,0 +1,31 @@
+"""18102026e
+
+Per-user data version stamp used to build ETags for the list endpoints.
+
+Revision ID: a4d27f90c8e1
+Revises: 3c9e5d1b7a42
+Create Date: 2026-10-18 18:21:07.582614
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4d27f90c8e1'
+down_revision: Union[str, Sequence[str], None] = '3c9e5d1b7a42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('user') as batch_op:
+        batch_op.add_column(sa.Column('data_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('user') as batch_op:
+        batch_op.drop_column('data_version')
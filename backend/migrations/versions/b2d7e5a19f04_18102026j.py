@@ -0,0 +1,78 @@
+"""18102026j
+
+Archive: own autoincrement primary key, the original tracking item id
+moves to item_id. SQLite reuses the rowid of a deleted newest item, so
+the item id alone is not unique over time.
+
+The table is rebuilt and rows are copied in id order; existing entries
+get new ids (PostgreSQL keeps its sequence consistent that way).
+
+Revision ID: b2d7e5a19f04
+Revises: 9e6b1f4c2d87
+Create Date: 2026-10-18 23:02:41.871350
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2d7e5a19f04'
+down_revision: Union[str, Sequence[str], None] = '9e6b1f4c2d87'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+COPIED_COLUMNS = "user_id, title, category_name, reminder_date, description, created_at, archived_at"
+
+
+def _archive_columns(id_column: sa.Column) -> list:
+    return [
+        id_column,
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('title', sqlmodel.sql.sqltypes.AutoString(length=255), nullable=False),
+        sa.Column('category_name', sqlmodel.sql.sqltypes.AutoString(length=100), nullable=False),
+        sa.Column('reminder_date', sa.Date(), nullable=False),
+        sa.Column('description', sqlmodel.sql.sqltypes.AutoString(length=1000), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('archived_at', sa.DateTime(), nullable=False),
+    ]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('tracking_item_archive_new',
+        *_archive_columns(sa.Column('id', sa.Integer(), nullable=False)),
+        sa.Column('item_id', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.execute(
+        f"INSERT INTO tracking_item_archive_new (item_id, {COPIED_COLUMNS}) "
+        f"SELECT id, {COPIED_COLUMNS} FROM tracking_item_archive ORDER BY id"
+    )
+    op.drop_index('ix_tracking_item_archive_user_id', table_name='tracking_item_archive')
+    op.drop_table('tracking_item_archive')
+    op.rename_table('tracking_item_archive_new', 'tracking_item_archive')
+    op.create_index('ix_tracking_item_archive_user_id', 'tracking_item_archive', ['user_id', 'id'], unique=False)
+    op.create_index(op.f('ix_tracking_item_archive_item_id'), 'tracking_item_archive', ['item_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_table('tracking_item_archive_old',
+        *_archive_columns(sa.Column('id', sa.Integer(), autoincrement=False, nullable=False)),
+        sa.PrimaryKeyConstraint('id')
+    )
+    # Entries of reused item ids cannot coexist under the old key; the latest one is kept
+    op.execute(
+        f"INSERT INTO tracking_item_archive_old (id, {COPIED_COLUMNS}) "
+        f"SELECT item_id, {COPIED_COLUMNS} FROM tracking_item_archive "
+        f"WHERE id IN (SELECT max(id) FROM tracking_item_archive GROUP BY item_id)"
+    )
+    op.drop_index(op.f('ix_tracking_item_archive_item_id'), table_name='tracking_item_archive')
+    op.drop_index('ix_tracking_item_archive_user_id', table_name='tracking_item_archive')
+    op.drop_table('tracking_item_archive')
+    op.rename_table('tracking_item_archive_old', 'tracking_item_archive')
+    op.create_index('ix_tracking_item_archive_user_id', 'tracking_item_archive', ['user_id', 'id'], unique=False)
@@ -0,0 +1,34 @@
+"""18102026g
+
+Per-user secret for the iCalendar feed URL, stored hashed.
+
+Revision ID: c71e4a9d3b26
+Revises: 6f3b8a2e1d95
+Create Date: 2026-10-18 20:12:31.504918
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c71e4a9d3b26'
+down_revision: Union[str, Sequence[str], None] = '6f3b8a2e1d95'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('user') as batch_op:
+        batch_op.add_column(sa.Column('calendar_token_hash', sqlmodel.sql.sqltypes.AutoString(length=64), nullable=True))
+        batch_op.create_index('ix_user_calendar_token_hash', ['calendar_token_hash'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('user') as batch_op:
+        batch_op.drop_index('ix_user_calendar_token_hash')
+        batch_op.drop_column('calendar_token_hash')
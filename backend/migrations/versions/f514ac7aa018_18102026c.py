@@ -0,0 +1,39 @@
+"""18102026c
+
+Job leases on scheduler_run so that only one replica runs each scheduled job.
+
+Revision ID: f514ac7aa018
+Revises: 25324a24d55d
+Create Date: 2026-10-18 15:02:19.440317
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f514ac7aa018'
+down_revision: Union[str, Sequence[str], None] = '25324a24d55d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # batch mode recreates the table on SQLite, which cannot ALTER COLUMN
+    with op.batch_alter_table('scheduler_run') as batch_op:
+        batch_op.add_column(sa.Column('lease_owner', sqlmodel.sql.sqltypes.AutoString(length=255), nullable=True))
+        batch_op.add_column(sa.Column('lease_expires_at', sa.DateTime(), nullable=True))
+        # A row can now exist (holding a lease) before the job's first completed run
+        batch_op.alter_column('last_run_at', existing_type=sa.DateTime(), nullable=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DELETE FROM scheduler_run WHERE last_run_at IS NULL")
+    with op.batch_alter_table('scheduler_run') as batch_op:
+        batch_op.alter_column('last_run_at', existing_type=sa.DateTime(), nullable=False)
+        batch_op.drop_column('lease_expires_at')
+        batch_op.drop_column('lease_owner')
@@ -10,6 +10,7 @@ export interface TrackingItem {
   description: string | null;
   is_done: boolean;
   created_at: string;
+  updated_at?: string | null;
 }
 
 export interface TrackingItemCreate {
@@ -32,4 +33,12 @@ export interface PaginatedResponse<T> {
   page: number;
   pages: number;
   page_size: number;
+  next_cursor?: string | null;
+}
+
+export interface ItemChanges {
+  token: number;
+  reset: boolean;
+  items: TrackingItem[];
+  deleted: number[];
 }